@@ -15,7 +15,8 @@ def main() -> None:
         dividend_curve=FlatDividendCurve(0.01),
     )
 
-    mc_cfg = MCConfig(n_paths=100_000, seed=7)
+    # Antithetic pairs + terminal-spot control variate; Greeks reuse the same draws (CRN).
+    mc_cfg = MCConfig(n_paths=100_000, seed=7, antithetic=True, control_variate=True)
     analytic = price(option, model, market, method="analytic")
     mc = price(option, model, market, method="mc", cfg=mc_cfg)
 
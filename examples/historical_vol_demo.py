@@ -38,7 +38,12 @@ def main():
         print(f"   Failed to fetch data: {e}")
         print("   -> Creating synthetic data for demonstration purposes.")
         dates = pd.date_range(start, end, freq="B") # Business days
-        prices = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, size=len(dates))))
+        # Synthetic GBM path: one normal draw per step, log-increments summed in one pass.
+        rng = np.random.default_rng(42)
+        s0, mu, sigma_true, dt = 100.0, 0.05, 0.16, 1.0 / 252.0
+        z = rng.standard_normal(len(dates) - 1)
+        incr = (mu - 0.5 * sigma_true**2) * dt + sigma_true * np.sqrt(dt) * z
+        prices = s0 * np.exp(np.concatenate([[0.0], np.cumsum(incr)]))
         df = pd.DataFrame({"Close": prices}, index=dates)
     
     # 2. Compute Log Returns
@@ -1,4 +1,4 @@
-from qpl.engines.pde.pricers import PDEConfig
+from qpl.engines.pde.pricers import PDEConfig, greeks_european_multi, price_european_multi
 from qpl.instruments.options import EuropeanOption
 from qpl.market.curves import FlatDividendCurve, FlatRateCurve
 from qpl.market.market import Market
@@ -33,15 +33,17 @@ def main():
     print(f"{'Metric':<10} | {'Analytic':<15} | {'PDE':<15} | {'Diff':<15}")
     print("-" * 80)
 
-    for opt_name, opt in [("Call", call), ("Put", put)]:
+    # PDE: call and put share one grid, so price both in a single time march
+    # (and one march per spot bump for the Greeks).
+    options = [("Call", call), ("Put", put)]
+    pde_prices = price_european_multi([opt for _, opt in options], model, market, cfg=pde_cfg)
+    pde_greeks = greeks_european_multi([opt for _, opt in options], model, market, cfg=pde_cfg)
+
+    for (opt_name, opt), res_p_price, res_p_greeks in zip(options, pde_prices, pde_greeks):
         # Analytic
         res_a_price = price(opt, model, market, method="analytic")
         res_a_greeks = greeks(opt, model, market, method="analytic")
 
-        # PDE
-        res_p_price = price(opt, model, market, method="pde", cfg=pde_cfg)
-        res_p_greeks = greeks(opt, model, market, method="pde", cfg=pde_cfg)
-
         # Print Price
         print(f"{opt_name} Price | {res_a_price.value:15.6f} | {res_p_price.value:15.6f} | {res_p_price.value - res_a_price.value:15.6e}")
         
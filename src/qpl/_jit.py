@@ -0,0 +1,34 @@
+"""
+Optional Numba support.
+
+Numba is an optional extra (``pip install -e ".[fast]"``). Without it, ``njit``
+and ``vectorize`` are pass-through decorators so kernels still run as plain
+Python (a ``vectorize`` kernel then only takes scalars), and callers
+whose kernels loop in Python check ``HAVE_NUMBA`` to take a NumPy path instead.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit, prange, vectorize
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+    vectorize = njit
+
+
+__all__ = ["HAVE_NUMBA", "njit", "prange", "vectorize"]
@@ -1,3 +1,17 @@
-from .black_scholes import greeks_european, price_european
+from .black_scholes import (
+    bs_greeks_vec,
+    bs_price_greeks_vec,
+    bs_price_vec,
+    greeks_european,
+    price_chain,
+    price_european,
+)
 
-__all__ = ["greeks_european", "price_european"]
+__all__ = [
+    "bs_greeks_vec",
+    "bs_price_greeks_vec",
+    "bs_price_vec",
+    "greeks_european",
+    "price_chain",
+    "price_european",
+]
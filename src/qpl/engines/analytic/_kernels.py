@@ -0,0 +1,126 @@
+"""
+Scalar Black–Scholes kernels compiled with Numba when it is available.
+
+These are used from solver loops (e.g. implied volatility) that evaluate one
+contract many times, where per-call NumPy dispatch dominates the arithmetic.
+The solver kernels take the sigma-invariant terms (discounted forward and
+strike, log forward moneyness, sqrt(T)) precomputed once per contract, so each
+iteration only pays for the sigma-dependent part.
+"""
+
+from __future__ import annotations
+
+import math
+
+from ..._jit import njit
+from ...math.norm import norm_cdf_nb, norm_pdf_nb
+from ...models._kernels import _bs_fwd_price_nb
+
+
+@njit(cache=True, fastmath=True)
+def _bs_price_error_nb(
+    sigma: float,
+    fwd: float,
+    k_disc: float,
+    log_fm: float,
+    sqrtT: float,
+    is_call: bool,
+    target: float,
+) -> float:
+    """Root-finding objective: model price at sigma minus the target price."""
+    return _bs_fwd_price_nb(fwd, k_disc, log_fm, sigma * sqrtT, is_call) - target
+
+
+@njit(cache=True, fastmath=True)
+def _bs_price_vega_vomma_nb(
+    fwd: float,
+    k_disc: float,
+    log_fm: float,
+    sqrtT: float,
+    sigma: float,
+    is_call: bool,
+) -> tuple[float, float, float]:
+    """Price, vega and vomma sharing one d1/d2 evaluation (sigma > 0)."""
+    vol_sqrtT = sigma * sqrtT
+    d1 = log_fm / vol_sqrtT + 0.5 * vol_sqrtT
+    d2 = d1 - vol_sqrtT
+    if is_call:
+        px = fwd * norm_cdf_nb(d1) - k_disc * norm_cdf_nb(d2)
+    else:
+        px = k_disc * norm_cdf_nb(-d2) - fwd * norm_cdf_nb(-d1)
+    vega = fwd * norm_pdf_nb(d1) * sqrtT
+    vomma = vega * d1 * d2 / sigma
+    return px, vega, vomma
+
+
+@njit(cache=True, fastmath=False)
+def _bs_implied_vol_brent_nb(
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    fwd: float,
+    k_disc: float,
+    log_fm: float,
+    sqrtT: float,
+    is_call: bool,
+    target: float,
+    xtol: float,
+    max_iter: int,
+) -> tuple[float, bool]:
+    """Brent's method on ``_bs_price_error_nb`` over a bracket [a, b] with f(a)*f(b) <= 0.
+
+    A port of the classic Brent/Dekker iteration used by ``scipy.optimize.brentq``
+    (same tolerance rule: ``xtol + 4*eps*|x|``), so implied vol needs neither
+    SciPy's optimizer import nor a Python-level callback per iteration.
+    Returns ``(root, converged)``.
+    """
+    rtol = 4.0 * 2.220446049250313e-16
+    xpre, xcur = a, b
+    fpre, fcur = fa, fb
+    xblk, fblk = 0.0, 0.0
+    spre, scur = 0.0, 0.0
+    if fpre == 0.0:
+        return xpre, True
+    if fcur == 0.0:
+        return xcur, True
+
+    for _ in range(max_iter):
+        if fpre != 0.0 and fcur != 0.0 and (fpre < 0.0) != (fcur < 0.0):
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = 0.5 * (xtol + rtol * abs(xcur))
+        sbis = 0.5 * (xblk - xcur)
+        if fcur == 0.0 or abs(sbis) < delta:
+            return xcur, True
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # secant
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # inverse quadratic interpolation
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2.0 * abs(stry) < min(abs(spre), 3.0 * abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre, scur = sbis, sbis
+        else:
+            spre, scur = sbis, sbis
+
+        xpre, fpre = xcur, fcur
+        if abs(scur) > delta:
+            xcur += scur
+        elif sbis > 0.0:
+            xcur += delta
+        else:
+            xcur -= delta
+        fcur = _bs_price_error_nb(xcur, fwd, k_disc, log_fm, sqrtT, is_call, target)
+
+    return xcur, False
@@ -1,43 +1,286 @@
 from __future__ import annotations
 
 import math
+from typing import Sequence, Union
+
+import numpy as np
 
 from ...exceptions import InvalidInputError
-from ...instruments.options import EuropeanOption
+from ...instruments.options import (
+    EuropeanOption,
+    EuropeanOptionChain,
+    OptionKind,
+    _is_call_kind,
+)
 from ...market.market import Market
+from ...math.norm import norm_cdf, norm_pdf
 from ...models.black_scholes import BlackScholesModel, bs_price
 from ..base import GreeksResult, PriceResult
+from ._kernels import _bs_implied_vol_brent_nb, _bs_price_error_nb, _bs_price_vega_vomma_nb
 
 
 
-def _norm_cdf(x: float) -> float:
-    # TODO(CDF-DUP): unify with qpl.models.black_scholes._norm_cdf (vectorized).
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
-
+ArrayLike = Union[float, int, np.ndarray]
 
 
-def _norm_pdf(x: float) -> float:
-    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+def _is_call_mask(kind: str | OptionKind | Sequence[str] | np.ndarray) -> np.ndarray:
+    """Boolean mask (True for calls) from kind strings or ``OptionKind`` codes (+1/-1)."""
+    if isinstance(kind, str):
+        # One kind for the whole chain: no per-element string handling.
+        return np.asarray(_is_call_kind(kind))
+    kind_arr = np.asarray(kind)
+    if kind_arr.dtype.kind in "iu":
+        if not np.all((kind_arr == OptionKind.CALL) | (kind_arr == OptionKind.PUT)):
+            raise InvalidInputError("kind codes must be OptionKind.CALL (1) or OptionKind.PUT (-1)")
+        return kind_arr == OptionKind.CALL
+    kind_arr = np.char.lower(kind_arr.astype(str))
+    if not np.all((kind_arr == "call") | (kind_arr == "put")):
+        raise InvalidInputError("kind must be 'call' or 'put'")
+    return kind_arr == "call"
 
 
 
 def _d1_d2(
     *,
-    S: float,
-    K: float,
-    T: float,
-    r: float,
-    q: float,
-    sigma: float,
-) -> tuple[float, float, float]:
-    if T <= 0:
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    q: np.ndarray,
+    sigma: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(d1, d2, sqrtT, vol_sqrtT)``.
+
+    Callers validate T > 0 and sigma > 0 up front (or drop degenerate
+    elements), so this is straight-line array math with no per-element masking.
+    """
+    sqrtT = np.sqrt(T)
+    vol_sqrtT = sigma * sqrtT
+    d1, d2 = _d1_d2_from_moneyness(np.log(S / K) + (r - q) * T, vol_sqrtT)
+    return d1, d2, sqrtT, vol_sqrtT
+
+
+
+def _d1_d2_from_moneyness(
+    log_fm: np.ndarray, vol_sqrtT: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """d1/d2 from the log forward moneyness ``ln(S*df_q / (K*df_r))``.
+
+    Splitting out the sigma-independent ``log_fm`` lets solvers compute the
+    log once per contract and only redo the division per iteration.
+    """
+    d1 = log_fm / vol_sqrtT + 0.5 * vol_sqrtT
+    return d1, d1 - vol_sqrtT
+
+
+
+def _bs_kernel(
+    *,
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    q: np.ndarray,
+    sigma: np.ndarray,
+    sign: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """Shared Black–Scholes terms in one pass.
+
+    ``sign`` is +1 for calls and -1 for puts. Returns
+    ``(d1, d2, sqrtT, vol_sqrtT, df_r, df_q, n1, n2, pdf_d1)`` with ``n1 = N(sign*d1)`` and
+    ``n2 = N(sign*d2)``: each contract only needs the two CDFs on its own side,
+    and evaluating N(-d) directly keeps full accuracy in the tails where
+    ``1 - N(d)`` would cancel.
+    """
+    d1, d2, sqrtT, vol_sqrtT = _d1_d2(S=S, K=K, T=T, r=r, q=q, sigma=sigma)
+    df_r = np.exp(-r * T)
+    df_q = np.exp(-q * T)
+    n1 = norm_cdf(sign * d1)
+    n2 = norm_cdf(sign * d2)
+    pdf_d1 = norm_pdf(d1)
+    return d1, d2, sqrtT, vol_sqrtT, df_r, df_q, n1, n2, pdf_d1
+
+
+
+def _broadcast_inputs(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    sigma: ArrayLike,
+    kind: str | Sequence[str] | np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    arrays = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, T, r, q, sigma)),
+        _is_call_mask(kind),
+    )
+    S_arr, K_arr, T_arr, r_arr, q_arr, sigma_arr, is_call = arrays
+    if np.any(S_arr <= 0):
+        raise InvalidInputError("S must be > 0")
+    if np.any(K_arr <= 0):
+        raise InvalidInputError("K must be > 0")
+    if np.any(T_arr < 0):
+        raise InvalidInputError("T must be >= 0")
+    if np.any(sigma_arr < 0):
+        raise InvalidInputError("sigma must be >= 0")
+    return S_arr, K_arr, T_arr, r_arr, q_arr, sigma_arr, is_call
+
+
+
+def bs_price_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    sigma: ArrayLike,
+    kind: str | Sequence[str] | np.ndarray = "call",
+) -> np.ndarray:
+    """Black–Scholes prices over broadcastable arrays of inputs.
+
+    All numeric inputs (and ``kind``, which may be an array of "call"/"put"
+    strings) are broadcast together, so a whole strike/expiry chain is priced
+    in one pass of NumPy array math. Elements with T == 0 or sigma == 0 fall
+    back to the (discounted-forward) intrinsic value, matching ``bs_price``.
+
+    Returns
+    -------
+    np.ndarray
+        Prices with the broadcast shape of the inputs (0-d for scalar inputs).
+    """
+    S_arr, K_arr, T_arr, r_arr, q_arr, sigma_arr, is_call = _broadcast_inputs(
+        S, K, T, r, q, sigma, kind
+    )
+    return _price_broadcast(S_arr, K_arr, T_arr, r_arr, q_arr, sigma_arr, is_call)
+
+
+
+def _price_broadcast(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    q: np.ndarray,
+    sigma: np.ndarray,
+    is_call: np.ndarray,
+) -> np.ndarray:
+    """``bs_price_vec`` on validated arrays of one broadcast shape."""
+    sign = np.where(is_call, 1.0, -1.0)
+    degenerate = (T == 0) | (sigma == 0)
+    if not degenerate.any():
+        return _bs_value(S, K, T, r, q, sigma, sign)
+
+    # Mixed chains: run the closed form over everything (compressing out the
+    # degenerate elements costs more than it saves) and overwrite those with
+    # the discounted-forward intrinsic.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = _bs_value(S, K, T, r, q, sigma, sign)
+    intrinsic = np.maximum(sign * (S * np.exp(-q * T) - K * np.exp(-r * T)), 0.0)
+    return np.where(degenerate, intrinsic, value)
+
+
+
+def _bs_value(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    q: np.ndarray,
+    sigma: np.ndarray,
+    sign: np.ndarray,
+) -> np.ndarray:
+    """Closed-form price for elements with T > 0 and sigma > 0."""
+    _, _, _, _, df_r, df_q, n1, n2, _ = _bs_kernel(
+        S=S, K=K, T=T, r=r, q=q, sigma=sigma, sign=sign
+    )
+    return sign * (S * df_q * n1 - K * df_r * n2)
+
+
+
+def bs_greeks_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    sigma: ArrayLike,
+    kind: str | Sequence[str] | np.ndarray = "call",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Black–Scholes Greeks over broadcastable arrays of inputs.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(delta, gamma, vega, theta, rho)``, each with the broadcast shape of
+        the inputs (0-d for scalar inputs).
+    """
+    return _price_and_greeks(S, K, T, r, q, sigma, kind)[1:]
+
+
+
+def bs_price_greeks_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    sigma: ArrayLike,
+    kind: str | Sequence[str] | np.ndarray = "call",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Black–Scholes prices and Greeks from one shared evaluation.
+
+    Equivalent to ``bs_price_vec`` followed by ``bs_greeks_vec`` (so T > 0 and
+    sigma > 0 are required), but d1/d2, the CDFs, the density and the discount
+    factors are computed once for all six outputs.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(price, delta, gamma, vega, theta, rho)``, each with the broadcast
+        shape of the inputs (0-d for scalar inputs).
+    """
+    return _price_and_greeks(S, K, T, r, q, sigma, kind)
+
+
+
+def _price_and_greeks(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    sigma: ArrayLike,
+    kind: str | Sequence[str] | np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    S_arr, K_arr, T_arr, r_arr, q_arr, sigma_arr, is_call = _broadcast_inputs(
+        S, K, T, r, q, sigma, kind
+    )
+    if np.any(T_arr <= 0):
         raise InvalidInputError("T must be > 0 for Greeks")
-    if sigma <= 0:
+    if np.any(sigma_arr <= 0):
         raise InvalidInputError("sigma must be > 0 for Greeks")
-    sqrtT = math.sqrt(T)
-    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
-    d2 = d1 - sigma * sqrtT
-    return d1, d2, sqrtT
+
+    sign = np.where(is_call, 1.0, -1.0)
+    _, _, sqrtT, vol_sqrtT, df_r, df_q, n1, n2, pdf_d1 = _bs_kernel(
+        S=S_arr, K=K_arr, T=T_arr, r=r_arr, q=q_arr, sigma=sigma_arr, sign=sign
+    )
+
+    # Shared products: discounted forward/strike and the forward-weighted density.
+    fwd_n1 = S_arr * df_q * n1
+    k_disc_n2 = K_arr * df_r * n2
+    fwd_pdf = S_arr * df_q * pdf_d1
+
+    # The price is the same two products _bs_value forms, so it comes for free.
+    price = sign * (fwd_n1 - k_disc_n2)
+    gamma = fwd_pdf / (S_arr * S_arr * vol_sqrtT)
+    vega = fwd_pdf * sqrtT
+    # Calls and puts differ only by the sign folded into n1 = N(sign*d1), n2 = N(sign*d2).
+    delta = sign * df_q * n1
+    theta = -0.5 * fwd_pdf * sigma_arr / sqrtT - sign * (r_arr * k_disc_n2 - q_arr * fwd_n1)
+    rho = sign * T_arr * k_disc_n2
+
+    return price, delta, gamma, vega, theta, rho
 
 
 
@@ -49,90 +292,85 @@ def price_european(
     T = option.expiry
     r = market.rate(T)
     q = market.dividend_yield(T)
-    value = float(
-        bs_price(
-            S=market.spot,
-            K=option.strike,
-            T=T,
-            r=r,
-            sigma=model.sigma,
-            q=q,
-            kind=option.kind,
-        )
+    # One contract: bs_price's scalar kernel (erfc-based CDF, no array dispatch).
+    value = bs_price(
+        S=market.spot,
+        K=option.strike,
+        T=T,
+        r=r,
+        sigma=model.sigma,
+        q=q,
+        kind=option.kind,
     )
     return PriceResult(value=value, meta={"method": "analytic", "model": "BlackScholes"})
 
 
 
+def price_chain(
+    chain: EuropeanOptionChain,
+    model: BlackScholesModel,
+    market: Market,
+) -> np.ndarray:
+    """Black–Scholes prices for every contract in an option chain.
+
+    Rates and dividend yields are looked up once per distinct expiry and the
+    whole chain is priced in one ``bs_price_vec`` pass, with no per-option
+    objects or kind strings.
+
+    Returns
+    -------
+    np.ndarray
+        Prices aligned with the chain's arrays.
+    """
+    expiries, inverse = np.unique(chain.expiries, return_inverse=True)
+    r = market.rate_array(expiries)[inverse]
+    q = market.dividend_yield_array(expiries)[inverse]
+    S, K, T, r, q, sigma = np.broadcast_arrays(
+        float(market.spot), chain.strikes, chain.expiries, r, q, float(model.sigma)
+    )
+    return _price_broadcast(S, K, T, r, q, sigma, chain.is_call)
+
+
+
 def greeks_european(
     option: EuropeanOption,
     model: BlackScholesModel,
     market: Market,
 ) -> GreeksResult:
-    S = market.spot
-    K = option.strike
     T = option.expiry
     r = market.rate(T)
     q = market.dividend_yield(T)
-    sigma = model.sigma
-
-    d1, d2, sqrtT = _d1_d2(S=S, K=K, T=T, r=r, q=q, sigma=sigma)
-    df_r = math.exp(-r * T)
-    df_q = math.exp(-q * T)
-    nd1 = _norm_cdf(d1)
-    nd2 = _norm_cdf(d2)
-    pdf_d1 = _norm_pdf(d1)
 
-    gamma = df_q * pdf_d1 / (S * sigma * sqrtT)
-    vega = S * df_q * pdf_d1 * sqrtT
-
-    if option.kind == "call":
-        delta = df_q * nd1
-        theta = (
-            -(S * df_q * pdf_d1 * sigma) / (2.0 * sqrtT)
-            - r * K * df_r * nd2
-            + q * S * df_q * nd1
-        )
-        rho = K * T * df_r * nd2
-    else:
-        nmd1 = _norm_cdf(-d1)
-        nmd2 = _norm_cdf(-d2)
-        delta = df_q * (nd1 - 1.0)
-        theta = (
-            -(S * df_q * pdf_d1 * sigma) / (2.0 * sqrtT)
-            + r * K * df_r * nmd2
-            - q * S * df_q * nmd1
-        )
-        rho = -K * T * df_r * nmd2
+    delta, gamma, vega, theta, rho = bs_greeks_vec(
+        market.spot,
+        option.strike,
+        T,
+        r,
+        q,
+        model.sigma,
+        option.kind,
+    )
 
     return GreeksResult(
-        delta=delta,
-        gamma=gamma,
-        vega=vega,
-        theta=theta,
-        rho=rho,
+        delta=float(delta),
+        gamma=float(gamma),
+        vega=float(vega),
+        theta=float(theta),
+        rho=float(rho),
         meta={"method": "analytic", "model": "BlackScholes"},
     )
 
 
-def implied_volatility(
+def _implied_vol_inputs(
     price: float,
     option: EuropeanOption,
     market: Market,
-    *,
-    lower: float = 1e-6,
-    upper: float = 5.0,
-    tol: float = 1e-7,
-    max_iter: int = 100,
-) -> float:
-    """Compute implied volatility via Brent's method.
+) -> tuple[float, float, float, float]:
+    """Validate an implied-vol request and return ``(T, fwd, k_disc, intrinsic)``.
 
-    Raises:
-        InvalidInputError: if price is outside arbitrage bounds or inputs invalid.
-        RuntimeError: if solver fails to converge.
+    ``fwd = S*df_q`` and ``k_disc = K*df_r`` are the sigma-invariant terms the
+    solvers reuse on every iteration.
     """
-    from scipy.optimize import brentq
-
     if price < 0:
         raise InvalidInputError("Option price must be non-negative")
 
@@ -146,48 +384,79 @@ def implied_volatility(
     r = market.rate(T)
     q = market.dividend_yield(T)
 
-    df_r = math.exp(-r * T)
-    df_q = math.exp(-q * T)
+    fwd = S * math.exp(-q * T)
+    k_disc = K * math.exp(-r * T)
 
     # Arbitrage bounds
     if option.kind == "call":
         # Call value C >= max(0, S*df_q - K*df_r) and C < S*df_q
-        intrinsic = max(0.0, S * df_q - K * df_r)
-        max_val = S * df_q
+        intrinsic = max(0.0, fwd - k_disc)
+        max_val = fwd
         if not (intrinsic <= price < max_val):
              raise InvalidInputError(
                  f"Call price {price} outside bounds [{intrinsic:.4f}, {max_val:.4f})"
              )
     else:
         # Put value P >= max(0, K*df_r - S*df_q) and P < K*df_r
-        intrinsic = max(0.0, K * df_r - S * df_q)
-        max_val = K * df_r
+        intrinsic = max(0.0, k_disc - fwd)
+        max_val = k_disc
         if not (intrinsic <= price < max_val):
              raise InvalidInputError(
                  f"Put price {price} outside bounds [{intrinsic:.4f}, {max_val:.4f})"
              )
 
+    return T, fwd, k_disc, intrinsic
+
+
+def _manaster_koehler_guess(log_fm: float, T: float) -> float:
+    """Seed sqrt(2|ln(S*df_q / (K*df_r))| / T), or 0.2 where it degenerates at-the-money forward."""
+    sigma_mk = math.sqrt(2.0 * abs(log_fm) / T)
+    return sigma_mk if sigma_mk >= 1e-3 else 0.2
+
+
+def implied_volatility(
+    price: float,
+    option: EuropeanOption,
+    market: Market,
+    *,
+    lower: float = 1e-6,
+    upper: float = 5.0,
+    tol: float = 1e-7,
+    max_iter: int = 100,
+) -> float:
+    """Compute implied volatility via Brent's method.
+
+    The solver runs entirely in the compiled kernel module (no
+    ``scipy.optimize`` import), so the first call carries no extra import cost.
+
+    Raises:
+        InvalidInputError: if price is outside arbitrage bounds or inputs invalid.
+        RuntimeError: if solver fails to converge.
+    """
+    T, fwd, k_disc, intrinsic = _implied_vol_inputs(price, option, market)
+
     # If price is extremely close to intrinsic, sigma -> 0.
     if abs(price - intrinsic) < 1e-9:
         return 0.0
 
-    def objective(sigma: float) -> float:
-        val = float(
-            bs_price(
-                S=S,
-                K=K,
-                T=T,
-                r=r,
-                sigma=sigma,
-                q=q,
-                kind=option.kind,
-            )
-        )
-        return val - price
-
-    # Check bounds
-    y_low = objective(lower)
-    y_high = objective(upper)
+    # The objective takes the invariants positionally, bound once here.
+    log_fm = math.log(fwd / k_disc)
+    objective = _bs_price_error_nb
+    args = (fwd, k_disc, log_fm, math.sqrt(T), option.kind == "call", float(price))
+
+    # Start from a tight bracket around the Manaster–Koehler seed and widen it
+    # geometrically (price is increasing in sigma) until it straddles the root.
+    sigma_mk = min(max(_manaster_koehler_guess(log_fm, T), lower), upper)
+    a = max(lower, 0.5 * sigma_mk)
+    b = min(upper, 2.0 * sigma_mk)
+    y_low = objective(a, *args)
+    y_high = objective(b, *args)
+    while y_low > 0 and a > lower:
+        a = max(lower, 0.5 * a)
+        y_low = objective(a, *args)
+    while y_high < 0 and b < upper:
+        b = min(upper, 2.0 * b)
+        y_high = objective(b, *args)
 
     if y_low * y_high > 0:
         # If both same sign, we can't bracket.
@@ -196,8 +465,151 @@ def implied_volatility(
         msg = f"Cannot bracket implied vol in [{lower}, {upper}]. Errs: low={y_low:.2e}, high={y_high:.2e}"
         raise InvalidInputError(msg)
 
-    try:
-        iv = brentq(objective, lower, upper, xtol=tol, maxiter=max_iter)
-        return float(iv)
-    except Exception as e:
-        raise RuntimeError(f"Implied vol solver failed: {e}")
+    iv, converged = _bs_implied_vol_brent_nb(a, b, y_low, y_high, *args, tol, max_iter)
+    if not converged:
+        raise RuntimeError(f"Implied vol solver failed: no convergence after {max_iter} iterations")
+    return float(iv)
+
+
+def implied_volatility_newton(
+    price: float,
+    option: EuropeanOption,
+    market: Market,
+    *,
+    sigma0: float | None = None,
+    lower: float = 1e-8,
+    upper: float = 5.0,
+    tol: float = 1e-8,
+    max_iter: int = 20,
+) -> float:
+    """Compute implied volatility via Newton–Halley iteration on vega.
+
+    Each step evaluates price, vega and vomma from a single d1/d2 and takes a
+    Halley step, clamped to [lower, upper]. The default starting point is the
+    Manaster–Koehler guess sqrt(2|ln(S*df_q / (K*df_r))| / T). If the iteration
+    stalls (vanishing vega, stuck at a bound, or max_iter reached) it falls back
+    to Brent via ``implied_volatility``.
+
+    Raises:
+        InvalidInputError: if price is outside arbitrage bounds or inputs invalid.
+        RuntimeError: if the Brent fallback fails to converge.
+    """
+    T, fwd, k_disc, intrinsic = _implied_vol_inputs(price, option, market)
+
+    if abs(price - intrinsic) < 1e-9:
+        return 0.0
+
+    is_call = option.kind == "call"
+    log_fm = math.log(fwd / k_disc)
+    sqrtT = math.sqrt(T)
+    if sigma0 is None:
+        sigma0 = _manaster_koehler_guess(log_fm, T)
+    sigma = min(max(sigma0, lower), upper)
+
+    for _ in range(max_iter):
+        px, vega, vomma = _bs_price_vega_vomma_nb(fwd, k_disc, log_fm, sqrtT, sigma, is_call)
+        diff = px - price
+        if abs(diff) < tol:
+            return sigma
+        if vega < 1e-12:
+            break
+        step = diff / vega
+        halley_denom = 1.0 - 0.5 * step * vomma / vega
+        if halley_denom > 0.5:
+            step /= halley_denom
+        sigma_new = min(max(sigma - step, lower), upper)
+        if sigma_new == sigma:
+            break
+        sigma = sigma_new
+
+    return implied_volatility(price, option, market, upper=upper)
+
+
+def implied_volatility_vec(
+    prices: ArrayLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    kind: str | Sequence[str] | np.ndarray = "call",
+    *,
+    lower: float = 1e-8,
+    upper: float = 5.0,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """Implied volatilities for a whole option chain via lockstep Newton iteration.
+
+    Inputs broadcast like ``bs_price_vec``. Every element starts from the
+    Manaster–Koehler guess (0.2 at-the-money forward) and takes Newton steps on
+    vega, clamped to [lower, upper]; converged elements are masked out of
+    further iterations. Unlike the scalar solvers this never raises for bad
+    quotes: elements with T == 0, prices outside the arbitrage bounds, or no
+    convergence within max_iter are returned as NaN. Invalid inputs (T < 0,
+    S <= 0 or K <= 0) raise ``InvalidInputError`` as in ``bs_price_vec``.
+
+    Returns
+    -------
+    np.ndarray
+        Implied volatilities with the broadcast shape of the inputs.
+    """
+    S_arr, K_arr, T_arr, r_arr, q_arr, _, is_call = _broadcast_inputs(
+        S, K, T, r, q, 0.0, kind
+    )
+    prices_arr, S_arr, K_arr, T_arr, r_arr, q_arr, is_call = np.broadcast_arrays(
+        np.asarray(prices, dtype=float), S_arr, K_arr, T_arr, r_arr, q_arr, is_call
+    )
+
+    fwd = S_arr * np.exp(-q_arr * T_arr)
+    k_disc = K_arr * np.exp(-r_arr * T_arr)
+    intrinsic = np.where(is_call, np.maximum(fwd - k_disc, 0.0), np.maximum(k_disc - fwd, 0.0))
+    max_val = np.where(is_call, fwd, k_disc)
+    valid = (T_arr > 0) & (prices_arr >= intrinsic) & (prices_arr < max_val)
+
+    sigma = np.full(prices_arr.shape, np.nan)
+    at_intrinsic = valid & (np.abs(prices_arr - intrinsic) < 1e-9)
+    sigma[at_intrinsic] = 0.0
+
+    idx = np.flatnonzero(valid & ~at_intrinsic)
+    if idx.size == 0:
+        return sigma
+
+    # Work on flat copies of the elements that still need solving.
+    px_t = prices_arr.ravel()[idx]
+    t_a = T_arr.ravel()[idx]
+    call_a = is_call.ravel()[idx]
+    fwd_a = fwd.ravel()[idx]
+    kd_a = k_disc.ravel()[idx]
+    # Sigma-invariant terms, computed once rather than per iteration.
+    log_fm_a = np.log(fwd_a / kd_a)
+    sqrtT_a = np.sqrt(t_a)
+
+    sig = np.sqrt(2.0 * np.abs(log_fm_a) / t_a)
+    sig = np.clip(np.where(sig < 1e-3, 0.2, sig), lower, upper)
+    solved = np.full(idx.size, np.nan)
+    active = np.arange(idx.size)
+
+    for _ in range(max_iter):
+        a_sig = sig[active]
+        sqrtT = sqrtT_a[active]
+        d1, d2 = _d1_d2_from_moneyness(log_fm_a[active], a_sig * sqrtT)
+        a_fwd, a_kd = fwd_a[active], kd_a[active]
+        px = np.where(
+            call_a[active],
+            a_fwd * norm_cdf(d1) - a_kd * norm_cdf(d2),
+            a_kd * norm_cdf(-d2) - a_fwd * norm_cdf(-d1),
+        )
+        vega = a_fwd * norm_pdf(d1) * sqrtT
+        diff = px - px_t[active]
+
+        done = np.abs(diff) < tol
+        solved[active[done]] = a_sig[done]
+        keep = ~done & (vega > 1e-12)
+        active = active[keep]
+        if active.size == 0:
+            break
+        sig[active] = np.clip(a_sig[keep] - diff[keep] / vega[keep], lower, upper)
+
+    sigma.ravel()[idx] = solved
+    return sigma
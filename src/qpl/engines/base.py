@@ -4,25 +4,24 @@ from dataclasses import dataclass
 from typing import Any, Protocol
 
 
-
 class PricingEngine(Protocol):
     def price(self, instrument: Any, model: Any) -> float: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceResult:
     """Pricing result.
 
     stderr is None for deterministic/analytic methods; for Monte Carlo it is the
-    standard error of the estimator (0.0 for deterministic edge cases).
+    standard error of the estimator (0.0 for deterministic edge cases, NaN for
+    quasi-Monte Carlo, whose samples are not independent).
     """
     value: float
     stderr: float | None = None
     meta: dict[str, Any] | None = None
 
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GreeksResult:
     delta: float
     gamma: float
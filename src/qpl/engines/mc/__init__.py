@@ -0,0 +1,3 @@
+from .pricers import MCConfig, greeks_european, price_european, price_european_multi
+
+__all__ = ["MCConfig", "greeks_european", "price_european", "price_european_multi"]
@@ -0,0 +1,114 @@
+"""
+Numba kernels for the Monte Carlo engine.
+
+Only used when Numba is installed (``qpl._jit.HAVE_NUMBA``); otherwise the
+pricers take the equivalent NumPy path.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ..._jit import njit, prange
+from ...instruments._kernels import _vanilla_payoff_nb
+
+
+@njit(fastmath=True, cache=True)
+def _discounted_payoff_nb(s: float, k: float, df_r: float, is_call: bool) -> float:
+    return df_r * _vanilla_payoff_nb(s, k, is_call)
+
+
+# Fixed chunk count for the grouped reduction: partial sums are combined in a
+# set order, so results do not depend on the number of threads.
+_MOMENT_CHUNKS = 64
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _terminal_moments_nb(
+    scale: np.ndarray,
+    k: float,
+    df_r: np.ndarray,
+    vol: float,
+    cv_mean: np.ndarray,
+    z: np.ndarray,
+    is_call: bool,
+    antithetic: bool,
+) -> tuple[int, np.ndarray]:
+    """Stream the terminal payoffs of scenarios sharing one vol into MC sums, in one parallel pass.
+
+    Scenario j has ``S_T = scale[j] * exp(vol*z)`` (``scale = s0*exp(drift)``),
+    so a single exp per path serves every scenario in the group. Each sample is
+    ``pv = df_r[j] * payoff(S_T)`` and the centered control
+    ``cv = df_r[j] * S_T - cv_mean[j]``; with ``antithetic`` a sample is the
+    average over the pair (z[i], z[i + n/2] = -z[i]), whose mirrored spot is
+    ``scale[j] / exp(vol*z[i])``. Returns ``n`` and an (m, 5) array of
+    ``(sum pv, sum pv^2, sum cv, sum cv^2, sum pv*cv)`` per scenario, without
+    materializing any per-path array.
+
+    The draws are passed in rather than generated per thread so results stay
+    tied to the seeded NumPy Generator.
+    """
+    n = z.shape[0] // 2 if antithetic else z.shape[0]
+    m = scale.shape[0]
+    n_chunks = min(_MOMENT_CHUNKS, n)
+    partial = np.zeros((n_chunks, m, 5))
+    for c in prange(n_chunks):
+        acc = partial[c]
+        for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+            e = math.exp(vol * z[i])
+            inv_e = 1.0 / e
+            for j in range(m):
+                s = scale[j] * e
+                pv = _discounted_payoff_nb(s, k, df_r[j], is_call)
+                cv = df_r[j] * s
+                if antithetic:
+                    s_b = scale[j] * inv_e
+                    pv = 0.5 * (pv + _discounted_payoff_nb(s_b, k, df_r[j], is_call))
+                    cv = 0.5 * (cv + df_r[j] * s_b)
+                cv -= cv_mean[j]
+                acc[j, 0] += pv
+                acc[j, 1] += pv * pv
+                acc[j, 2] += cv
+                acc[j, 3] += cv * cv
+                acc[j, 4] += pv * cv
+    return n, partial.sum(axis=0)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _payoff_moments_nb(
+    s_t: np.ndarray,
+    k: float,
+    df_r: float,
+    cv_mean: float,
+    is_call: bool,
+    antithetic: bool,
+) -> tuple[int, float, float, float, float, float]:
+    """Same sums as ``_terminal_moments_nb`` for one strike, from precomputed S_T.
+
+    Used when several strikes share one set of terminal spots, so the exp is
+    paid once for the whole chain. Reduced over the same fixed chunks, so the
+    sums do not depend on the thread count either.
+    """
+    n = s_t.shape[0] // 2 if antithetic else s_t.shape[0]
+    n_chunks = min(_MOMENT_CHUNKS, n)
+    partial = np.zeros((n_chunks, 5))
+    for c in prange(n_chunks):
+        acc = partial[c]
+        for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+            s = s_t[i]
+            pv = _discounted_payoff_nb(s, k, df_r, is_call)
+            cv = df_r * s
+            if antithetic:
+                s_b = s_t[i + n]
+                pv = 0.5 * (pv + _discounted_payoff_nb(s_b, k, df_r, is_call))
+                cv = 0.5 * (cv + df_r * s_b)
+            cv -= cv_mean
+            acc[0] += pv
+            acc[1] += pv * pv
+            acc[2] += cv
+            acc[3] += cv * cv
+            acc[4] += pv * cv
+    sums = partial.sum(axis=0)
+    return n, sums[0], sums[1], sums[2], sums[3], sums[4]
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
 
 import numpy as np
 
 from ...exceptions import InvalidInputError
 from ...instruments.options import EuropeanOption
-from ...market.curves import FlatDividendCurve, FlatRateCurve
 from ...market.market import Market
 from ...models.black_scholes import BlackScholesModel
+from ..._jit import HAVE_NUMBA
 from ..base import GreeksResult, PriceResult
+from ._kernels import _payoff_moments_nb, _terminal_moments_nb
 
 
 @dataclass(frozen=True)
@@ -18,10 +22,178 @@ class MCConfig:
     """Monte Carlo configuration.
 
     n_steps controls time discretization; n_steps=1 uses terminal sampling.
+    seed=None draws fresh, unseeded normals on every run; such runs are never
+    cached (neither the draws nor, through ``qpl.pricing``, the result).
+    antithetic pairs every normal draw z with -z (n_paths // 2 pairs, so an
+    odd n_paths drops one path); only half the normals are drawn, the mirrored
+    spot costs a division instead of an exp, and the stderr is computed over
+    pair averages. control_variate regresses the
+    discounted payoff on the discounted terminal spot, whose mean S0*df_q is
+    known in closed form. dtype="float32" simulates prices in single precision
+    (half the memory traffic; sums and stderr are still accumulated in float64);
+    Greeks always simulate in float64, since FP32 round-off would swamp the
+    finite-difference bumps. n_workers > 1 draws the normals on that many
+    threads, chunk i from the i-th jumped substream of PCG64(seed): results
+    are deterministic for a given (seed, n_workers) but differ from the
+    single-stream run. rng_kind="sobol" replaces the pseudo-random draws with
+    a scrambled Sobol sequence (one dimension per step, seeded by seed; use a
+    power-of-two n_paths): the error then shrinks close to O(1/n_paths), but
+    the points are not independent, so the reported stderr is NaN.
     """
     n_paths: int = 50_000
     n_steps: int = 1
-    seed: int = 123
+    seed: int | None = 123
+    antithetic: bool = False
+    control_variate: bool = False
+    dtype: str = "float64"
+    n_workers: int = 1
+    rng_kind: str = "pcg64"
+
+
+def _validate_config(cfg: MCConfig) -> None:
+    if cfg.n_paths < 2:
+        raise InvalidInputError("n_paths must be >= 2 for MC stderr with ddof=1")
+    if cfg.n_steps < 1:
+        raise InvalidInputError("n_steps must be >= 1")
+    if cfg.antithetic and cfg.n_paths < 4:
+        raise InvalidInputError("n_paths must be >= 4 for antithetic MC (two pairs)")
+    if cfg.dtype not in ("float32", "float64"):
+        raise InvalidInputError("dtype must be 'float32' or 'float64'")
+    if cfg.n_workers < 1:
+        raise InvalidInputError("n_workers must be >= 1")
+    if cfg.rng_kind not in ("pcg64", "sobol"):
+        raise InvalidInputError("rng_kind must be 'pcg64' or 'sobol'")
+
+
+# Scratch size (elements) for multi-step draws; the (n_paths, n_steps) step
+# matrix is never materialized, only one block of rows at a time.
+_STEP_BLOCK_ELEMS = 1 << 16
+
+
+# Draw sets up to this many paths are kept (a few at a time, read-only) for
+# reuse by later runs with the same seeded stream.
+_NORMALS_CACHE_MAX_PATHS = 1 << 20
+
+
+def _normals(cfg: MCConfig, dtype: str | None = None) -> np.ndarray:
+    """``_draw_normals``, reusing the draws of a recent run with the same stream.
+
+    Pricing different options, markets or bumps under one seeded cfg then
+    pays the RNG once. The control variate does not change the draws, so it
+    is not part of the key; unseeded runs always draw afresh.
+    """
+    dtype = np.dtype(cfg.dtype if dtype is None else dtype).name
+    if cfg.seed is None or cfg.n_paths > _NORMALS_CACHE_MAX_PATHS:
+        return _draw_normals(cfg, dtype)
+    return _cached_normals(
+        cfg.n_paths, cfg.n_steps, cfg.seed, cfg.antithetic, cfg.n_workers, cfg.rng_kind, dtype
+    )
+
+
+@lru_cache(maxsize=4)
+def _cached_normals(
+    n_paths: int,
+    n_steps: int,
+    seed: int,
+    antithetic: bool,
+    n_workers: int,
+    rng_kind: str,
+    dtype: str,
+) -> np.ndarray:
+    cfg = MCConfig(
+        n_paths=n_paths,
+        n_steps=n_steps,
+        seed=seed,
+        antithetic=antithetic,
+        n_workers=n_workers,
+        rng_kind=rng_kind,
+    )
+    z = _draw_normals(cfg, dtype)
+    z.flags.writeable = False
+    return z
+
+
+def _draw_normals(cfg: MCConfig, dtype: str | None = None) -> np.ndarray:
+    """Standardized terminal draw per path, shape (n_paths,).
+
+    With n_steps > 1 this is the sum of the step draws / sqrt(n_steps): only
+    the summed log increment reaches S_T for a European payoff. Steps are
+    drawn block by block from one Generator, so the stream (and every result)
+    matches drawing the full (n_paths, n_steps) matrix at once.
+
+    Drawn in ``dtype`` (default ``cfg.dtype``); float32 draws come straight
+    from the Generator's single-precision sampler rather than a downcast.
+    With ``cfg.n_workers > 1`` contiguous chunks are filled concurrently, each
+    from its own jumped PCG64 substream (NumPy releases the GIL while filling);
+    a Sobol sequence is always drawn on one thread.
+    """
+    dtype = np.dtype(cfg.dtype if dtype is None else dtype)
+    n = cfg.n_paths // 2 if cfg.antithetic else cfg.n_paths
+    z = np.empty(2 * n if cfg.antithetic else n, dtype=dtype)
+    n_chunks = min(cfg.n_workers, n)
+    if cfg.rng_kind == "sobol":
+        _fill_sobol(z[:n], cfg.n_steps, cfg.seed)
+    elif n_chunks == 1:
+        _fill_terminal(np.random.default_rng(cfg.seed), z[:n], cfg.n_steps)
+    else:
+        base = np.random.PCG64(cfg.seed)
+        bounds = [n * i // n_chunks for i in range(n_chunks + 1)]
+
+        def _fill_chunk(i: int) -> None:
+            rng = np.random.Generator(base.jumped(i))
+            _fill_terminal(rng, z[bounds[i] : bounds[i + 1]], cfg.n_steps)
+
+        with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+            list(pool.map(_fill_chunk, range(n_chunks)))
+    if cfg.antithetic:
+        np.negative(z[:n], out=z[n:])
+    return z
+
+
+def _fill_terminal(rng: np.random.Generator, out: np.ndarray, n_steps: int) -> None:
+    """Fill out with standardized terminal draws from rng (see _draw_normals)."""
+    dtype = out.dtype
+    n = len(out)
+    # standard_normal(out=...) yields the same stream as normal(size=...) but
+    # skips the loc/scale pass and fills one preallocated buffer.
+    if n_steps == 1:
+        rng.standard_normal(dtype=dtype, out=out)
+        return
+    rows = max(1, _STEP_BLOCK_ELEMS // n_steps)
+    buf = np.empty(min(rows, n) * n_steps, dtype=dtype)
+    scale = dtype.type(math.sqrt(n_steps))
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        block = buf[: (stop - start) * n_steps]
+        rng.standard_normal(dtype=dtype, out=block)
+        np.sum(block.reshape(stop - start, n_steps), axis=1, out=out[start:stop])
+        out[start:stop] /= scale
+
+
+def _fill_sobol(out: np.ndarray, n_steps: int, seed: int | None) -> None:
+    """Fill out with standardized terminal draws from a scrambled Sobol sequence.
+
+    Each path is one n_steps-dimensional point mapped to normals by the
+    inverse CDF. Blocks hold a power-of-two number of points so that only a
+    non-power-of-two n_paths trips SciPy's balance warning.
+    """
+    # scipy.stats is slow to import; only QMC runs pay for it.
+    from scipy.special import ndtri
+    from scipy.stats import qmc
+
+    sampler = qmc.Sobol(d=n_steps, scramble=True, seed=seed)
+    n = len(out)
+    rows = 1 << max(0, (_STEP_BLOCK_ELEMS // n_steps).bit_length() - 1)
+    scale = math.sqrt(n_steps)
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        u = ndtri(sampler.random(stop - start))
+        np.divide(np.sum(u, axis=1), scale, out=out[start:stop], casting="same_kind")
+
+
+def _curve_terms(market: Market, t: float) -> tuple[float, float, float]:
+    """(r, q, df_r) at t: every curve query a pricing run needs, made once."""
+    return market.rate(t), market.dividend_yield(t), market.df_r(t)
 
 
 def price_european(
@@ -31,66 +203,335 @@ def price_european(
     *,
     cfg: MCConfig,
 ) -> PriceResult:
-    if cfg.n_paths < 2:
-        raise InvalidInputError("n_paths must be >= 2 for MC stderr with ddof=1")
-    if cfg.n_steps < 1:
-        raise InvalidInputError("n_steps must be >= 1")
+    _validate_config(cfg)
+    return _price_from_normals(option, model, market, cfg, None)
+
+
+def _price_from_normals(
+    option: EuropeanOption,
+    model: BlackScholesModel,
+    market: Market,
+    cfg: MCConfig,
+    z: np.ndarray | None,
+) -> PriceResult:
+    """Price from given normal draws (drawn from cfg when z is None).
+
+    Passing the same z to bumped repricings gives common random numbers.
+    """
+    meta = _meta(cfg)
+    degenerate = _price_degenerate(option, model, market, meta)
+    if degenerate is not None:
+        return degenerate
 
     s0 = market.spot
-    k = option.strike
     t = option.expiry
-    r = market.rate(t)
-    q = market.dividend_yield(t)
+    r, q, df_r = _curve_terms(market, t)
     sigma = model.sigma
-    df_r = market.df_r(t)
 
-    meta = {
+    if z is None:
+        z = _normals(cfg)
+    value, stderr = _scenario_estimates(
+        z,
+        option,
+        cfg,
+        spot=np.array([s0]),
+        rate=np.array([r]),
+        div=np.array([q]),
+        sigma=np.array([sigma]),
+        tau=np.array([t]),
+        df_r=np.array([df_r]),
+    )
+    if cfg.rng_kind == "sobol":
+        stderr[:] = np.nan
+    return PriceResult(value=float(value[0]), stderr=float(stderr[0]), meta=meta)
+
+
+def _meta(cfg: MCConfig) -> dict:
+    return {
         "method": "mc",
         "model": "BlackScholes",
         "n_paths": cfg.n_paths,
         "n_steps": cfg.n_steps,
         "seed": cfg.seed,
+        "antithetic": cfg.antithetic,
+        "control_variate": cfg.control_variate,
+        "dtype": cfg.dtype,
+        "n_workers": cfg.n_workers,
+        "rng_kind": cfg.rng_kind,
     }
 
+
+def _price_degenerate(
+    option: EuropeanOption,
+    model: BlackScholesModel,
+    market: Market,
+    meta: dict,
+) -> PriceResult | None:
+    """Exact value (zero stderr) at T == 0 or sigma == 0; None when paths are needed."""
+    s0 = market.spot
+    k = option.strike
+    t = option.expiry
+
     if t == 0.0:
         if option.kind == "call":
             value = max(s0 - k, 0.0)
         else:
             value = max(k - s0, 0.0)
-        return PriceResult(value=float(value), stderr=0.0, meta=meta)
+        return PriceResult(value=float(value), stderr=0.0, meta=dict(meta))
 
-    if sigma == 0.0:
+    if model.sigma == 0.0:
+        r, q, df_r = _curve_terms(market, t)
         forward = s0 * math.exp((r - q) * t)
         if option.kind == "call":
             value = df_r * max(forward - k, 0.0)
         else:
             value = df_r * max(k - forward, 0.0)
-        return PriceResult(value=float(value), stderr=0.0, meta=meta)
-
-    rng = np.random.default_rng(cfg.seed)
-    if cfg.n_steps == 1:
-        z = rng.normal(size=cfg.n_paths)
-        drift = (r - q - 0.5 * sigma * sigma) * t
-        vol = sigma * math.sqrt(t)
-        s_t = s0 * np.exp(drift + vol * z)
-    else:
-        dt = t / cfg.n_steps
-        drift_step = (r - q - 0.5 * sigma * sigma) * dt
-        vol_step = sigma * math.sqrt(dt)
-        z = rng.normal(size=(cfg.n_paths, cfg.n_steps))
-        log_s_t = math.log(s0) + drift_step * cfg.n_steps + vol_step * np.sum(z, axis=1)
-        s_t = np.exp(log_s_t)
-
-    if option.kind == "call":
-        payoff = np.maximum(s_t - k, 0.0)
-    else:
-        payoff = np.maximum(k - s_t, 0.0)
+        return PriceResult(value=float(value), stderr=0.0, meta=dict(meta))
+
+    return None
+
+
+def price_european_multi(
+    options: Sequence[EuropeanOption],
+    model: BlackScholesModel,
+    market: Market,
+    *,
+    cfg: MCConfig,
+) -> list[PriceResult]:
+    """Price several European options (e.g. a strike chain) on one set of paths.
+
+    Options needing simulation must share an expiry. The draws and the
+    terminal spots S_T are generated once and every option's payoff is
+    evaluated on them, so the RNG and exp cost is paid once for the whole
+    chain (the options' estimates are correlated through the shared paths).
+    T == 0 and sigma == 0 cases are priced exactly as in ``price_european``.
+    """
+    _validate_config(cfg)
+    meta = _meta(cfg)
+
+    results: list[PriceResult | None] = [
+        _price_degenerate(opt, model, market, meta) for opt in options
+    ]
+    pending = [i for i, res in enumerate(results) if res is None]
+    if pending:
+        chain = [options[i] for i in pending]
+        if len({opt.expiry for opt in chain}) != 1:
+            raise InvalidInputError("options priced on one set of MC paths must share an expiry")
+
+        values, stderrs = _chain_estimates(
+            _normals(cfg),
+            np.array([opt.strike for opt in chain], dtype=float),
+            np.array([opt.kind == "call" for opt in chain]),
+            cfg,
+            model.sigma,
+            market,
+            chain[0].expiry,
+        )
+        if cfg.rng_kind == "sobol":
+            stderrs[:] = np.nan
+        for i, value, stderr in zip(pending, values, stderrs):
+            results[i] = PriceResult(value=float(value), stderr=float(stderr), meta=dict(meta))
+
+    return [res for res in results if res is not None]
+
 
-    pv = df_r * payoff
-    value = float(np.mean(pv))
-    stderr = float(np.std(pv, ddof=1) / math.sqrt(cfg.n_paths))
+# Upper bound on (strikes x paths) elements per payoff block on the NumPy path.
+_CHAIN_BLOCK_ELEMS = 1 << 22
+
+
+def _chain_estimates(
+    z_t: np.ndarray,
+    k: np.ndarray,
+    is_call: np.ndarray,
+    cfg: MCConfig,
+    sigma: float,
+    market: Market,
+    t: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """MC value and stderr per strike/kind, all on the same terminal spots."""
+    s0 = market.spot
+    r, q, df_r = _curve_terms(market, t)
+    cv_mean = df_r * s0 * math.exp((r - q) * t)
+
+    f = z_t.dtype
+    s_t = _terminal_spots(
+        z_t,
+        np.array([s0]),
+        np.array([(r - q - 0.5 * sigma * sigma) * t]),
+        np.array([sigma * math.sqrt(t)]),
+        cfg.antithetic,
+    )[0]
+
+    value = np.empty(len(k))
+    stderr = np.empty(len(k))
+    if HAVE_NUMBA:
+        for j in range(len(k)):
+            moments = _payoff_moments_nb(s_t, k[j], df_r, cv_mean, is_call[j], cfg.antithetic)
+            value[j], stderr[j] = _estimate_from_moments(*moments, cfg.control_variate)
+        return value, stderr
+
+    # The control is the same for every strike: one (1, n_paths) row.
+    cv = np.multiply(df_r, s_t, dtype=np.float64)[None, :] if cfg.control_variate else None
+    block = max(1, _CHAIN_BLOCK_ELEMS // len(s_t))
+    for start in range(0, len(k), block):
+        rows = slice(start, start + block)
+        pv = np.subtract(s_t, k[rows].astype(f)[:, None])
+        pv *= np.where(is_call[rows], 1.0, -1.0).astype(f)[:, None]
+        np.maximum(pv, f.type(0.0), out=pv)
+        pv *= f.type(df_r)
+        value[rows], stderr[rows] = _estimate_rows(pv, cv, np.array([cv_mean]), cfg)
+    return value, stderr
+
+
+def _scenario_estimates(
+    z_t: np.ndarray,
+    option: EuropeanOption,
+    cfg: MCConfig,
+    *,
+    spot: np.ndarray,
+    rate: np.ndarray,
+    div: np.ndarray,
+    sigma: np.ndarray,
+    tau: np.ndarray,
+    df_r: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """MC value and stderr for a batch of parameter scenarios on the same draws.
+
+    Scenario i simulates S_T = spot[i] * exp((rate - div - sigma^2/2)*tau + sigma*sqrt(tau)*z_t)
+    (all evaluated at index i) and discounts with df_r[i]; every scenario
+    shares z_t (common random numbers). All times must be > 0. Paths are
+    simulated in z_t's precision; means and stderrs are accumulated in float64.
+    """
+    k = option.strike
+    is_call = option.kind == "call"
+    drift = (rate - div - 0.5 * sigma * sigma) * tau
+    vol = sigma * np.sqrt(tau)
+    # E[df_r * S_T] = S0 * df_q under the risk-neutral GBM being simulated.
+    cv_mean = df_r * spot * np.exp((rate - div) * tau)
+
+    if HAVE_NUMBA:
+        # One fused pass per distinct vol: payoffs are reduced to running sums
+        # in the kernel, never written out as path arrays.
+        value = np.empty(len(spot))
+        stderr = np.empty(len(spot))
+        scale = spot * np.exp(drift)
+        for v in np.unique(vol):
+            rows = np.flatnonzero(vol == v)
+            n, sums = _terminal_moments_nb(
+                scale[rows], k, df_r[rows], v, cv_mean[rows], z_t, is_call, cfg.antithetic
+            )
+            for i, row in zip(rows, sums):
+                value[i], stderr[i] = _estimate_from_moments(n, *row, cfg.control_variate)
+        return value, stderr
+
+    # The payoff is built in a single buffer with in-place ufuncs.
+    f = z_t.dtype
+    s_t = _terminal_spots(z_t, spot, drift, vol, cfg.antithetic)
+    if is_call:
+        pv = np.subtract(s_t, f.type(k))
+    else:
+        pv = np.subtract(f.type(k), s_t)
+    np.maximum(pv, f.type(0.0), out=pv)
+    pv *= df_r.astype(f)[:, None]
+
+    # The control (in float64) is only built when it is used.
+    cv = df_r[:, None] * s_t if cfg.control_variate else None
+    return _estimate_rows(pv, cv, cv_mean, cfg)
+
+
+def _terminal_spots(
+    z_t: np.ndarray,
+    spot: np.ndarray,
+    drift: np.ndarray,
+    vol: np.ndarray,
+    antithetic: bool,
+) -> np.ndarray:
+    """S_T = spot * exp(drift + vol*z_t) per scenario row, shape (m, n_paths), in z_t's dtype.
+
+    Scenario constants are cast to the draws' precision so float32 runs stay
+    float32, and S_T is built in one buffer with in-place ufuncs. The drift is
+    absorbed into the scale spot*exp(drift), so exp(vol*z_t) is evaluated once
+    per distinct vol and every other row sharing that vol is a rescaled copy.
+    For antithetic draws (second half = -first half) the mirrored spots are
+    scale^2 / S_T, so only half the exps are evaluated.
+    """
+    f = z_t.dtype
+    n = len(z_t)
+    h = n // 2 if antithetic else n
+    scale = spot * np.exp(drift)
+    vol_f = vol.astype(f)
+    s_t = np.empty((len(spot), n), dtype=f)
+    first = s_t[:, :h]
+    # Per row, the first row with the same vol (whose exp row is shared).
+    first_of: dict = {}
+    source = [first_of.setdefault(v, i) for i, v in enumerate(vol_f)]
+    for i, j in enumerate(source):
+        if j == i:
+            np.multiply(vol_f[i], z_t[:h], out=first[i])
+            np.exp(first[i], out=first[i])
+    for i, j in enumerate(source):
+        if j != i:
+            np.multiply(first[j], f.type(scale[i]), out=first[i])
+    for i, j in enumerate(source):
+        if j == i:
+            first[i] *= f.type(scale[i])
+    if antithetic:
+        np.divide((scale * scale).astype(f)[:, None], first, out=s_t[:, h:])
+    return s_t
+
+
+def _estimate_rows(
+    pv: np.ndarray,
+    cv: np.ndarray | None,
+    cv_mean: np.ndarray,
+    cfg: MCConfig,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Value and stderr per row of discounted payoffs pv (shape (m, n_paths)).
 
-    return PriceResult(value=value, stderr=stderr, meta=meta)
+    cv is the control per row, shape (m, n_paths) or (1, n_paths) when shared
+    by every row, with known means cv_mean; None when the control variate is off.
+    """
+    if cfg.antithetic:
+        # Pair averages are i.i.d.; the stderr must be computed over them.
+        half = pv.shape[1] // 2
+        pv = 0.5 * (pv[:, :half] + pv[:, half:])
+        if cv is not None:
+            cv = 0.5 * (cv[:, :half] + cv[:, half:])
+    if cv is not None:
+        pv = pv.astype(np.float64, copy=False)
+        cv_centered = cv - cv_mean[:, None]
+        cv_var = np.sum(cv_centered * cv_centered, axis=1)
+        cov = np.sum((pv - pv.mean(axis=1, keepdims=True)) * cv_centered, axis=1)
+        beta = np.divide(cov, cv_var, out=np.zeros_like(cov), where=cv_var > 0.0)
+        pv = pv - beta[:, None] * cv_centered
+
+    value = np.mean(pv, axis=1, dtype=np.float64)
+    stderr = np.std(pv, axis=1, ddof=1, dtype=np.float64) / math.sqrt(pv.shape[1])
+    return value, stderr
+
+
+def _estimate_from_moments(
+    n: int,
+    s_pv: float,
+    s_pv2: float,
+    s_cv: float,
+    s_cv2: float,
+    s_pvcv: float,
+    control_variate: bool,
+) -> tuple[float, float]:
+    """Value and stderr from streamed sums of pv, the centered control cv, and their products.
+
+    Same estimator as the array path: with the control variate,
+    beta = sum((pv - mean pv) * cv) / sum(cv^2) and the samples are pv - beta*cv.
+    """
+    mean = s_pv / n
+    var = (s_pv2 - s_pv * mean) / (n - 1)
+    if control_variate and s_cv2 > 0.0:
+        cov = s_pvcv - mean * s_cv
+        beta = cov / s_cv2
+        mean -= beta * s_cv / n
+        var += (beta * beta * (s_cv2 - s_cv * s_cv / n) - 2.0 * beta * cov) / (n - 1)
+    return mean, math.sqrt(max(var, 0.0) / n)
 
 
 def greeks_european(
@@ -101,14 +542,12 @@ def greeks_european(
     cfg: MCConfig,
     bumps: dict[str, float] | None = None,
 ) -> GreeksResult:
-    if cfg.n_paths < 2:
-        raise InvalidInputError("n_paths must be >= 2 for MC stderr with ddof=1")
-    if cfg.n_steps < 1:
-        raise InvalidInputError("n_steps must be >= 1")
+    _validate_config(cfg)
 
     s0 = market.spot
     t = option.expiry
     sigma = model.sigma
+    r, q, df_base = _curve_terms(market, t)
 
     def _bump(name: str, default: float) -> float:
         if bumps is None or name not in bumps:
@@ -132,6 +571,11 @@ def greeks_european(
         "n_paths": cfg.n_paths,
         "n_steps": cfg.n_steps,
         "seed": cfg.seed,
+        "antithetic": cfg.antithetic,
+        "control_variate": cfg.control_variate,
+        "dtype": "float64",
+        "n_workers": cfg.n_workers,
+        "rng_kind": cfg.rng_kind,
         "fd": "central",
         "bumps": {"spot": dS, "sigma": dsigma, "r": dr},
     }
@@ -147,89 +591,54 @@ def greeks_european(
             meta=meta,
         )
 
-    def _price(mkt: Market, mdl: BlackScholesModel) -> float:
-        return price_european(option, mdl, mkt, cfg=cfg).value
-
-    base = _price(market, model)
-
-    def _price_spot(spot: float) -> float:
-        mkt = Market(
-            spot=spot,
-            rate_curve=market.rate_curve,
-            dividend_curve=market.dividend_curve,
-        )
-        return _price(mkt, model)
-
-    value_up = _price_spot(s0 + dS)
-    value_dn = _price_spot(s0 - dS)
-
-    delta = (value_up - value_dn) / (2.0 * dS)
-    gamma = (value_up - 2.0 * base + value_dn) / (dS * dS)
-
-    if sigma == 0.0:
-        vega = 0.0
-    else:
-        model_up = BlackScholesModel(sigma=sigma + dsigma)
-        model_dn = BlackScholesModel(sigma=sigma - dsigma)
-        value_up = _price(market, model_up)
-        value_dn = _price(market, model_dn)
-        vega = (value_up - value_dn) / (2.0 * dsigma)
-
-    r = market.rate(t)
-    q = market.dividend_yield(t)
-
-    def _price_rate(rate: float) -> float:
-        mkt = Market(
-            spot=s0,
-            rate_curve=FlatRateCurve(rate, allow_negative=True),
-            dividend_curve=FlatDividendCurve(q, allow_negative=True),
-        )
-        return _price(mkt, model)
-
-    value_up = _price_rate(r + dr)
-    value_dn = _price_rate(r - dr)
-    rho = (value_up - value_dn) / (2.0 * dr)
-
-    # Theta implementation via finite difference (backward or central)
-    # We use backward diff (V(t) - V(t-dt))/dt to avoid looking into the future
-    # which might exceed expiry if we used forward diff, though t+dt is usually fine.
-    # However, for Theta, we explicitly want -dV/dt.
-    
-    # We'll use a simple approach: if t is large enough, bump time backwards.
-    # If t is too close to 0, bump forward?
-    # Actually, standard definition Theta = -dV/dt.
-    # Approximation: -(V(t + dt) - V(t)) / dt  (forward diff in time)
-    # Or: -(V(t) - V(t - dt)) / dt (backward diff in time)
-    
-    # Let's use Backward Diff: Theta ~ (V(t - dt) - V(t)) / dt
-    # This corresponds to "passage of time" reducing time-to-expiry.
-    # New expiry t' = t - dt.
-    
+    # Theta is a backward difference in time to expiry: (V(t - dt) - V(t)) / dt,
+    # i.e. the value change from the passage of time.
     dt = _bump("time", min(1e-4, t / 2.0))
     # Safety: ensure we don't go negative or too small
     if t <= dt:
-         dt = t * 0.5
-
-    def _price_time_shifted(new_t: float) -> float:
-        # We need to construct a new option with modified expiry
-        # OR just call price_european with a modified option.
-        # However, option is immutable (frozen).
-        # We can use dataclasses.replace
-        from dataclasses import replace
-        new_opt = replace(option, expiry=new_t)
-        return price_european(new_opt, model, market, cfg=cfg).value
-
-    # Calculate V(t-dt)
-    # Note: price_european handles t=0 logic if dt~t
-    val_minus = _price_time_shifted(t - dt)
-    
-    # Theta = (val_minus - base) / dt
-    # Explain: 
-    #   V(t_now) = base (time to expiry T)
-    #   V(t_later) = val_minus (time to expiry T - dt)
-    #   Theta approx (V(t_later) - V(t_now)) / dt
-    #   = (val_minus - base) / dt
-    theta = (val_minus - base) / dt
+        dt = t * 0.5
+    t_dn = t - dt
+    r_dn, q_dn, df_dn = _curve_terms(market, t_dn)
+
+    # Every bump is a scenario on the same draws (common random numbers), priced
+    # together in one batch: base, spot +/-, sigma +/-, rate +/-, t - dt.
+    # Rate bumps shift the flat zero rate at t; the time bump reads the curves at t - dt.
+    sig_dn = max(sigma - dsigma, 0.0)
+    spot = np.array([s0, s0 + dS, s0 - dS, s0, s0, s0, s0, s0])
+    rate = np.array([r, r, r, r, r, r + dr, r - dr, r_dn])
+    div = np.array([q, q, q, q, q, q, q, q_dn])
+    vols = np.array([sigma, sigma, sigma, sigma + dsigma, sig_dn, sigma, sigma, sigma])
+    tau = np.array([t, t, t, t, t, t, t, t_dn])
+    df_r = np.array(
+        [
+            df_base,
+            df_base,
+            df_base,
+            df_base,
+            df_base,
+            math.exp(-(r + dr) * t),
+            math.exp(-(r - dr) * t),
+            df_dn,
+        ]
+    )
+    values, _ = _scenario_estimates(
+        _normals(cfg, "float64"),
+        option,
+        cfg,
+        spot=spot,
+        rate=rate,
+        div=div,
+        sigma=vols,
+        tau=tau,
+        df_r=df_r,
+    )
+    base, s_up, s_dn, v_up, v_dn, r_up, r_dn, t_shift = (float(x) for x in values)
+
+    delta = (s_up - s_dn) / (2.0 * dS)
+    gamma = (s_up - 2.0 * base + s_dn) / (dS * dS)
+    vega = 0.0 if sigma == 0.0 else (v_up - v_dn) / (2.0 * dsigma)
+    rho = (r_up - r_dn) / (2.0 * dr)
+    theta = (t_shift - base) / dt
 
     return GreeksResult(
         delta=delta,
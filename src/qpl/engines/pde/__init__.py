@@ -0,0 +1,15 @@
+from .pricers import (
+    PDEConfig,
+    greeks_european,
+    greeks_european_multi,
+    price_european,
+    price_european_multi,
+)
+
+__all__ = [
+    "PDEConfig",
+    "greeks_european",
+    "greeks_european_multi",
+    "price_european",
+    "price_european_multi",
+]
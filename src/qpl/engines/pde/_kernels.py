@@ -0,0 +1,185 @@
+"""
+Numba kernels for the PDE engine.
+
+Only used when Numba is installed (``qpl._jit.HAVE_NUMBA``); otherwise the
+solver assembles the right-hand side with NumPy and calls LAPACK ``gtsv``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..._jit import njit
+
+
+@njit(cache=True)
+def _thomas_factor_nb(
+    lower: np.ndarray,
+    diag: np.ndarray,
+    upper: np.ndarray,
+    c_prime: np.ndarray,
+    inv_denom: np.ndarray,
+) -> None:
+    """Forward-sweep factors of the tridiagonal operator, shared by every column and step.
+
+    The operator only changes when (r, q) does, so the divisions of the Thomas
+    forward sweep are done once here and each solve is multiply-adds only.
+    """
+    m = diag.shape[0]
+    inv_denom[0] = 1.0 / diag[0]
+    c_prime[0] = upper[0] * inv_denom[0]
+    for i in range(1, m):
+        inv_denom[i] = 1.0 / (diag[i] - lower[i] * c_prime[i - 1])
+        c_prime[i] = upper[i] * inv_denom[i]
+
+
+@njit(cache=True)
+def _theta_step_nb(
+    v: np.ndarray,
+    expl_a: np.ndarray,
+    expl_b: np.ndarray,
+    expl_c: np.ndarray,
+    lower: np.ndarray,
+    c_prime: np.ndarray,
+    inv_denom: np.ndarray,
+    lower_0: float,
+    upper_n: float,
+    v0_np1: np.ndarray,
+    vmax_np1: np.ndarray,
+    d_buf: np.ndarray,
+) -> None:
+    """One theta-scheme step on v (shape (n_s + 1, n_cols)), in place.
+
+    For each column this assembles the explicit right-hand side, folds in the
+    new boundary values, and runs the Thomas sweeps against the factors from
+    ``_thomas_factor_nb``; the boundary rows of v must hold the old-time values
+    on entry and hold the new ones on exit.
+    """
+    m = expl_b.shape[0]
+    for j in range(v.shape[1]):
+        for i in range(m):
+            d_buf[i] = expl_a[i] * v[i, j] + expl_b[i] * v[i + 1, j] + expl_c[i] * v[i + 2, j]
+        d_buf[0] -= lower_0 * v0_np1[j]
+        d_buf[m - 1] -= upper_n * vmax_np1[j]
+
+        d_prev = d_buf[0] * inv_denom[0]
+        d_buf[0] = d_prev
+        for i in range(1, m):
+            d_prev = (d_buf[i] - lower[i] * d_prev) * inv_denom[i]
+            d_buf[i] = d_prev
+
+        x_next = d_buf[m - 1]
+        v[m, j] = x_next
+        for i in range(m - 2, -1, -1):
+            x_next = d_buf[i] - c_prime[i] * x_next
+            v[i + 1, j] = x_next
+        v[0, j] = v0_np1[j]
+        v[m + 1, j] = vmax_np1[j]
+
+
+@njit(cache=True)
+def _theta_operator_nb(
+    diffusion: np.ndarray,
+    convection: np.ndarray,
+    r: float,
+    q: float,
+    theta: float,
+    dt: float,
+    lower: np.ndarray,
+    diag: np.ndarray,
+    upper: np.ndarray,
+    expl_a: np.ndarray,
+    expl_b: np.ndarray,
+    expl_c: np.ndarray,
+) -> tuple[float, float]:
+    """Fill the implicit (lower/diag/upper) and explicit (expl_*) operator rows for one (r, q).
+
+    Same arithmetic as the NumPy assembly in ``_solve_grid``. The rows' first
+    lower and last upper entries couple to the boundaries; they are returned
+    as ``(lower_0, upper_n)`` and zeroed in the rows.
+    """
+    m = diag.shape[0]
+    imp = -theta * dt
+    exp_ = (1.0 - theta) * dt
+    for i in range(m):
+        drift = convection[i] * (r - q)
+        a = diffusion[i] - drift
+        b = diffusion[i] * -2.0 - r
+        c = diffusion[i] + drift
+        lower[i] = a * imp
+        diag[i] = b * imp + 1.0
+        upper[i] = c * imp
+        expl_a[i] = a * exp_
+        expl_b[i] = b * exp_ + 1.0
+        expl_c[i] = c * exp_
+    lower_0 = lower[0]
+    upper_n = upper[m - 1]
+    lower[0] = 0.0
+    upper[m - 1] = 0.0
+    return lower_0, upper_n
+
+
+@njit(cache=True)
+def _theta_march_nb(
+    v: np.ndarray,
+    diffusion: np.ndarray,
+    convection: np.ndarray,
+    rates: np.ndarray,
+    divs: np.ndarray,
+    v_lo: np.ndarray,
+    v_hi: np.ndarray,
+    theta: float,
+    dt: float,
+) -> None:
+    """Run every theta-scheme step on v in place, from the terminal values to t = 0.
+
+    ``rates``/``divs`` hold (r, q) per step and ``v_lo``/``v_hi`` the boundary
+    values per time level (shape (n_t + 1, n_cols)). The operator is rebuilt
+    and refactored only when (r, q) changes, so flat curves build it once; the
+    whole march is one compiled call with no per-step Python dispatch.
+    """
+    m = diffusion.shape[0]
+    lower = np.empty(m)
+    diag = np.empty(m)
+    upper = np.empty(m)
+    expl_a = np.empty(m)
+    expl_b = np.empty(m)
+    expl_c = np.empty(m)
+    c_prime = np.empty(m)
+    inv_denom = np.empty(m)
+    d_buf = np.empty(m)
+    lower_0 = 0.0
+    upper_n = 0.0
+    for n in range(rates.shape[0]):
+        v[0] = v_lo[n]
+        v[m + 1] = v_hi[n]
+        if n == 0 or rates[n] != rates[n - 1] or divs[n] != divs[n - 1]:
+            lower_0, upper_n = _theta_operator_nb(
+                diffusion,
+                convection,
+                rates[n],
+                divs[n],
+                theta,
+                dt,
+                lower,
+                diag,
+                upper,
+                expl_a,
+                expl_b,
+                expl_c,
+            )
+            _thomas_factor_nb(lower, diag, upper, c_prime, inv_denom)
+        _theta_step_nb(
+            v,
+            expl_a,
+            expl_b,
+            expl_c,
+            lower,
+            c_prime,
+            inv_denom,
+            lower_0,
+            upper_n,
+            v_lo[n + 1],
+            v_hi[n + 1],
+            d_buf,
+        )
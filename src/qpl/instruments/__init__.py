@@ -1,4 +1,4 @@
-from .options import EuropeanOption
+from .options import EuropeanOption, EuropeanOptionChain, OptionKind
 from .payoffs import call_payoff, put_payoff
 
-__all__ = ["EuropeanOption", "call_payoff", "put_payoff"]
+__all__ = ["EuropeanOption", "EuropeanOptionChain", "OptionKind", "call_payoff", "put_payoff"]
@@ -0,0 +1,47 @@
+"""
+Scalar payoff kernels compiled with Numba when it is available.
+
+Engines call these from their own jitted loops; Python callers use
+``call_payoff`` / ``put_payoff``, whose array path runs the ufuncs below.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from .._jit import njit, vectorize
+
+
+@njit(fastmath=True, cache=True)
+def _vanilla_payoff_nb(s: float, k: float, is_call: bool) -> float:
+    """max(s - k, 0) for calls, max(k - s, 0) for puts."""
+    if is_call:
+        return max(s - k, 0.0)
+    return max(k - s, 0.0)
+
+
+# max(d, 0) via equality tests only (|d| == d holds for d >= 0 and +inf;
+# d != d for NaN): ordered compares raise NumPy's "invalid value" warning on
+# NaN spots, which must propagate quietly, and infinities match np.maximum.
+def _call_payoff_elem(s: float, k: float) -> float:
+    d = s - k
+    return d if (abs(d) == d) | (d != d) else 0.0
+
+
+def _put_payoff_elem(s: float, k: float) -> float:
+    d = k - s
+    return d if (abs(d) == d) | (d != d) else 0.0
+
+
+@lru_cache(maxsize=None)
+def _payoff_ufuncs() -> tuple[np.ufunc, np.ufunc]:
+    """(call, put) array payoffs as fused one-pass NumPy ufuncs (needs Numba).
+
+    Subtract and floor run per element instead of as two full-array NumPy
+    ops. Built on first use: compiling (or loading) them costs about as much
+    as importing the rest of the package.
+    """
+    build = vectorize(["float64(float64, float64)", "float32(float32, float32)"], cache=True)
+    return build(_call_payoff_elem).ufunc, build(_put_payoff_elem).ufunc
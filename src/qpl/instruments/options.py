@@ -1,24 +1,88 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from enum import IntEnum
+from typing import Literal, Sequence, Union
+
+import numpy as np
 
 from ..exceptions import InvalidInputError
 
 
 
-@dataclass(frozen=True)
+class OptionKind(IntEnum):
+    """Integer-coded option type (the sign of the payoff)."""
+
+    CALL = 1
+    PUT = -1
+
+
+def _is_call_kind(kind: Union[str, OptionKind]) -> bool:
+    """Parse ``"call"``/``"put"`` (any case) or an ``OptionKind`` once at the API boundary."""
+    # Canonical spellings and enum members skip the lower() + set lookup.
+    if kind == "call" or kind is OptionKind.CALL:
+        return True
+    if kind == "put" or kind is OptionKind.PUT:
+        return False
+    kind_l = kind.lower() if isinstance(kind, str) else None
+    if kind_l not in {"call", "put"}:
+        raise InvalidInputError("kind must be 'call' or 'put'")
+    return kind_l == "call"
+
+
+@dataclass(frozen=True, slots=True)
 class EuropeanOption:
     kind: Literal["call", "put"]
     strike: float
     expiry: float
 
     def __post_init__(self) -> None:
-        kind_l = self.kind.lower()
-        if kind_l not in {"call", "put"}:
-            raise InvalidInputError("kind must be 'call' or 'put'")
+        is_call = _is_call_kind(self.kind)
         if self.strike <= 0:
             raise InvalidInputError("strike must be > 0")
         if self.expiry < 0:
             raise InvalidInputError("expiry must be >= 0")
-        object.__setattr__(self, "kind", kind_l)
+        object.__setattr__(self, "kind", "call" if is_call else "put")
+
+
+
+@dataclass(frozen=True, eq=False)
+class EuropeanOptionChain:
+    """A strip of European options stored as parallel arrays.
+
+    ``strikes``, ``expiries`` and ``is_call`` broadcast to one 1-D length, so a
+    whole chain is priced in one vectorized call instead of one
+    ``EuropeanOption`` at a time. The arrays are copied and made read-only.
+    """
+
+    strikes: np.ndarray
+    expiries: np.ndarray
+    is_call: np.ndarray
+
+    def __post_init__(self) -> None:
+        strikes, expiries, is_call = np.broadcast_arrays(
+            np.asarray(self.strikes, dtype=float),
+            np.asarray(self.expiries, dtype=float),
+            np.asarray(self.is_call, dtype=bool),
+        )
+        if strikes.ndim != 1:
+            raise InvalidInputError("option chain arrays must be 1-D")
+        if np.any(strikes <= 0):
+            raise InvalidInputError("strike must be > 0")
+        if np.any(expiries < 0):
+            raise InvalidInputError("expiry must be >= 0")
+        for name, arr in (("strikes", strikes), ("expiries", expiries), ("is_call", is_call)):
+            arr = arr.copy()
+            arr.flags.writeable = False
+            object.__setattr__(self, name, arr)
+
+    @classmethod
+    def from_options(cls, options: Sequence[EuropeanOption]) -> EuropeanOptionChain:
+        return cls(
+            strikes=np.array([o.strike for o in options], dtype=float),
+            expiries=np.array([o.expiry for o in options], dtype=float),
+            is_call=np.array([o.kind == "call" for o in options], dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.strikes)
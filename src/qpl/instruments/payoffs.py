@@ -1,28 +1,58 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Optional, Union
 import numpy as np
 
+from .._jit import HAVE_NUMBA
+from ._kernels import _payoff_ufuncs
+
 ArrayLike = Union[float, int, np.ndarray]
 
 
-def call_payoff(S: ArrayLike, K: float) -> ArrayLike:
+def _payoff_buffer(S_arr: np.ndarray, K: float, out: Optional[np.ndarray]) -> np.ndarray:
+    # S's precision is kept (float32 stays float32); integer spots promote to float.
+    if out is None:
+        out = np.empty(S_arr.shape, dtype=np.result_type(S_arr, K, 0.0))
+    return out
+
+
+def call_payoff(S: ArrayLike, K: float, out: Optional[np.ndarray] = None) -> ArrayLike:
     """
     European call payoff: max(S - K, 0)
 
-    Supports scalar or numpy array S.
+    Supports scalar or numpy array S. Scalars take a pure-Python path and
+    return a float (NaN propagates, as for arrays). For arrays the payoff is
+    built in one buffer: one fused pass with Numba, else subtract then max in
+    place; pass ``out`` to reuse a preallocated buffer across calls.
     """
+    if out is None and (isinstance(S, (int, float)) or np.isscalar(S)):
+        diff = S - K
+        return 0.0 if diff <= 0.0 else float(diff)
     S_arr = np.asarray(S)
-    out = np.maximum(S_arr - K, 0.0)
-    return out.item() if np.isscalar(S) else out
+    out = _payoff_buffer(S_arr, K, out)
+    if HAVE_NUMBA:
+        return _payoff_ufuncs()[0](S_arr, K, out=out)
+    np.subtract(S_arr, K, out=out)
+    np.maximum(out, 0.0, out=out)
+    return out
 
 
-def put_payoff(S: ArrayLike, K: float) -> ArrayLike:
+def put_payoff(S: ArrayLike, K: float, out: Optional[np.ndarray] = None) -> ArrayLike:
     """
     European put payoff: max(K - S, 0)
 
-    Supports scalar or numpy array S.
+    Supports scalar or numpy array S. Scalars take a pure-Python path and
+    return a float (NaN propagates, as for arrays). For arrays the payoff is
+    built in one buffer: one fused pass with Numba, else subtract then max in
+    place; pass ``out`` to reuse a preallocated buffer across calls.
     """
+    if out is None and (isinstance(S, (int, float)) or np.isscalar(S)):
+        diff = K - S
+        return 0.0 if diff <= 0.0 else float(diff)
     S_arr = np.asarray(S)
-    out = np.maximum(K - S_arr, 0.0)
-    return out.item() if np.isscalar(S) else out
+    out = _payoff_buffer(S_arr, K, out)
+    if HAVE_NUMBA:
+        return _payoff_ufuncs()[1](S_arr, K, out=out)
+    np.subtract(K, S_arr, out=out)
+    np.maximum(out, 0.0, out=out)
+    return out
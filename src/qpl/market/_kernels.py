@@ -0,0 +1,155 @@
+"""
+Return-statistics kernels compiled with Numba when it is available.
+
+For the short return windows of rolling calibration, NumPy's per-call dispatch
+costs more than the arithmetic; ``stats`` uses these below a size threshold
+when ``qpl._jit.HAVE_NUMBA`` is set and NumPy reductions otherwise. The rolling
+variance kernel replaces several full-length NumPy temporaries with one loop and
+is used at every size.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .._jit import njit, prange
+
+
+@njit(cache=True)
+def _welford_nb(r: np.ndarray) -> tuple[float, float]:
+    """One-pass (Welford) mean and sum of squared deviations ``M2`` of r."""
+    mean = 0.0
+    m2 = 0.0
+    for i in range(r.shape[0]):
+        d = r[i] - mean
+        mean += d / (i + 1)
+        m2 += d * (r[i] - mean)
+    return mean, m2
+
+
+@njit(cache=True)
+def _rolling_var_nb(r: np.ndarray, window: int, demean: bool) -> np.ndarray:
+    """Variance of every length-``window`` slice of r.
+
+    Between exact two-pass recomputations, one every ``window`` steps, each
+    step swaps the oldest return for the newest with a fixed-count update (no
+    division chain), so rounding drift never spans more than one window.
+    Windows holding a NaN are NaN; ``demean=False`` gives the mean square over
+    ``window - 1`` (min 1).
+    """
+    out = np.empty(r.shape[0] - window + 1)
+    denom = window - 1 if window > 1 else 1
+    inv_w = 1.0 / window
+    mean = 0.0
+    m2 = 0.0
+    n_nan = 0
+    for i in range(window - 1, r.shape[0]):
+        if (i + 1) % window == 0:
+            mean = 0.0
+            m2 = 0.0
+            n_nan = 0
+            for j in range(i - window + 1, i + 1):
+                x = r[j]
+                x_nan = np.isnan(x)
+                n_nan += x_nan
+                mean += 0.0 if x_nan else x
+            mean *= inv_w
+            for j in range(i - window + 1, i + 1):
+                x = 0.0 if np.isnan(r[j]) else r[j]
+                d = x - mean if demean else x
+                m2 += d * d
+        else:
+            # NaNs enter as 0.0: their windows are blanked, and the exact
+            # swap keeps later windows right once the NaN has left.
+            x = r[i]
+            y = r[i - window]
+            x_nan = np.isnan(x)
+            y_nan = np.isnan(y)
+            x = 0.0 if x_nan else x
+            y = 0.0 if y_nan else y
+            n_nan += np.int64(x_nan) - np.int64(y_nan)
+            d = x - y
+            if demean:
+                new_mean = mean + d * inv_w
+                m2 += d * (x - new_mean + y - mean)
+                mean = new_mean
+            else:
+                m2 += d * (x + y)
+        if n_nan > 0 or (demean and window == 1):
+            out[i - window + 1] = np.nan
+        else:
+            out[i - window + 1] = max(m2, 0.0) / denom
+    return out
+
+
+# Assets per tile in the panel kernel: a tile is a contiguous (T, 8) copy of
+# eight assets, so every time step updates 8 adjacent accumulators (8 float32
+# or 2x4 float64 AVX2 lanes) with a fixed trip count.
+_PANEL_BLOCK = 8
+
+
+@njit(cache=True)
+def _rolling_var_tile_nb(tile: np.ndarray, window: int, demean: bool, out: np.ndarray) -> None:
+    """``_rolling_var_nb`` down the ``_PANEL_BLOCK`` columns of tile, into out."""
+    denom = window - 1 if window > 1 else 1
+    inv_w = 1.0 / window
+    mean = np.zeros(_PANEL_BLOCK)
+    m2 = np.zeros(_PANEL_BLOCK)
+    n_nan = np.zeros(_PANEL_BLOCK, dtype=np.int64)
+    for i in range(window - 1, tile.shape[0]):
+        if (i + 1) % window == 0:
+            mean[:] = 0.0
+            m2[:] = 0.0
+            n_nan[:] = 0
+            for j in range(i - window + 1, i + 1):
+                for k in range(_PANEL_BLOCK):
+                    x = tile[j, k]
+                    x_nan = np.isnan(x)
+                    n_nan[k] += x_nan
+                    mean[k] += 0.0 if x_nan else x
+            for k in range(_PANEL_BLOCK):
+                mean[k] *= inv_w
+            for j in range(i - window + 1, i + 1):
+                for k in range(_PANEL_BLOCK):
+                    x = 0.0 if np.isnan(tile[j, k]) else tile[j, k]
+                    d = x - mean[k] if demean else x
+                    m2[k] += d * d
+        else:
+            for k in range(_PANEL_BLOCK):
+                x = tile[i, k]
+                y = tile[i - window, k]
+                x_nan = np.isnan(x)
+                y_nan = np.isnan(y)
+                x = 0.0 if x_nan else x
+                y = 0.0 if y_nan else y
+                n_nan[k] += np.int64(x_nan) - np.int64(y_nan)
+                d = x - y
+                if demean:
+                    new_mean = mean[k] + d * inv_w
+                    m2[k] += d * (x - new_mean + y - mean[k])
+                    mean[k] = new_mean
+                else:
+                    m2[k] += d * (x + y)
+        for k in range(_PANEL_BLOCK):
+            blank = n_nan[k] > 0 or (demean and window == 1)
+            out[i - window + 1, k] = np.nan if blank else max(m2[k], 0.0) / denom
+
+
+@njit(parallel=True, cache=True)
+def _rolling_var_panel_nb(r: np.ndarray, window: int, demean: bool) -> np.ndarray:
+    """Rolling variance down every column of a (T, N) panel.
+
+    Tiles of ``_PANEL_BLOCK`` assets run in parallel, the last one zero-padded.
+    """
+    n_t, n_assets = r.shape
+    out = np.empty((n_t - window + 1, n_assets))
+    n_blocks = (n_assets + _PANEL_BLOCK - 1) // _PANEL_BLOCK
+    for b in prange(n_blocks):
+        lo = b * _PANEL_BLOCK
+        hi = min(lo + _PANEL_BLOCK, n_assets)
+        tile = np.zeros((n_t, _PANEL_BLOCK), dtype=r.dtype)
+        tile[:, : hi - lo] = r[:, lo:hi]
+        tile_out = np.empty((n_t - window + 1, _PANEL_BLOCK))
+        _rolling_var_tile_nb(tile, window, demean, tile_out)
+        out[:, lo:hi] = tile_out[:, : hi - lo]
+    return out
@@ -3,11 +3,13 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..exceptions import InvalidInputError
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlatRateCurve:
     rate: float
     allow_negative: bool = False
@@ -21,9 +23,14 @@ class FlatRateCurve:
             raise InvalidInputError("t must be >= 0")
         return math.exp(-self.rate * t)
 
+    def df_array(self, t: np.ndarray) -> np.ndarray:
+        """Discount factors for an array of times (e.g. a time grid) in one np.exp."""
+        t = _check_times(t)
+        return np.exp(-self.rate * t)
+
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlatDividendCurve:
     yield_: float
     allow_negative: bool = False
@@ -36,3 +43,15 @@ class FlatDividendCurve:
         if t < 0:
             raise InvalidInputError("t must be >= 0")
         return math.exp(-self.yield_ * t)
+
+    def df_array(self, t: np.ndarray) -> np.ndarray:
+        """Discount factors for an array of times (e.g. a time grid) in one np.exp."""
+        t = _check_times(t)
+        return np.exp(-self.yield_ * t)
+
+
+def _check_times(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    if np.any(t < 0):
+        raise InvalidInputError("t must be >= 0")
+    return t
@@ -4,8 +4,12 @@ Market data retrieval with local caching.
 
 import os
 import hashlib
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, Optional, Sequence
 import pandas as pd
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
 import yfinance as yf
 
 # Common interval alias mapping to standardized filename part
@@ -14,6 +18,148 @@ INTERVAL_ALIASES = {
     "daily": "1d"
 }
 
+def _cache_is_fresh(cache_path: str, end: str) -> bool:
+    """
+    A cached window is final once its end date is in the past. If the window
+    reaches today (or later), data written before today may be missing the
+    latest sessions, so it is refreshed once per day.
+    """
+    if pd.Timestamp(end).date() < date.today():
+        return True
+    written = datetime.fromtimestamp(os.path.getmtime(cache_path)).date()
+    return written >= date.today()
+
+
+def _read_cache(cache_path: str, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    """
+    Load a cached frame. With ``columns``, only those Arrow columns (plus the
+    stored index) are read from disk, and the table is handed to pandas
+    without keeping a second copy alive.
+    """
+    if columns is None:
+        return feather.read_feather(cache_path, use_threads=True)
+    with ipc.open_file(cache_path) as reader:
+        schema = reader.schema
+    meta = schema.pandas_metadata or {}
+    index_fields = [c for c in meta.get("index_columns", []) if isinstance(c, str)]
+    # Unknown names are left for _select to report; refetching would not add them.
+    wanted = [c for c in columns if c in schema.names and c not in index_fields]
+    table = feather.read_table(cache_path, columns=[*wanted, *index_fields], use_threads=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _select(df: pd.DataFrame, columns: Optional[Sequence[str]], ticker: str) -> pd.DataFrame:
+    if columns is None:
+        return df
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"Data for {ticker} has no columns {missing}")
+    return df[list(columns)]
+
+
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    # Prices fit float32's ~7 significant digits; integer columns (Volume)
+    # would not, so only float columns are narrowed.
+    floats = df.select_dtypes(include="float64").columns
+    return df.astype({c: "float32" for c in floats})
+
+
+def _cache_path(
+    ticker: str,
+    start: str,
+    end: str,
+    source: str,
+    interval: str,
+    cache_dir: str,
+    cache_columns: Optional[Sequence[str]],
+    float32: bool,
+) -> str:
+    # Create deterministic cache filename
+    # We hash the inputs to handle special characters in tickers/dates safely.
+    # The key only names a local file, so a short blake2b digest is enough
+    # (and, unlike MD5, is not rejected by FIPS-mode OpenSSL builds).
+    key_str = f"{source}_{ticker}_{start}_{end}_{interval}"
+    if cache_columns is not None:
+        key_str += "_cols=" + ",".join(cache_columns)
+    if float32:
+        key_str += "_float32"
+    key_hash = hashlib.blake2b(key_str.encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(cache_dir, f"{ticker}_{key_hash}.feather")
+
+
+def _load_cached(
+    ticker: str,
+    cache_path: str,
+    end: str,
+    columns: Optional[Sequence[str]],
+) -> Optional[pd.DataFrame]:
+    """
+    Return the cached frame, or None if there is no usable cache entry.
+    """
+    if not (os.path.exists(cache_path) and _cache_is_fresh(cache_path, end)):
+        return None
+    try:
+        df = _read_cache(cache_path, columns)
+
+        # Restore frequency if possible (Arrow does not persist it)
+        if isinstance(df.index, pd.DatetimeIndex) and df.index.freq is None:
+            inferred_freq = pd.infer_freq(df.index)
+            if inferred_freq:
+                df.index.freq = inferred_freq
+
+        print(f"[MarketData] Loaded {ticker} from cache: {cache_path}")
+    except Exception as e:
+        print(f"[MarketData] Cache load failed, refetching. Error: {e}")
+        # If cache is corrupted, proceed to fetch
+        return None
+    return df
+
+
+def _normalize_download(df: pd.DataFrame, ticker: str, source: str) -> pd.DataFrame:
+    if df.empty:
+        raise IOError(f"No data found for {ticker} from {source}")
+
+    # Ensure we have a Close column
+    if "Close" not in df.columns:
+        # Fallback if auto_adjust failed to behave as expected
+        if "Adj Close" in df.columns:
+            df = df.rename(columns={"Adj Close": "Close"})
+        elif "Close" not in df.columns:
+             raise IOError(f"Data for {ticker} missing 'Close' column")
+
+    # Single-ticker downloads come back with (Price, Ticker) column levels;
+    # store flat names so cached columns can be read back by name.
+    if isinstance(df.columns, pd.MultiIndex) and df.columns.get_level_values(0).is_unique:
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
+def _store(
+    df: pd.DataFrame,
+    ticker: str,
+    cache_path: str,
+    cache_columns: Optional[Sequence[str]],
+    float32: bool,
+) -> pd.DataFrame:
+    # Only the columns callers need are cached (and read back) at all.
+    df = _select(df, cache_columns, ticker)
+    if float32:
+        df = _downcast_floats(df)
+
+    # 3. Save to cache
+    # Arrow IPC (Feather v2) keeps the index and column levels via the pandas
+    # metadata and reads back without parquet's page decoding. zstd level 3 is
+    # as fast as level 1 on price frames but a little smaller. Cached windows are
+    # read whole, so the default single record batch is kept; splitting into
+    # row groups only adds per-batch decode overhead.
+    try:
+        feather.write_feather(df, cache_path, compression="zstd", compression_level=3)
+    except Exception as e:
+        raise IOError(f"Failed to cache data for {ticker}: {e}")
+    print(f"[MarketData] Saved {ticker} to cache: {cache_path}")
+    return df
+
+
 def get_prices(
     ticker: str,
     start: str,
@@ -21,7 +167,10 @@ def get_prices(
     *,
     source: str = "yahoo",
     interval: str = "1d",
-    cache_dir: str = ".market_cache"
+    cache_dir: str = ".market_cache",
+    columns: Optional[Sequence[str]] = None,
+    cache_columns: Optional[Sequence[str]] = None,
+    float32: bool = False,
 ) -> pd.DataFrame:
     """
     Fetch historical prices for a ticker, using local disk cache if available.
@@ -39,7 +188,18 @@ def get_prices(
     interval : str, default "1d"
         Data interval (e.g. "1d").
     cache_dir : str, default ".market_cache"
-        Directory to store cached data files.
+        Directory to store cached data files. Cached windows ending today or
+        later are refetched once per day; past windows are reused as-is.
+    columns : sequence of str, optional
+        Columns to return (e.g. ``["Close"]``). On a cache hit only these
+        columns are read from disk.
+    cache_columns : sequence of str, optional
+        Columns to keep when a download is written to the cache (e.g.
+        ``["Close"]``). By default every downloaded column is cached. The
+        subset is part of the cache key, so different subsets do not collide.
+    float32 : bool, default False
+        Store float columns (prices) as float32, halving the cache size.
+        Also part of the cache key.
 
     Returns
     -------
@@ -49,7 +209,8 @@ def get_prices(
     Raises
     ------
     ValueError
-        If inputs are invalid or source is unsupported.
+        If inputs are invalid, source is unsupported, or requested columns
+        are not available.
     IOError
         If data cannot be fetched and is not in cache.
     """
@@ -61,29 +222,14 @@ def get_prices(
     # Ensure cache directory exists
     os.makedirs(cache_dir, exist_ok=True)
     
-    # Create deterministic cache filename
-    # We hash the inputs to handle special characters in tickers/dates safely
-    key_str = f"{source}_{ticker}_{start}_{end}_{interval}"
-    key_hash = hashlib.md5(key_str.encode("utf-8")).hexdigest()
-    cache_path = os.path.join(cache_dir, f"{ticker}_{key_hash}.parquet")
-    
+    cache_path = _cache_path(
+        ticker, start, end, source, interval, cache_dir, cache_columns, float32
+    )
+
     # 1. Try to load from cache
-    if os.path.exists(cache_path):
-        try:
-            df = pd.read_parquet(cache_path)
-            
-            # Restore frequency if possible (parquet does not persist it)
-            if isinstance(df.index, pd.DatetimeIndex) and df.index.freq is None:
-                inferred_freq = pd.infer_freq(df.index)
-                if inferred_freq:
-                    df.index.freq = inferred_freq
-
-            print(f"[MarketData] Loaded {ticker} from cache: {cache_path}")
-            return df
-        except Exception as e:
-            print(f"[MarketData] Cache load failed, refetching. Error: {e}")
-            # If cache is corrupted, proceed to fetch
-            pass
+    df = _load_cached(ticker, cache_path, end, columns)
+    if df is not None:
+        return _select(df, columns, ticker)
 
     # 2. Fetch from network
     print(f"[MarketData] Fetching {ticker} from {source}...")
@@ -98,24 +244,106 @@ def get_prices(
             auto_adjust=True, 
             progress=False
         )
-        
-        if df.empty:
-            raise IOError(f"No data found for {ticker} from {source}")
-
-        # Ensure we have a Close column
-        if "Close" not in df.columns:
-            # Fallback if auto_adjust failed to behave as expected
-            if "Adj Close" in df.columns:
-                df = df.rename(columns={"Adj Close": "Close"})
-            elif "Close" not in df.columns:
-                 raise IOError(f"Data for {ticker} missing 'Close' column")
-
-        # 3. Save to cache
-        # Use parquet for efficiency and type preservation
-        df.to_parquet(cache_path)
-        print(f"[MarketData] Saved {ticker} to cache: {cache_path}")
-        
-        return df
-
+        df = _normalize_download(df, ticker, source)
     except Exception as e:
         raise IOError(f"Failed to fetch data for {ticker}: {e}")
+
+    df = _store(df, ticker, cache_path, cache_columns, float32)
+    return _select(df, columns, ticker)
+
+
+def get_prices_many(
+    tickers: Sequence[str],
+    start: str,
+    end: str,
+    *,
+    source: str = "yahoo",
+    interval: str = "1d",
+    cache_dir: str = ".market_cache",
+    columns: Optional[Sequence[str]] = None,
+    cache_columns: Optional[Sequence[str]] = None,
+    float32: bool = False,
+    max_workers: int = 8,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical prices for several tickers at once.
+
+    Cache lookups and cache writes run on a thread pool; every ticker missing
+    from the cache is fetched in a single batched ``yf.download`` call.
+    Arguments match :func:`get_prices`, which is applied per ticker.
+
+    Returns
+    -------
+    dict of str -> pd.DataFrame
+        One frame per ticker, in the order given.
+
+    Raises
+    ------
+    ValueError
+        If inputs are invalid, source is unsupported, or requested columns
+        are not available.
+    IOError
+        If data for any ticker cannot be fetched and is not in cache.
+    """
+    if source != "yahoo":
+        raise ValueError(f"Unsupported data source: {source}")
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    tickers = list(dict.fromkeys(tickers))
+    interval = INTERVAL_ALIASES.get(interval, interval)
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = {
+        t: _cache_path(t, start, end, source, interval, cache_dir, cache_columns, float32)
+        for t in tickers
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # 1. Cache lookups (file reads) in parallel
+        cached = pool.map(lambda t: _load_cached(t, paths[t], end, columns), tickers)
+        loaded = dict(zip(tickers, cached))
+        missing = [t for t in tickers if loaded[t] is None]
+
+        # 2. One batched download for every miss (yfinance threads internally)
+        if missing:
+            print(f"[MarketData] Fetching {', '.join(missing)} from {source}...")
+            try:
+                batch = yf.download(
+                    missing,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    auto_adjust=True,
+                    progress=False,
+                    group_by="ticker",
+                    threads=True,
+                )
+                frames = {
+                    t: _normalize_download(_split_batch(batch, t, missing), t, source)
+                    for t in missing
+                }
+            except Exception as e:
+                raise IOError(f"Failed to fetch data for {', '.join(missing)}: {e}")
+
+            # 3. Cache writes (compression + file I/O) in parallel
+            stored = pool.map(
+                lambda t: _store(frames[t], t, paths[t], cache_columns, float32), missing
+            )
+            loaded.update(zip(missing, stored))
+
+    return {t: _select(loaded[t], columns, t) for t in tickers}
+
+
+def _split_batch(batch: pd.DataFrame, ticker: str, tickers: Sequence[str]) -> pd.DataFrame:
+    # group_by="ticker" puts the ticker on the outer column level; older
+    # yfinance returns flat columns when only one ticker was requested.
+    if isinstance(batch.columns, pd.MultiIndex):
+        if ticker not in batch.columns.get_level_values(0):
+            return pd.DataFrame()
+        df = batch[ticker]
+    elif len(tickers) == 1:
+        df = batch
+    else:
+        return pd.DataFrame()
+    # The batch is aligned on the union of all tickers' sessions.
+    return df.dropna(how="all")
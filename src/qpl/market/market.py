@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+import numpy as np
 
 from ..exceptions import InvalidInputError
-from .curves import FlatDividendCurve, FlatRateCurve
+from .curves import FlatDividendCurve, FlatRateCurve, _check_times
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Market:
     spot: float
     rate_curve: FlatRateCurve
@@ -18,6 +20,10 @@ class Market:
         if self.spot <= 0:
             raise InvalidInputError("spot must be > 0")
 
+    def with_spot(self, spot: float) -> Market:
+        """Same market at a new spot; the (immutable) curves are shared, not rebuilt."""
+        return replace(self, spot=spot)
+
     def df_r(self, t: float) -> float:
         return self.rate_curve.df(t)
 
@@ -27,9 +33,53 @@ class Market:
     def rate(self, t: float) -> float:
         if t == 0:
             return 0.0
+        if isinstance(self.rate_curve, FlatRateCurve):
+            # Flat curve: -ln(df(t))/t is the curve rate itself; skip the exp/log round-trip.
+            if t < 0:
+                raise InvalidInputError("t must be >= 0")
+            return self.rate_curve.rate
         return -math.log(self.df_r(t)) / t
 
     def dividend_yield(self, t: float) -> float:
         if t == 0:
             return 0.0
+        if isinstance(self.dividend_curve, FlatDividendCurve):
+            if t < 0:
+                raise InvalidInputError("t must be >= 0")
+            return self.dividend_curve.yield_
         return -math.log(self.df_q(t)) / t
+
+    def df_r_array(self, t: np.ndarray) -> np.ndarray:
+        return _df_array(self.rate_curve, t)
+
+    def df_q_array(self, t: np.ndarray) -> np.ndarray:
+        return _df_array(self.dividend_curve, t)
+
+    def rate_array(self, t: np.ndarray) -> np.ndarray:
+        """Vectorized ``rate`` over an array of times (0.0 where t == 0)."""
+        if isinstance(self.rate_curve, FlatRateCurve):
+            t = _check_times(t)
+            return np.where(t == 0, 0.0, self.rate_curve.rate)
+        return _zero_rates(self.df_r_array(t), t)
+
+    def dividend_yield_array(self, t: np.ndarray) -> np.ndarray:
+        """Vectorized ``dividend_yield`` over an array of times (0.0 where t == 0)."""
+        if isinstance(self.dividend_curve, FlatDividendCurve):
+            t = _check_times(t)
+            return np.where(t == 0, 0.0, self.dividend_curve.yield_)
+        return _zero_rates(self.df_q_array(t), t)
+
+
+def _df_array(curve: object, t: np.ndarray) -> np.ndarray:
+    # Curves only have to provide df(t); use df_array when they have one and
+    # otherwise query df once per time.
+    df_array = getattr(curve, "df_array", None)
+    if df_array is not None:
+        return df_array(t)
+    t = _check_times(t)
+    return np.array([curve.df(float(x)) for x in t.ravel()]).reshape(t.shape)
+
+
+def _zero_rates(df: np.ndarray, t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return np.divide(-np.log(df), t, out=np.zeros_like(t), where=t != 0)
@@ -2,11 +2,83 @@
 Statistical utilities for market data analysis.
 """
 
-from typing import Sequence, Union
+import math
+from typing import Optional, Sequence, Union
 import numpy as np
 from qpl.exceptions import InvalidInputError
+from qpl._jit import HAVE_NUMBA
+from qpl.market._kernels import _rolling_var_nb, _rolling_var_panel_nb, _welford_nb
 
-def log_returns(prices: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+# Below this many returns the compiled one-pass kernel beats NumPy's per-call
+# dispatch; longer series use NumPy's (pairwise-summed) reductions.
+_WELFORD_MAX_N = 512
+
+
+def _is_cupy(values: object) -> bool:
+    return type(values).__module__.split(".", 1)[0] == "cupy"
+
+
+def _array_module(values: object):
+    # CuPy arrays are processed on the device by CuPy itself (it mirrors the
+    # NumPy API used here), so nothing crosses PCIe unless the caller asks.
+    # CuPy is only imported when such an array is passed in.
+    if _is_cupy(values):
+        import cupy
+
+        return cupy
+    return np
+
+
+def _check_host(values: object, name: str) -> None:
+    # Only log_returns and realized_volatility_many run on CuPy; the other
+    # estimators use Numba kernels and NumPy buffers, so a device array is
+    # rejected here rather than failing somewhere inside them.
+    if _is_cupy(values):
+        raise TypeError(
+            f"{name} does not accept CuPy arrays; use log_returns and "
+            "realized_volatility_many on the device, or pass a NumPy array"
+        )
+
+
+def _float_array(values: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+    # float32 data stays float32 (half the memory traffic for the log and the
+    # reductions); everything else is computed in float64. Float arrays pass
+    # through without a copy, and lists are built as float64 in one step
+    # rather than as an integer/object array that is then cast.
+    if isinstance(values, (list, tuple)):
+        return np.array(values, dtype=np.float64)
+    xp = _array_module(values)
+    arr = xp.asanyarray(values)
+    if arr.dtype != xp.float32:
+        arr = arr.astype(xp.float64, copy=False)
+    return arr
+
+
+def _mean_m2(r: np.ndarray) -> tuple[float, float]:
+    """Mean and sum of squared deviations of the returns."""
+    r = r.ravel()
+    if HAVE_NUMBA and len(r) < _WELFORD_MAX_N:
+        return _welford_nb(r)
+    mean = r.mean()
+    dev = r - mean
+    return float(mean), float(np.dot(dev, dev))
+
+
+def _sum_sq(r: np.ndarray) -> float:
+    """Sum of squared returns (BLAS dot, no squared temporary)."""
+    r = r.ravel()
+    if HAVE_NUMBA and len(r) < _WELFORD_MAX_N:
+        mean, m2 = _welford_nb(r)
+        return m2 + len(r) * mean * mean
+    return float(np.dot(r, r))
+
+
+def log_returns(
+    prices: Union[Sequence[float], np.ndarray],
+    *,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Compute logarithmic returns from a price series.
 
@@ -15,30 +87,60 @@ def log_returns(prices: Union[Sequence[float], np.ndarray]) -> np.ndarray:
     Parameters
     ----------
     prices : Sequence[float] | np.ndarray
-        Sequence of prices. Must have at least 2 elements.
+        Sequence of prices. Must have at least 2 elements. float32 arrays
+        (e.g. a ``float32=True`` price cache) are kept in float32, halving the
+        memory traffic of the log; anything else is computed in float64.
+    axis : int, optional
+        Time axis of a multi-dimensional price array, e.g. ``axis=0`` for a
+        (T, N) matrix of N series. By default prices must be one series.
+        CuPy arrays are differenced on the GPU and returned as CuPy arrays.
+    out : np.ndarray, optional
+        Preallocated float array of length N-1 to write the returns into.
 
     Returns
     -------
     np.ndarray
-        Array of log returns, length N-1.
+        Array of log returns, length N-1 (``out`` when given); with ``axis``,
+        one shorter along that axis.
 
     Raises
     ------
     InvalidInputError
-        If prices has fewer than 2 elements.
+        If prices has fewer than 2 elements or any price is <= 0.
     """
-    prices_arr = np.asanyarray(prices, dtype=float).squeeze()
-    if prices_arr.ndim != 1:
-        raise InvalidInputError(f"Prices must be 1-dimensional, got {prices_arr.ndim}D")
+    prices_arr = _float_array(prices)
+    if axis is None:
+        prices_arr = prices_arr.squeeze()
+        if prices_arr.ndim != 1:
+            raise InvalidInputError(f"Prices must be 1-dimensional, got {prices_arr.ndim}D")
+        axis = 0
+    else:
+        axis = _check_axis(axis, prices_arr.ndim)
 
-    if len(prices_arr) < 2:
+    if prices_arr.shape[axis] < 2:
         raise InvalidInputError("At least 2 prices are required to compute returns.")
     
-    # Handle zeros or negative prices which make log undefined
-    if np.any(prices_arr <= 0):
-         raise InvalidInputError("Prices must be strictly positive for log returns.")
+    # Handle zeros or negative prices which make log undefined. NaN prices
+    # pass through as NaN returns but do not mask a bad price elsewhere (a
+    # plain min() would be NaN and skip the check).
+    xp = _array_module(prices_arr)
+    if xp.any(prices_arr <= 0):
+        raise InvalidInputError("Prices must be strictly positive for log returns.")
+
+    # ln(p_t) - ln(p_{t-1}): one log per price, no intermediate ratio array,
+    # differenced straight into the result (or the caller's buffer).
+    log_p = xp.log(prices_arr)
+    later = [slice(None)] * log_p.ndim
+    earlier = [slice(None)] * log_p.ndim
+    later[axis] = slice(1, None)
+    earlier[axis] = slice(None, -1)
+    return xp.subtract(log_p[tuple(later)], log_p[tuple(earlier)], out=out)
+
 
-    return np.log(prices_arr[1:] / prices_arr[:-1])
+def _check_axis(axis: int, ndim: int) -> int:
+    if not -ndim <= axis < ndim:
+        raise InvalidInputError(f"axis {axis} is out of bounds for a {ndim}D array")
+    return axis % ndim
 
 
 def realized_volatility(
@@ -55,7 +157,8 @@ def realized_volatility(
     Parameters
     ----------
     returns : Sequence[float] | np.ndarray
-        Sequence of returns (log returns).
+        Sequence of returns (log returns). float32 arrays are reduced in
+        float32 (ample for a volatility estimate); anything else in float64.
     annualization : float, default 252.0
         Annualization factor (e.g. 252 for daily data).
     demean : bool, default True
@@ -71,12 +174,15 @@ def realized_volatility(
     ------
     InvalidInputError
         If returns array is empty.
+    TypeError
+        If returns is a CuPy array (see ``realized_volatility_many``).
     """
-    r = np.asanyarray(returns, dtype=float)
-    if len(r) == 0:
+    _check_host(returns, "realized_volatility")
+    r = _float_array(returns)
+    if r.size == 0:
         raise InvalidInputError("Returns array cannot be empty.")
     
-    if len(r) == 1:
+    if r.size == 1:
         # Std of 1 point is technically 0 (or undefined depending on ddof), 
         # but let's return 0.0 for single return to be safe, or raise?
         # Standard deviation of 1 point with ddof=1 is NaN.
@@ -88,9 +194,10 @@ def realized_volatility(
     if demean:
         # std(ddof=1) is unbiased estimator for sample
         # If len=1, std yields nan.
-        if len(r) < 2:
+        if r.size < 2:
             return 0.0
-        vol = np.std(r, ddof=1)
+        _, m2 = _mean_m2(r)
+        daily_var = m2 / (r.size - 1)
     else:
         # Root mean square (assuming mean=0)
         # We use N-1 to be consistent with sample variance definition? 
@@ -99,19 +206,78 @@ def realized_volatility(
         # Let's stick to the previous logic: sqrt( sum(r^2) / (N-1) ) to generally match std behavior
         # but centered at 0.
         # If N=1, this would be infinite?
-        n = len(r)
+        n = r.size
         if n < 2:
              return 0.0 # prevent div by zero
-        sum_sq = np.sum(r * r)
-        vol = np.sqrt(sum_sq / (n - 1))
+        daily_var = _sum_sq(r) / (n - 1)
+
+    # One sqrt for the daily vol and the annualization together.
+    return math.sqrt(daily_var * annualization)
+
+
+def realized_volatility_many(
+    returns: np.ndarray,
+    *,
+    axis: int = 0,
+    annualization: float = 252.0,
+    demean: bool = True
+) -> np.ndarray:
+    """
+    Annualized realized volatility of many return series at once.
+
+    Equivalent to ``realized_volatility`` applied to every series along
+    ``axis`` (e.g. the columns of a (T, N) matrix from
+    ``log_returns(prices, axis=0)``), but done as one reduction over the
+    whole block instead of N small ones. CuPy input is reduced on the GPU
+    and the result stays on the device.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns with time along ``axis``.
+    axis : int, default 0
+        Time axis.
+    annualization : float, default 252.0
+        Annualization factor (e.g. 252 for daily data).
+    demean : bool, default True
+        If True, sample standard deviation (ddof=1); if False, root mean
+        square with the same N-1 scaling as ``realized_volatility``.
 
-    return vol * np.sqrt(annualization)
+    Returns
+    -------
+    np.ndarray
+        Annualized volatilities, with ``axis`` removed from the shape
+        (float32 for float32 returns, otherwise float64).
+
+    Raises
+    ------
+    InvalidInputError
+        If there are no returns along ``axis``.
+    """
+    r = _float_array(returns)
+    xp = _array_module(r)
+    axis = _check_axis(axis, r.ndim)
+    n = r.shape[axis]
+    if n == 0:
+        raise InvalidInputError("Returns array cannot be empty.")
+    if n < 2:
+        # As in realized_volatility: a single return has zero volatility.
+        return xp.zeros(r.shape[:axis] + r.shape[axis + 1:], dtype=r.dtype)
+
+    if demean:
+        daily_var = r.var(axis=axis, ddof=1)
+    else:
+        # Fused multiply-accumulate along the time axis: no squared temporary.
+        r_t = xp.moveaxis(r, axis, 0)
+        daily_var = xp.einsum("i...,i...->...", r_t, r_t) / (n - 1)
+    return xp.sqrt(daily_var * annualization)
 
 
 def rolling_realized_volatility(
     prices: Union[Sequence[float], np.ndarray],
     window: int,
     *,
+    axis: Optional[int] = None,
     annualization: float = 252.0,
     demean: bool = True
 ) -> np.ndarray:
@@ -127,6 +293,10 @@ def rolling_realized_volatility(
         Price series.
     window : int
         Size of the rolling window (in number of return periods).
+    axis : int, optional
+        Time axis of a multi-dimensional price panel, e.g. ``axis=0`` for a
+        (T, N) matrix of N assets; every series gets its own rolling window.
+        By default prices must be one series.
     annualization : float, default 252.0
         Annualization factor.
     demean : bool, default True
@@ -136,71 +306,100 @@ def rolling_realized_volatility(
     Returns
     -------
     np.ndarray
-        Array of annualized volatilities, aligned with `prices`.
+        Array of annualized volatilities, aligned with `prices` (same shape).
         val[t] corresponds to volatility computed using returns up to time t.
+
+    Raises
+    ------
+    TypeError
+        If prices is a CuPy array.
     """
-    import pandas as pd
-    
+    _check_host(prices, "rolling_realized_volatility")
+    if window < 1:
+        raise InvalidInputError("Window must be a positive integer.")
+    if axis is not None:
+        axis = _check_axis(axis, np.ndim(prices))
+
     # 1. Compute returns
     # prices: [p0, p1, p2, ...] (len N)
     # returns: [r1, r2, ...] where r1 = ln(p1/p0) (len N-1)
     # rets array index i corresponds to p_{i+1}
     try:
-        rets = log_returns(prices)
+        rets = log_returns(prices, axis=axis)
     except InvalidInputError:
         # If not enough data, return array of NaNs
-        return np.full(len(prices), np.nan)
-        
-    # 2. Compute rolling stat
-    s_rets = pd.Series(rets)
-    
+        return np.full(len(prices) if axis is None else np.shape(prices), np.nan)
+
+    if axis is not None:
+        rets = np.moveaxis(rets, axis, 0)
+    result = np.full((len(rets) + 1,) + rets.shape[1:], np.nan)
+    if window > len(rets):
+        return result if axis is None else np.moveaxis(result, 0, axis)
+
+    # 2. Compute the rolling variance in one O(N) pass.
+    if not HAVE_NUMBA:
+        rolling_var = _rolling_var_cumsum(rets, window, demean)
+    elif rets.ndim == 1:
+        rolling_var = _rolling_var_nb(rets, window, demean)
+    else:
+        # The kernel tiles assets into contiguous (T, 8) blocks itself.
+        panel = rets.reshape(len(rets), -1)
+        rolling_var = _rolling_var_panel_nb(panel, window, demean)
+        rolling_var = rolling_var.reshape((-1,) + rets.shape[1:])
+
+    # 3. Annualize, aligned with prices
+    # rolling_var[j] uses rets[j : j + window], the returns leading up to
+    # p_{j+window}; result[t] is vol at time t (using info up to t), and the
+    # first `window` entries stay NaN.
+    rolling_vol = result[window:]
+    np.sqrt(rolling_var, out=rolling_vol)
+    rolling_vol *= math.sqrt(annualization)
+    return result if axis is None else np.moveaxis(result, 0, axis)
+
+
+def _rolling_var_cumsum(rets: np.ndarray, window: int, demean: bool) -> np.ndarray:
+    # NumPy fallback for _rolling_var_nb from cumulative window sums (time
+    # along axis 0, any trailing asset dimensions).
+    # A NaN return blanks every window containing it (as a full-window
+    # pandas rolling stat would); it is zeroed so it cannot poison the sums.
+    missing = np.isnan(rets)
+    has_missing = bool(missing.any())
+    if has_missing:
+        rets = np.where(missing, 0.0, rets)
+
     if demean:
-        # Standard deviation (unbiased, ddof=1 is pandas default)
-        rolling_std = s_rets.rolling(window=window).std()
+        # Variance is shift-invariant: centre on the series mean first so the
+        # sum / sum-of-squares difference does not cancel catastrophically.
+        n_valid = len(rets) - missing.sum(axis=0)
+        rets = rets - rets.sum(axis=0) / np.maximum(n_valid, 1)
+        if has_missing:
+            rets[missing] = 0.0
+        win_sum = _window_sums(rets, window)
+        win_sq = _window_sums(rets * rets, window)
+        if window > 1:
+            rolling_var = (win_sq - win_sum * win_sum / window) / (window - 1)
+            np.maximum(rolling_var, 0.0, out=rolling_var)
+        else:
+            # Sample std (ddof=1) of a single return is undefined.
+            rolling_var = np.full(win_sum.shape, np.nan)
     else:
-        # Root mean square (assume mean=0)
-        # sum(x^2)/N or sum(x^2)/(N-1)?
-        # To be consistent with realized_volatility logic for demean=False:
-        # We used sqrt(sum(r^2)/(N-1)).
-        # Pandas doesn't have a direct "rolling rms with ddof=1" method easily.
-        # But we can do:
-        # rolling_sum_sq = (s_rets**2).rolling(window).sum()
-        # count = (s_rets.notna()).rolling(window).sum() (?) or just window if no nans.
-        # Since we want to emulate the exact behavior of realized_volatility(..., demean=False):
-        # vol = sqrt( sum(r^2) / (n - 1) )
-        # Note: if n < 2, it handles it.
-        
-        sq = s_rets ** 2
-        sum_sq = sq.rolling(window=window).sum()
-        # For a full window, n = window.
-        # We divide by window - 1 to match the 'sample proxy' scaling used in stats.py
-        # Or should we just stick to 'demean=True' being the main path and keep this simple?
-        # Let's match existing logic.
-        denom = window - 1 if window > 1 else 1 # Avoid div by zero if window=1
-        
-        # If any NaNs in data, count might be less?
-        # Let's assume clean data for now or let pandas handle NaNs propogation
-        rolling_var = sum_sq / denom
-        rolling_std = np.sqrt(rolling_var)
+        # Root mean square (assume mean=0), matching realized_volatility:
+        # vol = sqrt( sum(r^2) / (n - 1) ), guarding window=1.
+        denom = window - 1 if window > 1 else 1
+        rolling_var = _window_sums(rets * rets, window) / denom
 
-    # 3. Annualize
-    rolling_vol = rolling_std * np.sqrt(annualization)
-    
-    # 4. Align with prices
-    # rets has length N-1. rolling_vol has length N-1.
-    # rolling_vol[i] is vol using returns ending at index i of rets.
-    # rets[i] is return from p_i to p_{i+1}.
-    # So rolling_vol[i] uses returns leading up to p_{i+1}.
-    # We want result[t] to be vol at time t (using info up to t).
-    # So result[i+1] = rolling_vol[i].
-    # result[0] = NaN (no return).
-    
-    result = np.full(len(prices), np.nan)
-    result[1:] = rolling_vol.values
-    
+    if has_missing:
+        rolling_var[_window_sums(missing, window) > 0] = np.nan
+    return rolling_var
 
-    
-    return result
+
+def _window_sums(x: np.ndarray, window: int) -> np.ndarray:
+    # Sums of every length-`window` slice of x (along axis 0) via one
+    # cumulative sum.
+    csum = np.empty((len(x) + 1,) + x.shape[1:])
+    csum[0] = 0.0
+    np.cumsum(x, axis=0, out=csum[1:])
+    return csum[window:] - csum[:-window]
 
 
 from dataclasses import dataclass
@@ -237,17 +436,23 @@ def fit_normal_returns(
     -------
     NormalParams
         Fitted parameters.
+
+    Raises
+    ------
+    TypeError
+        If returns is a CuPy array.
     """
-    r = np.asanyarray(returns, dtype=float)
-    if len(r) < 2:
+    _check_host(returns, "fit_normal_returns")
+    r = _float_array(returns)
+    if r.size < 2:
         raise InvalidInputError("Need at least 2 returns to fit parameters.")
         
-    mu = np.mean(r)
-    sigma = np.std(r, ddof=1)
+    mu, m2 = _mean_m2(r)
+    sigma = math.sqrt(m2 / (r.size - 1))
     
     return NormalParams(
         mu_daily=float(mu),
         sigma_daily=float(sigma),
         mu_annual=float(mu * annualization),
-        sigma_annual=float(sigma * np.sqrt(annualization))
+        sigma_annual=float(sigma * math.sqrt(annualization))
     )
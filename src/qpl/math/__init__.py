@@ -0,0 +1,3 @@
+from .norm import norm_cdf, norm_cdf_nb, norm_pdf, norm_pdf_nb
+
+__all__ = ["norm_cdf", "norm_cdf_nb", "norm_pdf", "norm_pdf_nb"]
@@ -0,0 +1,42 @@
+"""
+Standard normal CDF/PDF shared by the pricing engines.
+
+``norm_cdf``/``norm_pdf`` accept scalars or arrays (NumPy ufuncs);
+``norm_cdf_nb``/``norm_pdf_nb`` are scalar versions callable from Numba kernels.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Union
+
+import numpy as np
+from scipy.special import ndtr
+
+from .._jit import njit
+
+ArrayLike = Union[float, np.ndarray]
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def norm_cdf(x: ArrayLike) -> ArrayLike:
+    """Standard normal CDF (scipy.special.ndtr)."""
+    return ndtr(x)
+
+
+def norm_pdf(x: ArrayLike) -> ArrayLike:
+    """Standard normal PDF."""
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+@njit(cache=True, fastmath=True)
+def norm_cdf_nb(x: float) -> float:
+    # erfc form: no 1 + erf(x) cancellation for very negative x (deep OTM tails).
+    return 0.5 * math.erfc(-x * _INV_SQRT2)
+
+
+@njit(cache=True, fastmath=True)
+def norm_pdf_nb(x: float) -> float:
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
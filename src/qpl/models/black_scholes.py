@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Union
 
 import numpy as np
-from scipy.special import erf
 
 from ..exceptions import InvalidInputError
+from ..instruments.options import OptionKind, _is_call_kind
+from ..math.norm import norm_cdf
+from .._jit import HAVE_NUMBA
+from ._kernels import _bs_price_nb, _bs_price_vec_nb
 
 ArrayLike = Union[float, int, np.ndarray]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlackScholesModel:
     sigma: float
 
@@ -21,14 +25,6 @@ class BlackScholesModel:
 
 
 
-def _norm_cdf(x: np.ndarray) -> np.ndarray:
-    """
-    Standard normal CDF using erf. Vectorized.
-    """
-    return 0.5 * (1.0 + erf(x / np.sqrt(2.0)))
-
-
-
 def bs_price(
     *,
     S: ArrayLike,
@@ -37,7 +33,7 @@ def bs_price(
     r: float,
     sigma: float,
     q: float = 0.0,
-    kind: str = "call",
+    kind: str | OptionKind = "call",
 ) -> ArrayLike:
     """
     Black–Scholes price for a European call or put with continuous dividend yield q.
@@ -56,13 +52,14 @@ def bs_price(
         Volatility (annualized).
     q : float, optional
         Continuous dividend yield (default 0.0).
-    kind : {"call","put"}
+    kind : {"call","put"} or OptionKind
         Option type.
 
     Returns
     -------
     scalar or np.ndarray
-        Price(s) matching the shape of S.
+        Price(s) matching the shape of S. float32 spot arrays give float32
+        prices; any other spot array is priced in float64.
     """
     if T < 0:
         raise InvalidInputError("T must be >= 0")
@@ -71,49 +68,65 @@ def bs_price(
     if K <= 0:
         raise InvalidInputError("K must be > 0")
 
-    S_arr = np.asarray(S, dtype=float)
+    is_call = _is_call_kind(kind)
+
+    if np.isscalar(S):
+        # One contract: the compiled scalar kernel (plain math.* without Numba)
+        # skips the array boxing and ufunc dispatch of the path below.
+        if S <= 0:
+            raise InvalidInputError("S must be > 0")
+        return _bs_price_nb(
+            float(S), float(K), float(T), float(r), float(q), float(sigma), is_call
+        )
+
+    # float32 chains stay float32 end to end (half the memory traffic); the
+    # contract terms are plain Python floats so they never promote the arrays.
+    S_arr = np.asarray(S)
+    if S_arr.dtype != np.float32:
+        S_arr = S_arr.astype(np.float64, copy=False)
+    K, T, r, q, sigma = float(K), float(T), float(r), float(q), float(sigma)
     if np.any(S_arr <= 0):
         raise InvalidInputError("S must be > 0")
 
-    kind_l = kind.lower()
-    if kind_l not in {"call", "put"}:
-        raise InvalidInputError("kind must be 'call' or 'put'")
+    if HAVE_NUMBA:
+        # One fused parallel pass over the spots, with no d1/d2/N(d) temporaries.
+        out = np.empty(S_arr.shape, dtype=S_arr.dtype)
+        _bs_price_vec_nb(S_arr.reshape(-1), K, T, r, q, sigma, is_call, out.reshape(-1))
+        return out
 
     if T == 0:
         # At expiry: discounted payoff is just payoff at T=0 (no discounting needed)
         # but keep consistent with standard convention: price = intrinsic value.
-        if kind_l == "call":
+        if is_call:
             out = np.maximum(S_arr - K, 0.0)
         else:
             out = np.maximum(K - S_arr, 0.0)
-        return out.item() if np.isscalar(S) else out
+        return out
 
     if sigma == 0:
         # Zero vol: deterministic forward under q, price is discounted intrinsic of forward payoff
         forward = S_arr * np.exp((r - q) * T)
         disc = np.exp(-r * T)
-        if kind_l == "call":
+        if is_call:
             out = disc * np.maximum(forward - K, 0.0)
         else:
             out = disc * np.maximum(K - forward, 0.0)
-        return out.item() if np.isscalar(S) else out
-
-    sqrtT = np.sqrt(T)
-    d1 = (np.log(S_arr / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * sqrtT)
-    d2 = d1 - sigma * sqrtT
+        return out
 
-    df_r = np.exp(-r * T)
-    df_q = np.exp(-q * T)
+    # T, r, q and sigma are scalars here: form the sigma/discount terms once
+    # and keep the array work to the S-dependent part.
+    vol_sqrtT = sigma * math.sqrt(T)
+    drift = (r - q + 0.5 * sigma * sigma) * T
+    d1 = (np.log(S_arr / K) + drift) / vol_sqrtT
+    d2 = d1 - vol_sqrtT
 
-    Nd1 = _norm_cdf(d1)
-    Nd2 = _norm_cdf(d2)
+    fwd = S_arr * math.exp(-q * T)
+    k_disc = K * math.exp(-r * T)
 
-    if kind_l == "call":
-        out = S_arr * df_q * Nd1 - K * df_r * Nd2
+    if is_call:
+        out = fwd * norm_cdf(d1) - k_disc * norm_cdf(d2)
     else:
-        # Put: N(-d) = 1 - N(d)
-        Nmd1 = _norm_cdf(-d1)
-        Nmd2 = _norm_cdf(-d2)
-        out = K * df_r * Nmd2 - S_arr * df_q * Nmd1
+        # Put: evaluate N(-d) directly rather than 1 - N(d).
+        out = k_disc * norm_cdf(-d2) - fwd * norm_cdf(-d1)
 
-    return out.item() if np.isscalar(S) else out
+    return out
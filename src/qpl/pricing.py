@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+import copy
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Callable, Literal
 
 from .engines.analytic.black_scholes import (
     greeks_european,
@@ -9,6 +12,7 @@ from .engines.analytic.black_scholes import (
 from .engines.base import GreeksResult, PriceResult
 from .engines.mc.pricers import (
     MCConfig,
+    _cached_normals,
     greeks_european as greeks_european_mc,
     price_european as price_european_mc,
 )
@@ -24,66 +28,130 @@ from .market.market import Market
 from .models.black_scholes import BlackScholesModel
 
 
-def price(
+@lru_cache(maxsize=1024)
+def _memoized(
+    engine: Callable[..., Any],
     instrument: Any,
     model: Any,
     market: Any,
-    *,
-    method: Literal["analytic", "mc", "pde"] = "analytic",
-    **kwargs: Any,
-) -> PriceResult:
-    if method == "analytic":
-        if kwargs:
-            raise InvalidInputError("Unexpected keyword arguments for method 'analytic'")
+    frozen_kwargs: tuple[tuple[str, Any], ...],
+) -> Any:
+    kwargs = {
+        key: dict(value) if key == "bumps" and value is not None else value
+        for key, value in frozen_kwargs
+    }
+    return engine(instrument, model, market, **kwargs)
 
-        if (
-            isinstance(instrument, EuropeanOption)
-            and isinstance(model, BlackScholesModel)
-            and isinstance(market, Market)
-        ):
-            return price_european_analytic(instrument, model, market)
-
-        raise NotSupportedError("Unsupported instrument/model/market combination")
 
-    if method == "mc":
-        cfg = kwargs.get("cfg")
-        extra_kwargs = {key: value for key, value in kwargs.items() if key != "cfg"}
-        if cfg is None:
-            raise InvalidInputError("cfg is required for method 'mc'")
-        if extra_kwargs:
-            raise InvalidInputError("Unexpected keyword arguments for method 'mc'")
-        if not isinstance(cfg, MCConfig):
-            raise InvalidInputError("cfg must be an instance of MCConfig")
-
-        if (
+def _call_engine(
+    engine: Callable[..., Any],
+    instrument: Any,
+    model: Any,
+    market: Any,
+    **kwargs: Any,
+) -> Any:
+    """Call an engine, memoizing on the (frozen, hashable) inputs.
+
+    Options, models, markets and configs are frozen dataclasses, so identical
+    repeated requests (e.g. price then greeks scans in demos) hit the cache.
+    Inputs that are not hashable (e.g. custom curve objects) and unseeded
+    Monte Carlo runs, which must draw afresh each call, bypass it. A hit
+    returns a copy with its own ``meta``, so callers cannot edit the cache.
+    """
+    cfg = kwargs.get("cfg")
+    if isinstance(cfg, MCConfig) and cfg.seed is None:
+        return engine(instrument, model, market, **kwargs)
+    frozen_kwargs = tuple(
+        sorted(
+            (key, tuple(sorted(value.items())) if key == "bumps" and value is not None else value)
+            for key, value in kwargs.items()
+        )
+    )
+    try:
+        hash((instrument, model, market, frozen_kwargs))
+    except TypeError:
+        return engine(instrument, model, market, **kwargs)
+    result = _memoized(engine, instrument, model, market, frozen_kwargs)
+    if result.meta is None:
+        return result
+    return replace(result, meta=copy.deepcopy(result.meta))
+
+
+def clear_cache() -> None:
+    """Drop all memoized price/greeks results and cached MC draws."""
+    _memoized.cache_clear()
+    _cached_normals.cache_clear()
+
+
+# Engine per (operation, method); every engine takes (EuropeanOption,
+# BlackScholesModel, Market).
+_ENGINES: dict[tuple[str, str], Callable[..., Any]] = {
+    ("price", "analytic"): price_european_analytic,
+    ("price", "mc"): price_european_mc,
+    ("price", "pde"): price_european_pde,
+    ("greeks", "analytic"): greeks_european,
+    ("greeks", "mc"): greeks_european_mc,
+    ("greeks", "pde"): greeks_european_pde,
+}
+_CONFIG_TYPES: dict[str, type] = {"mc": MCConfig, "pde": PDEConfig}
+_OPTIONAL_KWARGS: dict[tuple[str, str], frozenset[str]] = {("greeks", "mc"): frozenset({"bumps"})}
+
+# (operation, method, instrument type, model type, market type) -> engine, or
+# None for unsupported combinations. Filled lazily, so repeated calls with the
+# same argument types skip the isinstance checks.
+_RESOLVED: dict[tuple[Any, ...], Callable[..., Any] | None] = {}
+
+
+def _check_kwargs(op: str, method: str, kwargs: dict[str, Any]) -> None:
+    if (op, method) not in _ENGINES:
+        raise NotSupportedError(f"method '{method}' is not supported")
+
+    cfg_type = _CONFIG_TYPES.get(method)
+    if cfg_type is None:
+        if kwargs:
+            raise InvalidInputError(f"Unexpected keyword arguments for method '{method}'")
+        return
+
+    cfg = kwargs.get("cfg")
+    allowed = _OPTIONAL_KWARGS.get((op, method), frozenset()) | {"cfg"}
+    if cfg is None:
+        raise InvalidInputError(f"cfg is required for method '{method}'")
+    if not allowed.issuperset(kwargs):
+        raise InvalidInputError(f"Unexpected keyword arguments for method '{method}'")
+    if not isinstance(cfg, cfg_type):
+        raise InvalidInputError(f"cfg must be an instance of {cfg_type.__name__}")
+    bumps = kwargs.get("bumps")
+    if bumps is not None and not isinstance(bumps, dict):
+        raise InvalidInputError("bumps must be a dict of bump sizes")
+
+
+def _resolve(op: str, method: str, instrument: Any, model: Any, market: Any) -> Callable[..., Any]:
+    key = (op, method, type(instrument), type(model), type(market))
+    try:
+        engine = _RESOLVED[key]
+    except KeyError:
+        supported = (
             isinstance(instrument, EuropeanOption)
             and isinstance(model, BlackScholesModel)
             and isinstance(market, Market)
-        ):
-            return price_european_mc(instrument, model, market, cfg=cfg)
-
+        )
+        engine = _RESOLVED[key] = _ENGINES[(op, method)] if supported else None
+    if engine is None:
         raise NotSupportedError("Unsupported instrument/model/market combination")
+    return engine
 
-    if method == "pde":
-        cfg = kwargs.get("cfg")
-        extra_kwargs = {key: value for key, value in kwargs.items() if key != "cfg"}
-        if cfg is None:
-            raise InvalidInputError("cfg is required for method 'pde'")
-        if extra_kwargs:
-            raise InvalidInputError("Unexpected keyword arguments for method 'pde'")
-        if not isinstance(cfg, PDEConfig):
-            raise InvalidInputError("cfg must be an instance of PDEConfig")
-
-        if (
-            isinstance(instrument, EuropeanOption)
-            and isinstance(model, BlackScholesModel)
-            and isinstance(market, Market)
-        ):
-            return price_european_pde(instrument, model, market, cfg=cfg)
-
-        raise NotSupportedError("Unsupported instrument/model/market combination")
 
-    raise NotSupportedError(f"method '{method}' is not supported")
+def price(
+    instrument: Any,
+    model: Any,
+    market: Any,
+    *,
+    method: Literal["analytic", "mc", "pde"] = "analytic",
+    **kwargs: Any,
+) -> PriceResult:
+    _check_kwargs("price", method, kwargs)
+    engine = _resolve("price", method, instrument, model, market)
+    return _call_engine(engine, instrument, model, market, **kwargs)
 
 
 def greeks(
@@ -94,58 +162,6 @@ def greeks(
     method: Literal["analytic", "mc", "pde"] = "analytic",
     **kwargs: Any,
 ) -> GreeksResult:
-    if method == "analytic":
-        if kwargs:
-            raise InvalidInputError("Unexpected keyword arguments for method 'analytic'")
-
-        if (
-            isinstance(instrument, EuropeanOption)
-            and isinstance(model, BlackScholesModel)
-            and isinstance(market, Market)
-        ):
-            return greeks_european(instrument, model, market)
-
-        raise NotSupportedError("Unsupported instrument/model/market combination")
-
-    if method == "mc":
-        cfg = kwargs.get("cfg")
-        bumps = kwargs.get("bumps")
-        extra_kwargs = {key: value for key, value in kwargs.items() if key not in {"cfg", "bumps"}}
-        if cfg is None:
-            raise InvalidInputError("cfg is required for method 'mc'")
-        if extra_kwargs:
-            raise InvalidInputError("Unexpected keyword arguments for method 'mc'")
-        if not isinstance(cfg, MCConfig):
-            raise InvalidInputError("cfg must be an instance of MCConfig")
-        if bumps is not None and not isinstance(bumps, dict):
-            raise InvalidInputError("bumps must be a dict of bump sizes")
-
-        if (
-            isinstance(instrument, EuropeanOption)
-            and isinstance(model, BlackScholesModel)
-            and isinstance(market, Market)
-        ):
-            return greeks_european_mc(instrument, model, market, cfg=cfg, bumps=bumps)
-
-        raise NotSupportedError("Unsupported instrument/model/market combination")
-
-    if method == "pde":
-        cfg = kwargs.get("cfg")
-        extra_kwargs = {key: value for key, value in kwargs.items() if key != "cfg"}
-        if cfg is None:
-            raise InvalidInputError("cfg is required for method 'pde'")
-        if extra_kwargs:
-            raise InvalidInputError("Unexpected keyword arguments for method 'pde'")
-        if not isinstance(cfg, PDEConfig):
-            raise InvalidInputError("cfg must be an instance of PDEConfig")
-
-        if (
-            isinstance(instrument, EuropeanOption)
-            and isinstance(model, BlackScholesModel)
-            and isinstance(market, Market)
-        ):
-            return greeks_european_pde(instrument, model, market, cfg=cfg)
-
-        raise NotSupportedError("Unsupported instrument/model/market combination")
-
-    raise NotSupportedError(f"method '{method}' is not supported")
+    _check_kwargs("greeks", method, kwargs)
+    engine = _resolve("greeks", method, instrument, model, market)
+    return _call_engine(engine, instrument, model, market, **kwargs)
@@ -1,5 +1,6 @@
 import math
 import numpy as np
+import pytest
 
 from qpl.models.black_scholes import bs_price
 
@@ -61,3 +62,188 @@ def test_vector_inputs_match_scalar():
     assert put_vec.shape == S.shape
     assert np.allclose(call_vec, call_exp, rtol=0.0, atol=1e-12)
     assert np.allclose(put_vec, put_exp, rtol=0.0, atol=1e-12)
+
+
+def test_bs_price_vec_chain_matches_scalar():
+    from qpl.engines.analytic.black_scholes import bs_price_vec
+
+    K = np.array([80.0, 100.0, 120.0])
+    T = np.array([[0.25], [1.0]])
+    kinds = np.array(["call", "put", "call"])
+
+    vec = bs_price_vec(100.0, K, T, 0.03, 0.01, 0.25, kinds)
+
+    assert vec.shape == (2, 3)
+    for i, t in enumerate(T[:, 0]):
+        for j, (k, kind) in enumerate(zip(K, kinds)):
+            exp = bs_price(S=100.0, K=k, T=t, r=0.03, sigma=0.25, q=0.01, kind=kind)
+            assert abs(vec[i, j] - exp) < 1e-12
+
+
+def test_bs_price_vec_spot_strike_vol_sweep_in_one_call():
+    from qpl.engines.analytic.black_scholes import bs_price_vec
+
+    # The whole spot x strike x vol grid in one broadcast call.
+    S = np.array([90.0, 100.0, 110.0])[:, None, None]
+    K = np.array([90.0, 100.0, 110.0])[None, :, None]
+    sigma = np.array([0.1, 0.2, 0.3])[None, None, :]
+
+    grid = bs_price_vec(S, K, 1.0, 0.01, 0.0, sigma, "call")
+
+    assert grid.shape == (3, 3, 3)
+    assert np.all(np.diff(grid, axis=0) > 0.0)
+    assert np.all(np.diff(grid, axis=1) < 0.0)
+    assert np.all(np.diff(grid, axis=2) > 0.0)
+    exp = bs_price(S=110.0, K=90.0, T=1.0, r=0.01, sigma=0.3, q=0.0, kind="call")
+    assert abs(grid[2, 0, 2] - exp) < 1e-12
+
+
+def test_bs_price_vec_degenerate_elements():
+    from qpl.engines.analytic.black_scholes import bs_price_vec
+
+    vec = bs_price_vec(100.0, 90.0, np.array([0.0, 1.0]), 0.05, 0.0, np.array([0.2, 0.0]), "call")
+    assert vec[0] == 10.0
+    assert abs(vec[1] - (100.0 - 90.0 * math.exp(-0.05))) < 1e-12
+
+
+def _closed_form_greeks(S, K, T, r, q, sigma, kind):
+    """Textbook Black-Scholes Greeks (theta per year of calendar time)."""
+    n_cdf = lambda x: 0.5 * math.erfc(-x / math.sqrt(2.0))
+    n_pdf = lambda x: math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+    sqrtT = math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    dq, dr = math.exp(-q * T), math.exp(-r * T)
+    gamma = dq * n_pdf(d1) / (S * sigma * sqrtT)
+    vega = S * dq * n_pdf(d1) * sqrtT
+    decay = -S * dq * n_pdf(d1) * sigma / (2.0 * sqrtT)
+    if kind == "call":
+        delta = dq * n_cdf(d1)
+        theta = decay - r * K * dr * n_cdf(d2) + q * S * dq * n_cdf(d1)
+        rho = K * T * dr * n_cdf(d2)
+    else:
+        delta = -dq * n_cdf(-d1)
+        theta = decay + r * K * dr * n_cdf(-d2) - q * S * dq * n_cdf(-d1)
+        rho = -K * T * dr * n_cdf(-d2)
+    return delta, gamma, vega, theta, rho
+
+
+def test_bs_greeks_vec_matches_closed_form_and_finite_differences():
+    from qpl.engines.analytic.black_scholes import bs_greeks_vec
+
+    S, T, r, q, sigma = 100.0, 0.75, 0.03, 0.01, 0.25
+    K = np.array([90.0, 100.0, 110.0])
+    kinds = np.array(["call", "put", "put"])
+    vec = bs_greeks_vec(S, K, T, r, q, sigma, kinds)
+
+    for i, (k, kind) in enumerate(zip(K, kinds)):
+        expected = _closed_form_greeks(S, k, T, r, q, sigma, kind)
+        for got, exp in zip(vec, expected):
+            assert got[i] == pytest.approx(exp, rel=1e-12, abs=1e-12)
+
+        # Central differences of the scalar pricer, a separate code path.
+        def bs(**bump):
+            args = dict(S=S, K=k, T=T, r=r, q=q, sigma=sigma, kind=kind)
+            args.update(bump)
+            return bs_price(**args)
+
+        h = 1e-4
+        fd = (
+            (bs(S=S + h) - bs(S=S - h)) / (2 * h),
+            (bs(S=S + 1e-2) - 2 * bs() + bs(S=S - 1e-2)) / 1e-4,
+            (bs(sigma=sigma + h) - bs(sigma=sigma - h)) / (2 * h),
+            -(bs(T=T + h) - bs(T=T - h)) / (2 * h),
+            (bs(r=r + h) - bs(r=r - h)) / (2 * h),
+        )
+        for got, exp in zip(vec, fd):
+            assert got[i] == pytest.approx(exp, rel=1e-5, abs=1e-7)
+
+
+def test_bs_price_greeks_vec_matches_separate_calls():
+    from qpl.engines.analytic.black_scholes import bs_greeks_vec, bs_price_greeks_vec, bs_price_vec
+
+    K = np.array([80.0, 100.0, 125.0])
+    kinds = np.array(["call", "put", "call"])
+    args = (100.0, K, np.array([0.25, 1.0, 2.0]), 0.03, 0.01, 0.25, kinds)
+
+    price, *greeks = bs_price_greeks_vec(*args)
+
+    np.testing.assert_allclose(price, bs_price_vec(*args), rtol=1e-13, atol=1e-13)
+    for fused, separate in zip(greeks, bs_greeks_vec(*args)):
+        np.testing.assert_array_equal(fused, separate)
+
+
+def test_norm_scalar_and_vector_agree():
+    from qpl.math.norm import norm_cdf, norm_cdf_nb, norm_pdf, norm_pdf_nb
+
+    xs = np.array([-30.0, -8.0, -1.5, 0.0, 0.7, 6.0])
+    cdf = norm_cdf(xs)
+    pdf = norm_pdf(xs)
+    for x, c, p in zip(xs, cdf, pdf):
+        assert abs(norm_cdf_nb(float(x)) - c) <= 1e-12 * c
+        assert abs(norm_pdf_nb(float(x)) - p) <= 1e-12 * p
+    assert cdf[0] > 0.0  # no 1 + erf cancellation in the far tail
+
+
+def test_bs_price_scalar_path_matches_array_path():
+    spots = np.array([60.0, 100.0, 140.0])
+    for T, sigma in [(1.0, 0.2), (0.0, 0.2), (0.5, 0.0)]:
+        for kind in ("call", "put"):
+            vec = bs_price(S=spots, K=100.0, T=T, r=0.03, sigma=sigma, q=0.01, kind=kind)
+            for s, expected in zip(spots, vec):
+                got = bs_price(S=float(s), K=100.0, T=T, r=0.03, sigma=sigma, q=0.01, kind=kind)
+                assert isinstance(got, float)
+                assert abs(got - expected) < 1e-12 * max(1.0, expected)
+
+
+def test_bs_price_fused_array_path_matches_numpy_path(monkeypatch):
+    from qpl.models import black_scholes
+
+    spots = np.linspace(50.0, 150.0, 12).reshape(3, 4)
+    for T, sigma in [(1.0, 0.2), (0.0, 0.2), (0.5, 0.0)]:
+        for kind in ("call", "put"):
+            out = {}
+            for fused in (True, False):
+                monkeypatch.setattr(black_scholes, "HAVE_NUMBA", fused)
+                out[fused] = bs_price(S=spots, K=100.0, T=T, r=0.03, sigma=sigma, q=0.01, kind=kind)
+            assert out[True].shape == spots.shape
+            np.testing.assert_allclose(out[True], out[False], rtol=1e-12, atol=1e-12)
+
+
+def test_bs_price_keeps_float32_spots_in_float32(monkeypatch):
+    from qpl.models import black_scholes
+
+    spots = np.linspace(50.0, 150.0, 11)
+    for fused in (True, False):
+        monkeypatch.setattr(black_scholes, "HAVE_NUMBA", fused)
+        for T, sigma in [(1.0, 0.2), (0.0, 0.2)]:
+            # A NumPy-scalar q must not promote the float32 chain.
+            kw = dict(K=100.0, T=T, r=0.03, sigma=sigma, q=np.float64(0.01))
+            ref = bs_price(S=spots, **kw)
+            got = bs_price(S=spots.astype(np.float32), **kw)
+            assert got.dtype == np.float32
+            np.testing.assert_allclose(got, ref, rtol=1e-5, atol=1e-4)
+        assert bs_price(S=np.array([100, 110]), K=100.0, T=1.0, r=0.03, sigma=0.2).dtype == np.float64
+
+
+def test_option_kind_codes_match_kind_strings():
+    from qpl.engines.analytic.black_scholes import bs_price_vec
+    from qpl.exceptions import InvalidInputError
+    from qpl.instruments import EuropeanOption, OptionKind
+
+    assert EuropeanOption(kind=OptionKind.PUT, strike=100.0, expiry=1.0).kind == "put"
+    assert EuropeanOption(kind="CALL", strike=100.0, expiry=1.0).kind == "call"
+    for code, name in ((OptionKind.CALL, "call"), (OptionKind.PUT, "put")):
+        assert bs_price(S=100.0, K=95.0, T=1.0, r=0.03, sigma=0.2, kind=code) == bs_price(
+            S=100.0, K=95.0, T=1.0, r=0.03, sigma=0.2, kind=name
+        )
+
+    K = np.array([90.0, 100.0, 110.0])
+    by_code = bs_price_vec(100.0, K, 1.0, 0.03, 0.0, 0.2, np.array([1, -1, 1], dtype=np.int8))
+    by_name = bs_price_vec(100.0, K, 1.0, 0.03, 0.0, 0.2, ["call", "Put", "call"])
+    np.testing.assert_array_equal(by_code, by_name)
+
+    with pytest.raises(InvalidInputError):
+        bs_price_vec(100.0, K, 1.0, 0.03, 0.0, 0.2, np.array([1, 0, 1]))
+    with pytest.raises(InvalidInputError):
+        bs_price(S=100.0, K=95.0, T=1.0, r=0.03, sigma=0.2, kind="straddle")
@@ -1,27 +1,16 @@
 import os
 import re
-import subprocess
-import sys
+import runpy
 
 
-def test_bs_mc_vs_analytic_example_smoke() -> None:
+def test_bs_mc_vs_analytic_example_smoke(capsys) -> None:
     repo_root = os.path.dirname(os.path.dirname(__file__))
     script_path = os.path.join(repo_root, "examples", "bs_mc_vs_analytic.py")
 
-    env = os.environ.copy()
-    env["PYTHONPATH"] = os.path.join(repo_root, "src")
+    # Run in the (already warm) test interpreter rather than a fresh subprocess.
+    runpy.run_path(script_path, run_name="__main__")
 
-    result = subprocess.run(
-        [sys.executable, script_path],
-        cwd=repo_root,
-        env=env,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    assert result.returncode == 0, result.stderr
-    stdout = result.stdout
+    stdout = capsys.readouterr().out
     assert "analytic=" in stdout
     assert "mc=" in stdout
     assert "stderr=" in stdout
@@ -76,3 +76,78 @@ def test_implied_vol_solver_fail():
     
     with pytest.raises(InvalidInputError, match="Cannot bracket"):
         implied_volatility(99.0, option, market, upper=2.0) # Restrict upper to force fail
+
+def test_bs_price_kernel_matches_bs_price():
+    """The scalar solver kernel must agree with the reference pricer."""
+    from qpl.models._kernels import _bs_price_nb
+
+    for kind in ("call", "put"):
+        for S, K, T, r, q, sigma in [(100.0, 100.0, 1.0, 0.05, 0.01, 0.2), (90.0, 120.0, 0.3, 0.02, 0.04, 0.6)]:
+            expected = bs_price(S=S, K=K, T=T, r=r, q=q, sigma=sigma, kind=kind)
+            assert abs(_bs_price_nb(S, K, T, r, q, sigma, kind == "call") - expected) < 1e-10
+
+@pytest.mark.parametrize(
+    "kind,S,K,T,r,q,sigma_true",
+    [
+        ("call", 100.0, 100.0, 1.0, 0.05, 0.01, 0.25),
+        ("put", 100.0, 110.0, 0.5, 0.02, 0.0, 0.40),
+        ("call", 100.0, 150.0, 0.25, 0.01, 0.0, 0.30),
+        ("put", 100.0, 60.0, 2.0, 0.03, 0.01, 0.80),
+    ],
+)
+def test_implied_vol_newton_recovery(kind, S, K, T, r, q, sigma_true):
+    """Newton–Halley recovers sigma and agrees with Brent."""
+    from qpl.engines.analytic.black_scholes import implied_volatility_newton
+
+    price = bs_price(S=S, K=K, T=T, r=r, q=q, sigma=sigma_true, kind=kind)
+    option = EuropeanOption(kind=kind, strike=K, expiry=T)
+    market = Market(spot=S, rate_curve=FlatRateCurve(r), dividend_curve=FlatDividendCurve(q))
+
+    iv = implied_volatility_newton(float(price), option, market)
+    assert abs(iv - sigma_true) < 1e-6
+    assert abs(iv - implied_volatility(float(price), option, market)) < 1e-6
+
+def test_implied_vol_newton_bounds_error():
+    from qpl.engines.analytic.black_scholes import implied_volatility_newton
+
+    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
+    market = Market(spot=120.0, rate_curve=FlatRateCurve(0), dividend_curve=FlatDividendCurve(0))
+    with pytest.raises(InvalidInputError, match="outside bounds"):
+        implied_volatility_newton(10.0, option, market)
+
+def test_implied_vol_vec_chain_recovery():
+    """Lockstep Newton recovers a whole chain and NaNs out invalid quotes."""
+    import numpy as np
+    from qpl.engines.analytic.black_scholes import bs_price_vec, implied_volatility_vec
+
+    K = np.array([80.0, 90.0, 100.0, 110.0, 130.0])
+    T = np.array([[0.25], [1.0]])
+    sigma_true = np.array([0.35, 0.3, 0.25, 0.22, 0.2])
+    kinds = np.array(["put", "put", "call", "call", "call"])
+    prices = bs_price_vec(100.0, K, T, 0.03, 0.01, sigma_true, kinds)
+
+    iv = implied_volatility_vec(prices, 100.0, K, T, 0.03, 0.01, kinds)
+    assert iv.shape == (2, 5)
+    assert np.max(np.abs(iv - sigma_true)) < 1e-6
+
+    bad = implied_volatility_vec(
+        np.array([-1.0, 150.0, 10.0]), 100.0, 100.0, np.array([1.0, 1.0, 0.0]), 0.0, 0.0, "call"
+    )
+    assert np.all(np.isnan(bad))
+
+    # Expired contracts are a bad quote (NaN); a negative expiry is bad input.
+    with pytest.raises(InvalidInputError):
+        implied_volatility_vec(10.0, 100.0, 100.0, np.array([1.0, -1.0]), 0.0, 0.0, "call")
+
+def test_brent_kernel_matches_scipy_brentq():
+    """The in-kernel Brent solver must land on the same root as scipy's brentq."""
+    from scipy.optimize import brentq
+
+    from qpl.engines.analytic._kernels import _bs_implied_vol_brent_nb, _bs_price_error_nb
+
+    fwd, k_disc, T = 100.0 * math.exp(-0.01), 95.0 * math.exp(-0.03), 1.0
+    args = (fwd, k_disc, math.log(fwd / k_disc), math.sqrt(T), False, 4.2)
+    fa, fb = _bs_price_error_nb(0.01, *args), _bs_price_error_nb(2.0, *args)
+    root, converged = _bs_implied_vol_brent_nb(0.01, 2.0, fa, fb, *args, 1e-12, 100)
+    assert converged
+    assert abs(root - brentq(_bs_price_error_nb, 0.01, 2.0, args=args, xtol=1e-12)) < 1e-12
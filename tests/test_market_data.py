@@ -47,7 +47,7 @@ def test_fetch_and_cache_miss(temp_cache_dir, mock_yf_download):
     files = os.listdir(temp_cache_dir)
     assert len(files) == 1
     assert files[0].startswith("FAKE_")
-    assert files[0].endswith(".parquet")
+    assert files[0].endswith(".feather")
 
 def test_cache_hit(temp_cache_dir, mock_yf_download):
     """Test that a cache hit loads from file and does NOT call download."""
@@ -78,3 +78,101 @@ def test_io_error_on_empty(temp_cache_dir, mock_yf_download):
     
     with pytest.raises(IOError, match="No data found"):
         get_prices("FAKE", "2023-01-01", "2023-01-05", cache_dir=temp_cache_dir)
+
+def test_cache_refreshed_when_window_reaches_today(temp_cache_dir, mock_yf_download):
+    """A cache written before today for a window ending today is refetched."""
+    dates = pd.date_range("2023-01-01", "2023-01-05")
+    mock_yf_download.return_value = pd.DataFrame({"Close": [100.0] * 5}, index=dates)
+    end = pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    get_prices("FAKE", "2023-01-01", end, cache_dir=temp_cache_dir)
+    cache_file = os.path.join(temp_cache_dir, os.listdir(temp_cache_dir)[0])
+    yesterday = pd.Timestamp.today().timestamp() - 2 * 86400
+    os.utime(cache_file, (yesterday, yesterday))
+    mock_yf_download.reset_mock()
+
+    get_prices("FAKE", "2023-01-01", end, cache_dir=temp_cache_dir)
+    assert mock_yf_download.called, "Stale cache for an open window should refetch"
+
+def test_cache_hit_reads_only_requested_columns(temp_cache_dir, mock_yf_download):
+    """yfinance-style (Price, Ticker) columns are cached flat and can be read back by name."""
+    dates = pd.date_range("2023-01-02", "2023-01-06", name="Date")
+    columns = pd.MultiIndex.from_product([["Close", "Open", "Volume"], ["FAKE"]], names=["Price", "Ticker"])
+    mock_yf_download.return_value = pd.DataFrame(
+        [[100.0 + i, 99.0 + i, 1e6] for i in range(5)], index=dates, columns=columns
+    )
+
+    full = get_prices("FAKE", "2023-01-02", "2023-01-06", cache_dir=temp_cache_dir)
+    assert list(full.columns) == ["Close", "Open", "Volume"]
+
+    mock_yf_download.reset_mock()
+    close = get_prices("FAKE", "2023-01-02", "2023-01-06", cache_dir=temp_cache_dir, columns=["Close"])
+
+    assert not mock_yf_download.called
+    assert list(close.columns) == ["Close"]
+    pd.testing.assert_series_equal(close["Close"], full["Close"], check_freq=False)
+
+    with pytest.raises(ValueError, match="no columns"):
+        get_prices("FAKE", "2023-01-02", "2023-01-06", cache_dir=temp_cache_dir, columns=["Bid"])
+    assert not mock_yf_download.called, "A missing column is not a reason to refetch"
+
+def test_cache_columns_and_float32_are_keyed_and_stored(temp_cache_dir, mock_yf_download):
+    """A projected float32 cache stores only those columns, under its own key."""
+    dates = pd.date_range("2023-01-02", "2023-01-06", name="Date")
+    mock_yf_download.return_value = pd.DataFrame(
+        {"Close": [100.0 + i for i in range(5)], "Volume": [10**6] * 5}, index=dates
+    )
+
+    slim = get_prices(
+        "FAKE", "2023-01-02", "2023-01-06",
+        cache_dir=temp_cache_dir, cache_columns=["Close"], float32=True,
+    )
+    assert list(slim.columns) == ["Close"]
+    assert slim["Close"].dtype == "float32"
+
+    full = get_prices("FAKE", "2023-01-02", "2023-01-06", cache_dir=temp_cache_dir)
+    assert mock_yf_download.call_count == 2, "Different cache subsets must not collide"
+    assert list(full.columns) == ["Close", "Volume"]
+    assert full["Close"].dtype == "float64"
+    assert len(os.listdir(temp_cache_dir)) == 2
+
+    mock_yf_download.reset_mock()
+    again = get_prices(
+        "FAKE", "2023-01-02", "2023-01-06",
+        cache_dir=temp_cache_dir, cache_columns=["Close"], float32=True,
+    )
+    assert not mock_yf_download.called
+    pd.testing.assert_frame_equal(again, slim, check_freq=False)
+
+def test_get_prices_many_batches_misses_and_reuses_cache(temp_cache_dir, mock_yf_download):
+    """Cached tickers are not refetched; all misses share one batched download."""
+    from qpl.market.data import get_prices_many
+
+    dates = pd.date_range("2023-01-02", "2023-01-06", name="Date")
+    mock_yf_download.return_value = pd.DataFrame({"Close": [100.0] * 5}, index=dates)
+    get_prices("AAA", "2023-01-02", "2023-01-06", cache_dir=temp_cache_dir)
+    mock_yf_download.reset_mock()
+
+    # BBB trades one session fewer; the batch aligns it on the union of dates.
+    columns = pd.MultiIndex.from_product([["BBB", "CCC"], ["Close", "Volume"]])
+    batch = pd.DataFrame(
+        [[200.0 + i, 1e6, 300.0 + i, 2e6] for i in range(5)], index=dates, columns=columns
+    )
+    batch.iloc[0, :2] = float("nan")
+    mock_yf_download.return_value = batch
+
+    out = get_prices_many(
+        ["AAA", "BBB", "CCC"], "2023-01-02", "2023-01-06",
+        cache_dir=temp_cache_dir, columns=["Close"],
+    )
+
+    assert mock_yf_download.call_count == 1
+    assert mock_yf_download.call_args.args[0] == ["BBB", "CCC"]
+    assert list(out) == ["AAA", "BBB", "CCC"]
+    assert len(out["BBB"]) == 4 and len(out["CCC"]) == 5
+    assert list(out["CCC"].columns) == ["Close"]
+
+    mock_yf_download.reset_mock()
+    again = get_prices("CCC", "2023-01-02", "2023-01-06", cache_dir=temp_cache_dir)
+    assert not mock_yf_download.called
+    assert list(again.columns) == ["Close", "Volume"]
@@ -17,6 +17,22 @@ def test_log_returns_basic():
     assert rets[0] == pytest.approx(np.log(1.01))
     assert rets[1] == pytest.approx(np.log(1.01))
 
+def test_log_returns_into_out_buffer():
+    prices = np.array([100.0, 101.0, 99.5, 102.0])
+    buf = np.empty(3)
+
+    assert log_returns(prices, out=buf) is buf
+    np.testing.assert_allclose(buf, np.log(prices[1:] / prices[:-1]), rtol=1e-12)
+
+def test_log_returns_keeps_float32_prices():
+    prices = np.array([100.0, 101.0, 99.5, 102.0])
+
+    r32 = log_returns(prices.astype(np.float32))
+
+    assert r32.dtype == np.float32
+    np.testing.assert_allclose(r32, log_returns(prices), atol=1e-6)
+    assert log_returns([100, 101, 102]).dtype == np.float64
+
 def test_log_returns_errors():
     """Test error conditions for log returns."""
     with pytest.raises(InvalidInputError):
@@ -25,6 +41,12 @@ def test_log_returns_errors():
     with pytest.raises(InvalidInputError):
         log_returns([100.0, -50.0]) # Negative price
 
+    with pytest.raises(InvalidInputError):
+        log_returns([[100.0, 101.0], [0.0, 102.0]], axis=0) # Zero price in one series
+
+    with pytest.raises(InvalidInputError):
+        log_returns([100.0, np.nan, -5.0, 101.0]) # NaN must not hide a negative price
+
 def test_realized_volatility_constant():
     """Constant returns -> 0 volatility."""
     rets = [0.01, 0.01, 0.01, 0.01]
@@ -67,6 +89,8 @@ def test_insufficient_data_vol():
         
     # 1 data point -> 0.0 (by our convention)
     assert realized_volatility([0.01]) == 0.0
+    assert realized_volatility(np.float64(0.01)) == 0.0  # 0-d input
+    assert type(realized_volatility([0.01, -0.02, 0.005])) is float
 
 def test_rolling_realized_volatility_basics():
     """Test rolling volatility on synthetic data."""
@@ -133,6 +157,126 @@ def test_rolling_realized_volatility_value():
     assert np.isnan(vol[1]) 
     assert vol[2] == pytest.approx(expected, rel=1e-4)
 
+def test_rolling_realized_volatility_matches_pandas_rolling():
+    """Cumulative-sum windows agree with pandas rolling, NaN gaps included."""
+    pd = pytest.importorskip("pandas")
+    rng = np.random.default_rng(7)
+    prices = 100.0 * np.exp(np.cumsum(0.01 * rng.standard_normal(500)))
+    prices[[50, 300]] = np.nan
+
+    rets = pd.Series(np.diff(np.log(prices)))
+    window = 21
+    for demean, ref in (
+        (True, rets.rolling(window).std()),
+        (False, np.sqrt((rets ** 2).rolling(window).sum() / (window - 1))),
+    ):
+        vol = rolling_realized_volatility(prices, window, annualization=1.0, demean=demean)
+        expected = np.concatenate([[np.nan], ref.to_numpy()])
+        np.testing.assert_array_equal(np.isnan(vol), np.isnan(expected))
+        np.testing.assert_allclose(vol, expected, rtol=1e-8, atol=1e-12)
+
+    with pytest.raises(InvalidInputError):
+        rolling_realized_volatility(prices, 0)
+
+def test_short_and_long_series_reductions_agree(monkeypatch):
+    """The compiled Welford path and the NumPy path give the same statistics."""
+    from qpl.market import stats
+
+    rng = np.random.default_rng(3)
+    for n in (5, 300, 2000):
+        r = 0.001 + 0.01 * rng.standard_normal(n)
+        np.testing.assert_allclose(
+            realized_volatility(r, annualization=1.0), np.std(r, ddof=1), rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            realized_volatility(r, annualization=1.0, demean=False),
+            np.sqrt(np.sum(r * r) / (n - 1)),
+            rtol=1e-12,
+        )
+        sigma = stats.fit_normal_returns(r).sigma_daily
+        monkeypatch.setattr(stats, "HAVE_NUMBA", False)
+        assert stats.fit_normal_returns(r).sigma_daily == pytest.approx(sigma, rel=1e-12)
+        monkeypatch.undo()
+
+def test_rolling_kernel_and_cumsum_fallback_match_exact_windows(monkeypatch):
+    """Both rolling variance paths match a per-window std, NaN windows included."""
+    from qpl.market import stats
+
+    rng = np.random.default_rng(5)
+    prices = 100.0 * np.exp(np.cumsum(0.01 * rng.standard_normal(600)))
+    prices[[50, 300, 301]] = np.nan
+    rets = np.diff(np.log(prices))
+    for window in (5, 21, 599):
+        exact = np.full(len(prices), np.nan)
+        for t in range(window, len(prices)):
+            exact[t] = np.std(rets[t - window : t], ddof=1) * np.sqrt(252.0)
+        for have_numba in (stats.HAVE_NUMBA, False):
+            monkeypatch.setattr(stats, "HAVE_NUMBA", have_numba)
+            vol = stats.rolling_realized_volatility(prices, window)
+            np.testing.assert_allclose(vol, exact, rtol=1e-10)
+
+def test_rolling_realized_volatility_panel_matches_per_series(monkeypatch):
+    """A (T, N) panel gives each asset's own rolling vol, along either axis."""
+    from qpl.market import stats
+
+    rng = np.random.default_rng(8)
+    # 11 assets: one full 8-asset tile plus a padded partial one.
+    prices = 100.0 * np.exp(np.cumsum(0.01 * rng.standard_normal((300, 11)), axis=0))
+    prices[40, 2] = np.nan
+    for have_numba in (stats.HAVE_NUMBA, False):
+        monkeypatch.setattr(stats, "HAVE_NUMBA", have_numba)
+        for window in (1, 2, 21):
+            for demean in (True, False):
+                vol = stats.rolling_realized_volatility(prices, window, axis=0, demean=demean)
+                assert vol.shape == prices.shape
+                for j in range(prices.shape[1]):
+                    expected = stats.rolling_realized_volatility(
+                        prices[:, j], window, demean=demean
+                    )
+                    np.testing.assert_allclose(vol[:, j], expected, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(
+            stats.rolling_realized_volatility(prices.T, 21, axis=1),
+            stats.rolling_realized_volatility(prices, 21, axis=0).T,
+        )
+    assert np.isnan(stats.rolling_realized_volatility(prices[:1], 5, axis=0)).all()
+
+def test_realized_volatility_many_matches_per_series():
+    from qpl.market.stats import realized_volatility_many
+
+    rng = np.random.default_rng(11)
+    prices = 100.0 * np.exp(np.cumsum(0.01 * rng.standard_normal((300, 4)), axis=0))
+
+    rets = log_returns(prices, axis=0)
+    assert rets.shape == (299, 4)
+    np.testing.assert_allclose(rets[:, 2], log_returns(prices[:, 2]), rtol=1e-15)
+
+    for demean in (True, False):
+        vols = realized_volatility_many(rets, demean=demean)
+        expected = [realized_volatility(rets[:, j], demean=demean) for j in range(4)]
+        np.testing.assert_allclose(vols, expected, rtol=1e-12)
+        np.testing.assert_allclose(
+            realized_volatility_many(rets.T, axis=1, demean=demean), vols, rtol=1e-12
+        )
+
+    with pytest.raises(InvalidInputError):
+        log_returns(prices, axis=2)
+
+def test_float32_series_stay_float32_within_tolerance():
+    from qpl.market.stats import realized_volatility_many
+
+    rng = np.random.default_rng(5)
+    prices = 100.0 * np.exp(np.cumsum(0.0004 + 0.012 * rng.standard_normal((5000, 3)), axis=0))
+    r64 = log_returns(prices, axis=0)
+    r32 = log_returns(prices.astype(np.float32), axis=0)
+
+    many = realized_volatility_many(r32)
+    assert many.dtype == np.float32
+    np.testing.assert_allclose(many, realized_volatility_many(r64), rtol=1e-4)
+    for demean in (True, False):
+        vol32 = realized_volatility(r32[:, 0], demean=demean)
+        vol64 = realized_volatility(r64[:, 0], demean=demean)
+        assert vol32 == pytest.approx(vol64, rel=1e-4)
+
 def test_fit_normal_returns_values():
     """Test parameter fitting."""
     from qpl.market.stats import fit_normal_returns
@@ -162,3 +306,42 @@ def test_fit_normal_annualization():
     assert params.mu_annual == 1.0  # 0.01 * 100
     assert params.sigma_daily == 0.0
     assert params.sigma_annual == 0.0
+
+
+def test_host_only_estimators_reject_cupy_arrays():
+    from qpl.market.stats import fit_normal_returns
+
+    # Dispatch keys on the array type's module, so a stand-in type is enough here.
+    device_array = type("ndarray", (), {"__module__": "cupy._core.core"})()
+    for fn in (realized_volatility, fit_normal_returns):
+        with pytest.raises(TypeError, match="CuPy"):
+            fn(device_array)
+    with pytest.raises(TypeError, match="CuPy"):
+        rolling_realized_volatility(device_array, 5)
+
+
+def test_cupy_batched_paths_match_numpy():
+    cp = pytest.importorskip("cupy")
+    from qpl.market.stats import fit_normal_returns, realized_volatility_many
+
+    rng = np.random.default_rng(0)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, (300, 4)), axis=0))
+    rets = log_returns(prices, axis=0)
+
+    rets_gpu = log_returns(cp.asarray(prices), axis=0)
+    assert isinstance(rets_gpu, cp.ndarray)
+    np.testing.assert_allclose(cp.asnumpy(rets_gpu), rets, rtol=1e-12)
+    for demean in (True, False):
+        vol_gpu = realized_volatility_many(rets_gpu, axis=0, demean=demean)
+        assert isinstance(vol_gpu, cp.ndarray)
+        np.testing.assert_allclose(
+            cp.asnumpy(vol_gpu), realized_volatility_many(rets, axis=0, demean=demean), rtol=1e-12
+        )
+    with pytest.raises(InvalidInputError):
+        log_returns(cp.asarray([100.0, -1.0]))
+
+    for fn in (realized_volatility, fit_normal_returns):
+        with pytest.raises(TypeError, match="CuPy"):
+            fn(rets_gpu[:, 0])
+    with pytest.raises(TypeError, match="CuPy"):
+        rolling_realized_volatility(cp.asarray(prices), 20, axis=0)
@@ -19,28 +19,41 @@ def _market(spot: float, r: float, q: float) -> Market:
     )
 
 
-def test_mc_seed_determinism():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+@pytest.fixture(scope="module")
+def atm_call() -> tuple[EuropeanOption, BlackScholesModel, Market]:
+    """ATM 1y call, 20% vol, r=5%, q=1%: the immutable setup most tests share."""
+    return (
+        EuropeanOption(kind="call", strike=100.0, expiry=1.0),
+        BlackScholesModel(sigma=0.2),
+        _market(100.0, 0.05, 0.01),
+    )
 
-    cfg = MCConfig(n_paths=20_000, seed=123)
-    res_a = price(option, model, market, method="mc", cfg=cfg)
-    res_b = price(option, model, market, method="mc", cfg=cfg)
 
-    assert res_a.value == res_b.value
-    assert res_a.stderr == res_b.stderr
+def test_mc_seed_determinism(atm_call):
+    option, model, market = atm_call
+
+    import hashlib
+
+    from qpl.engines.mc import pricers
 
+    def _digest(cfg: MCConfig) -> bytes:
+        return hashlib.blake2b(pricers._draw_normals(cfg).tobytes(), digest_size=8).digest()
+
+    # Pricing is a pure function of the draws, so determinism is checked
+    # bit-for-bit on the per-path stream (a repeated price() call would only
+    # hit the dispatch memo).
+    cfg = MCConfig(n_paths=20_000, seed=123)
     cfg_other = MCConfig(n_paths=20_000, seed=124)
-    res_c = price(option, model, market, method="mc", cfg=cfg_other)
+    assert _digest(cfg) == _digest(cfg)
+    assert _digest(cfg) != _digest(cfg_other)
 
+    res_a = price(option, model, market, method="mc", cfg=cfg)
+    res_c = price(option, model, market, method="mc", cfg=cfg_other)
     assert (res_a.value != res_c.value) or (res_a.stderr != res_c.stderr)
 
 
-def test_mc_matches_analytic_within_ci():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+def test_mc_matches_analytic_within_ci(atm_call):
+    option, model, market = atm_call
 
     cfg = MCConfig(n_paths=100_000, seed=7)
     mc = price(option, model, market, method="mc", cfg=cfg)
@@ -75,10 +88,8 @@ def test_mc_put_call_parity_within_noise():
     assert abs(lhs - rhs) <= 6.0 * combined
 
 
-def test_mc_invalid_n_paths_raises():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+def test_mc_invalid_n_paths_raises(atm_call):
+    option, model, market = atm_call
     cfg = MCConfig(n_paths=1, seed=1)
 
     with pytest.raises(InvalidInputError):
@@ -110,10 +121,8 @@ def test_mc_sigma_zero_discounted_forward_intrinsic_and_zero_stderr():
     assert res.stderr == 0.0
 
 
-def test_mc_greeks_supported():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+def test_mc_greeks_supported(atm_call):
+    option, model, market = atm_call
     cfg = MCConfig(n_paths=2, seed=1)
 
     res = greeks(option, model, market, method="mc", cfg=cfg)
@@ -156,20 +165,16 @@ def test_mc_uses_curve_df():
     assert res.stderr == 0.0
 
 
-def test_mc_invalid_n_steps_raises():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+def test_mc_invalid_n_steps_raises(atm_call):
+    option, model, market = atm_call
     cfg = MCConfig(n_paths=2, n_steps=0, seed=1)
 
     with pytest.raises(InvalidInputError):
         price(option, model, market, method="mc", cfg=cfg)
 
 
-def test_mc_greeks_match_analytic_call():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+def test_mc_greeks_match_analytic_call(atm_call):
+    option, model, market = atm_call
     cfg = MCConfig(n_paths=200_000, n_steps=1, seed=42)
     bumps = {"spot": 1e-2, "sigma": 1e-4, "r": 1e-5}
 
@@ -203,10 +208,33 @@ def test_mc_greeks_match_analytic_put():
     assert abs(g_mc.rho - g_an.rho) < 2e-1
 
 
-def test_mc_greeks_validation_errors():
-    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
-    model = BlackScholesModel(sigma=0.2)
-    market = _market(100.0, 0.05, 0.01)
+def test_mc_vega_rho_use_common_random_numbers(atm_call):
+    from qpl.engines.mc import pricers
+
+    option, model, market = atm_call
+    cfg = MCConfig(n_paths=5_000, seed=3)
+    d_sigma, d_r = 1e-4, 1e-5
+
+    z = pricers._normals(cfg, "float64")
+
+    def reprice(sigma: float, r: float) -> float:
+        bumped = Market(
+            spot=100.0, rate_curve=FlatRateCurve(r), dividend_curve=FlatDividendCurve(0.01)
+        )
+        return pricers._price_from_normals(
+            option, BlackScholesModel(sigma=sigma), bumped, cfg, z
+        ).value
+
+    g = greeks(option, model, market, method="mc", cfg=cfg, bumps={"sigma": d_sigma, "r": d_r})
+
+    vega = (reprice(0.2 + d_sigma, 0.05) - reprice(0.2 - d_sigma, 0.05)) / (2.0 * d_sigma)
+    rho = (reprice(0.2, 0.05 + d_r) - reprice(0.2, 0.05 - d_r)) / (2.0 * d_r)
+    assert g.vega == pytest.approx(vega, rel=1e-6)
+    assert g.rho == pytest.approx(rho, rel=1e-6)
+
+
+def test_mc_greeks_validation_errors(atm_call):
+    option, model, market = atm_call
     cfg = MCConfig(n_paths=2, n_steps=1, seed=1)
 
     with pytest.raises(InvalidInputError):
@@ -217,3 +245,244 @@ def test_mc_greeks_validation_errors():
 
     with pytest.raises(InvalidInputError):
         greeks(option, model, market, method="mc", cfg=cfg, bumps={"spot": 1e-4}, extra=1)
+
+
+def test_mc_antithetic_control_variate_reduce_stderr():
+    option = EuropeanOption(kind="call", strike=105.0, expiry=1.0)
+    model = BlackScholesModel(sigma=0.2)
+    market = _market(100.0, 0.05, 0.01)
+    analytic = price(option, model, market, method="analytic")
+
+    plain = price(option, model, market, method="mc", cfg=MCConfig(n_paths=50_000, seed=7))
+    reduced = price(
+        option,
+        model,
+        market,
+        method="mc",
+        cfg=MCConfig(n_paths=50_000, seed=7, antithetic=True, control_variate=True),
+    )
+
+    assert reduced.stderr < 0.5 * plain.stderr
+    assert abs(reduced.value - analytic.value) <= 4.0 * reduced.stderr
+    assert reduced.meta["antithetic"] and reduced.meta["control_variate"]
+
+
+def test_mc_antithetic_requires_two_pairs(atm_call):
+    option, model, market = atm_call
+
+    with pytest.raises(InvalidInputError):
+        price(option, model, market, method="mc", cfg=MCConfig(n_paths=3, antithetic=True))
+
+
+def test_mc_draws_are_reused_across_runs_with_the_same_stream():
+    from qpl.engines.mc import pricers
+    from qpl.pricing import clear_cache
+
+    clear_cache()
+    cfg = MCConfig(n_paths=4_000, seed=5)
+    z = pricers._normals(cfg)
+    assert not z.flags.writeable
+    assert pricers._normals(MCConfig(n_paths=4_000, seed=5, control_variate=True)) is z
+    assert pricers._normals(MCConfig(n_paths=4_000, seed=6)) is not z
+    assert pricers._normals(MCConfig(n_paths=4_000, seed=None)) is not z
+
+    # A cached draw set prices exactly as a fresh one.
+    option = EuropeanOption(kind="put", strike=90.0, expiry=0.5)
+    model = BlackScholesModel(sigma=0.3)
+    market = _market(95.0, 0.02, 0.0)
+    cached = pricers.price_european(option, model, market, cfg=cfg)
+    fresh = pricers._price_from_normals(option, model, market, cfg, pricers._draw_normals(cfg))
+    assert cached == fresh
+
+    clear_cache()
+    assert pricers._normals(cfg) is not z
+
+
+def test_mc_unseeded_dispatch_is_not_memoized(atm_call):
+    option, model, market = atm_call
+    cfg = MCConfig(n_paths=2_000, seed=None)
+    first = price(option, model, market, method="mc", cfg=cfg)
+    second = price(option, model, market, method="mc", cfg=cfg)
+    assert first.value != second.value
+
+
+def test_mc_blocked_step_draws_match_full_matrix(monkeypatch):
+    import numpy as np
+
+    from qpl.engines.mc import pricers
+
+    monkeypatch.setattr(pricers, "_STEP_BLOCK_ELEMS", 64)
+    cfg = MCConfig(n_paths=1_000, n_steps=12, seed=7, antithetic=True)
+    full = np.random.default_rng(7).standard_normal((500, 12))
+    expected = np.sum(full, axis=1) / math.sqrt(12)
+
+    z = pricers._draw_normals(cfg)
+
+    np.testing.assert_array_equal(z[:500], expected)
+    np.testing.assert_array_equal(z[500:], -expected)
+
+
+@pytest.mark.parametrize("antithetic,control_variate", [(False, False), (True, True)])
+def test_mc_streamed_moments_match_array_path(monkeypatch, antithetic, control_variate):
+    import numpy as np
+
+    from qpl.engines.mc import pricers
+
+    option = EuropeanOption(kind="put", strike=95.0, expiry=0.5)
+    cfg = MCConfig(n_paths=2_000, antithetic=antithetic, control_variate=control_variate)
+    z = pricers._normals(cfg)
+    scenario = dict(
+        spot=np.array([100.0, 101.0, 99.0]),
+        rate=np.array([0.03, 0.03, 0.04]),
+        div=np.array([0.01, 0.01, 0.01]),
+        sigma=np.array([0.25, 0.3, 0.25]),
+        tau=np.array([0.5, 0.5, 0.5]),
+        df_r=np.exp(-np.array([0.03, 0.03, 0.04]) * 0.5),
+    )
+
+    results = {}
+    for fused in (True, False):
+        monkeypatch.setattr(pricers, "HAVE_NUMBA", fused)
+        results[fused] = pricers._scenario_estimates(z, option, cfg, **scenario)
+
+    np.testing.assert_allclose(results[True][0], results[False][0], rtol=1e-10)
+    np.testing.assert_allclose(results[True][1], results[False][1], rtol=1e-6)
+
+
+@pytest.mark.parametrize("kind", ["call", "put"])
+def test_mc_float32_matches_analytic_within_ci(kind):
+    option = EuropeanOption(kind=kind, strike=100.0, expiry=1.0)
+    model = BlackScholesModel(sigma=0.2)
+    market = _market(100.0, 0.05, 0.01)
+
+    cfg = MCConfig(n_paths=100_000, seed=7, dtype="float32")
+    mc = price(option, model, market, method="mc", cfg=cfg)
+    analytic = price(option, model, market, method="analytic")
+
+    assert mc.meta["dtype"] == "float32"
+    assert isinstance(mc.value, float) and mc.stderr > 0.0
+    assert abs(mc.value - analytic.value) <= 4.0 * mc.stderr
+
+
+def test_mc_invalid_dtype_raises(atm_call):
+    option, model, market = atm_call
+
+    with pytest.raises(InvalidInputError):
+        price(option, model, market, method="mc", cfg=MCConfig(dtype="float16"))
+
+
+def test_mc_multi_matches_single_prices():
+    from qpl.engines.mc.pricers import price_european, price_european_multi
+
+    model = BlackScholesModel(sigma=0.25)
+    market = _market(100.0, 0.03, 0.01)
+    cfg = MCConfig(n_paths=20_000, seed=11, antithetic=True, control_variate=True)
+    options = [
+        EuropeanOption(kind=kind, strike=strike, expiry=0.75)
+        for strike in (80.0, 100.0, 125.0)
+        for kind in ("call", "put")
+    ] + [EuropeanOption(kind="call", strike=90.0, expiry=0.0)]
+
+    multi = price_european_multi(options, model, market, cfg=cfg)
+    for opt, res in zip(options, multi):
+        single = price_european(opt, model, market, cfg=cfg)
+        assert res.value == pytest.approx(single.value, rel=1e-10, abs=1e-12)
+        assert res.stderr == pytest.approx(single.stderr, rel=1e-8, abs=1e-12)
+
+
+_THREAD_COUNT_SCRIPT = """
+import numba
+from qpl.engines.mc.pricers import MCConfig, price_european, price_european_multi
+from qpl.instruments.options import EuropeanOption
+from qpl.market.curves import FlatDividendCurve, FlatRateCurve
+from qpl.market.market import Market
+from qpl.models.black_scholes import BlackScholesModel
+
+model = BlackScholesModel(sigma=0.25)
+market = Market(100.0, FlatRateCurve(0.03), FlatDividendCurve(0.01))
+cfg = MCConfig(n_paths=50_000, seed=3, antithetic=True, control_variate=True)
+options = [EuropeanOption("call", k, 0.75) for k in (80.0, 100.0, 125.0)]
+for n_threads in (1, 3, 8):
+    numba.set_num_threads(n_threads)
+    multi = price_european_multi(options, model, market, cfg=cfg)
+    single = price_european(options[0], model, market, cfg=cfg)
+    print([(r.value, r.stderr) for r in multi], (single.value, single.stderr))
+"""
+
+
+def test_mc_prices_do_not_depend_on_the_thread_count():
+    import os
+    import subprocess
+    import sys
+
+    pytest.importorskip("numba")
+    # The pool size is fixed at Numba import, so run in a child sized for 8 threads.
+    env = dict(os.environ, NUMBA_NUM_THREADS="8")
+    out = subprocess.run(
+        [sys.executable, "-c", _THREAD_COUNT_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    assert len(out) == 3
+    assert out[0] == out[1] == out[2]
+
+
+def test_mc_multi_requires_shared_expiry():
+    from qpl.engines.mc.pricers import price_european_multi
+
+    options = [
+        EuropeanOption(kind="call", strike=100.0, expiry=1.0),
+        EuropeanOption(kind="call", strike=100.0, expiry=0.5),
+    ]
+    with pytest.raises(InvalidInputError):
+        price_european_multi(
+            options, BlackScholesModel(sigma=0.2), _market(100.0, 0.05, 0.0), cfg=MCConfig()
+        )
+
+
+def test_mc_workers_are_deterministic_and_match_analytic_within_ci(atm_call):
+    option, model, market = atm_call
+
+    cfg = MCConfig(n_paths=100_000, n_steps=4, seed=7, antithetic=True, n_workers=4)
+    first = price(option, model, market, method="mc", cfg=cfg)
+    second = price(option, model, market, method="mc", cfg=cfg)
+    analytic = price(option, model, market, method="analytic")
+
+    assert first.value == second.value and first.stderr == second.stderr
+    assert first.meta["n_workers"] == 4
+    assert abs(first.value - analytic.value) <= 4.0 * first.stderr
+
+
+def test_mc_invalid_n_workers_raises(atm_call):
+    option, model, market = atm_call
+
+    with pytest.raises(InvalidInputError):
+        price(option, model, market, method="mc", cfg=MCConfig(n_workers=0))
+
+
+def test_mc_sobol_converges_faster_than_pseudo_random():
+    import warnings
+
+    option = EuropeanOption(kind="call", strike=105.0, expiry=1.0)
+    model = BlackScholesModel(sigma=0.2)
+    market = _market(100.0, 0.05, 0.01)
+    analytic = price(option, model, market, method="analytic")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        qmc = price(option, model, market, method="mc", cfg=MCConfig(n_paths=1 << 14, rng_kind="sobol"))
+    mc = price(option, model, market, method="mc", cfg=MCConfig(n_paths=1 << 14))
+
+    assert math.isnan(qmc.stderr)
+    assert qmc.meta["rng_kind"] == "sobol"
+    # Pseudo-random stderr here is ~0.1; the scrambled Sobol error is far below it.
+    assert abs(qmc.value - analytic.value) < 0.1 * mc.stderr
+
+
+def test_mc_invalid_rng_kind_raises(atm_call):
+    option, model, market = atm_call
+
+    with pytest.raises(InvalidInputError):
+        price(option, model, market, method="mc", cfg=MCConfig(rng_kind="halton"))
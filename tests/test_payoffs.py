@@ -24,3 +24,43 @@ def test_payoffs_vectorized():
 
     assert np.allclose(c, np.array([0.0, 0.0, 20.0]))
     assert np.allclose(p, np.array([20.0, 0.0, 0.0]))
+
+
+def test_payoffs_write_into_out_and_keep_precision():
+    s = np.array([80.0, 100.0, 120.0], dtype=np.float32)
+    buf = np.empty(3, dtype=np.float32)
+
+    assert call_payoff(s, 100.0, out=buf) is buf
+    np.testing.assert_array_equal(buf, [0.0, 0.0, 20.0])
+    assert put_payoff(s, 100.0).dtype == np.float32
+    assert put_payoff(np.array([80, 120]), 100).dtype == np.float64
+
+
+def test_scalar_payoffs_return_floats_and_match_kernel():
+    from qpl.instruments._kernels import _vanilla_payoff_nb
+
+    for s in (120, 80.0, np.float64(100.5), np.int64(90)):
+        c, p = call_payoff(s, 100.0), put_payoff(s, 100.0)
+        assert type(c) is float and type(p) is float
+        assert c == _vanilla_payoff_nb(float(s), 100.0, True)
+        assert p == _vanilla_payoff_nb(float(s), 100.0, False)
+    assert np.isnan(call_payoff(float("nan"), 100.0))
+
+
+def test_fused_array_payoffs_match_numpy_path(monkeypatch):
+    import warnings
+
+    from qpl.instruments import payoffs
+
+    s = np.array([80.0, 100.0, 120.0, np.nan, np.inf, 0.0])
+    for dtype in (np.float64, np.float32):
+        arr = s.astype(dtype)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # NaN spots propagate without warnings
+            fused = payoffs.call_payoff(arr, 100.0), payoffs.put_payoff(arr, 100.0)
+        monkeypatch.setattr(payoffs, "HAVE_NUMBA", False)
+        plain = payoffs.call_payoff(arr, 100.0), payoffs.put_payoff(arr, 100.0)
+        monkeypatch.undo()
+        for a, b in zip(fused, plain):
+            assert a.dtype == b.dtype == dtype
+            np.testing.assert_array_equal(a, b)
@@ -1,11 +1,13 @@
 import math
 
+import pytest
+
 from qpl.engines.pde.pricers import PDEConfig
 from qpl.instruments.options import EuropeanOption
 from qpl.market.curves import FlatDividendCurve, FlatRateCurve
 from qpl.market.market import Market
 from qpl.models.black_scholes import BlackScholesModel
-from qpl.pricing import price
+from qpl.pricing import _memoized, clear_cache, price
 
 
 def _market(spot: float, r: float, q: float) -> Market:
@@ -46,8 +48,143 @@ def test_pde_determinism():
     market = _market(120.0, 0.04, 0.02)
     option = EuropeanOption(kind="call", strike=110.0, expiry=0.75)
 
+    # Clear the dispatch memo in between so the second call re-runs the solver.
     res_a = price(option, model, market, method="pde", cfg=cfg).value
+    clear_cache()
     res_b = price(option, model, market, method="pde", cfg=cfg).value
+    assert _memoized.cache_info().hits == 0
 
     assert math.isfinite(res_a)
     assert res_a == res_b
+
+
+class _DfOnlyCurve:
+    """A curve that only provides df(t), as custom curves may."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+
+    def df(self, t: float) -> float:
+        return math.exp(-self._rate * t)
+
+
+def test_pde_prices_with_df_only_curves():
+    from qpl.pricing import greeks
+
+    cfg = PDEConfig(n_s=120, n_t=100)
+    model = BlackScholesModel(sigma=0.25)
+    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
+    market = Market(spot=100.0, rate_curve=_DfOnlyCurve(0.05), dividend_curve=_DfOnlyCurve(0.01))
+    flat = _market(100.0, 0.05, 0.01)
+
+    res = price(option, model, market, method="pde", cfg=cfg).value
+    assert res == pytest.approx(price(option, model, flat, method="pde", cfg=cfg).value, rel=1e-10)
+    g = greeks(option, model, market, method="pde", cfg=cfg)
+    g_flat = greeks(option, model, flat, method="pde", cfg=cfg)
+    assert g.delta == pytest.approx(g_flat.delta, rel=1e-10)
+    assert g.gamma == pytest.approx(g_flat.gamma, rel=1e-10)
+
+
+def test_pde_multi_matches_single_solves():
+    from qpl.engines.pde.pricers import price_european, price_european_multi
+
+    cfg = PDEConfig(n_s=120, n_t=120, theta=0.5)
+    model = BlackScholesModel(sigma=0.25)
+    market = _market(100.0, 0.03, 0.01)
+    options = [
+        EuropeanOption(kind="call", strike=95.0, expiry=0.5),
+        EuropeanOption(kind="put", strike=105.0, expiry=0.5),
+        EuropeanOption(kind="call", strike=100.0, expiry=0.0),
+    ]
+
+    multi = price_european_multi(options, model, market, cfg=cfg)
+    single = [price_european(opt, model, market, cfg=cfg) for opt in options]
+
+    for m, s in zip(multi, single):
+        assert abs(m.value - s.value) < 1e-12
+
+
+def test_solve_tridiagonal_matches_dense_solve():
+    import numpy as np
+
+    from qpl.engines.pde.pricers import _solve_tridiagonal
+
+    rng = np.random.default_rng(0)
+    n = 30
+    lower = rng.uniform(-1.0, 0.0, n)
+    upper = rng.uniform(-1.0, 0.0, n)
+    diag = rng.uniform(3.0, 4.0, n)
+    a = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+
+    rhs = rng.normal(size=(n, 3))
+    np.testing.assert_allclose(_solve_tridiagonal(lower, diag, upper, rhs), np.linalg.solve(a, rhs))
+    np.testing.assert_allclose(
+        _solve_tridiagonal(lower, diag, upper, rhs[:, 0]), np.linalg.solve(a, rhs[:, 0])
+    )
+
+
+def test_theta_step_kernel_matches_lapack_solve():
+    import numpy as np
+
+    from qpl.engines.pde._kernels import _thomas_factor_nb, _theta_step_nb
+    from qpl.engines.pde.pricers import _solve_tridiagonal
+
+    rng = np.random.default_rng(1)
+    m = 20
+    lower = rng.uniform(-0.5, 0.0, m)
+    upper = rng.uniform(-0.5, 0.0, m)
+    diag = rng.uniform(2.0, 3.0, m)
+    expl_a, expl_b, expl_c = rng.uniform(0.0, 0.5, (3, m))
+    v = rng.normal(size=(m + 2, 2))
+    v0_np1, vmax_np1 = rng.normal(size=2), rng.normal(size=2)
+    lower_0, upper_n = lower[0], upper[-1]
+    lower[0] = upper[-1] = 0.0
+
+    rhs = expl_a[:, None] * v[:-2] + expl_b[:, None] * v[1:-1] + expl_c[:, None] * v[2:]
+    rhs[0] -= lower_0 * v0_np1
+    rhs[-1] -= upper_n * vmax_np1
+    expected = _solve_tridiagonal(lower, diag, upper, rhs)
+
+    c_prime, inv_denom, d_buf = np.empty(m), np.empty(m), np.empty(m)
+    _thomas_factor_nb(lower, diag, upper, c_prime, inv_denom)
+    _theta_step_nb(
+        v, expl_a, expl_b, expl_c, lower, c_prime, inv_denom, lower_0, upper_n, v0_np1, vmax_np1, d_buf
+    )
+    np.testing.assert_allclose(v[1:-1], expected, rtol=1e-12, atol=1e-14)
+    np.testing.assert_array_equal(v[0], v0_np1)
+    np.testing.assert_array_equal(v[-1], vmax_np1)
+
+
+def test_compiled_march_matches_lapack_march(monkeypatch):
+    import numpy as np
+
+    from qpl.engines.pde import pricers
+
+    cfg = PDEConfig(n_s=60, n_t=40, theta=0.5)
+    model = BlackScholesModel(sigma=0.3)
+    market = _market(100.0, 0.04, 0.02)
+    options = [
+        EuropeanOption(kind="call", strike=90.0, expiry=0.75),
+        EuropeanOption(kind="put", strike=110.0, expiry=0.75),
+    ]
+
+    grids = {}
+    for compiled in (True, False):
+        monkeypatch.setattr(pricers, "HAVE_NUMBA", compiled)
+        grids[compiled] = pricers._solve_grid(options, model, market, cfg)[1]
+
+    np.testing.assert_allclose(grids[True], grids[False], rtol=1e-12, atol=1e-12)
+
+
+def test_interpolate_is_exact_for_cubics():
+    import numpy as np
+
+    from qpl.engines.pde.pricers import _interpolate
+
+    s_grid = np.linspace(0.0, 10.0, 21)
+    v = np.stack([s_grid**3 - 2.0 * s_grid, 0.5 * s_grid**2 + 1.0], axis=1)
+    points = np.array([0.1, 3.33, 5.0, 9.97])
+    expected = np.stack([points**3 - 2.0 * points, 0.5 * points**2 + 1.0], axis=1)
+
+    np.testing.assert_allclose(_interpolate(s_grid, v, points), expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(_interpolate(s_grid, v, 3.33), expected[1], rtol=1e-12)
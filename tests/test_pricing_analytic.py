@@ -1,3 +1,4 @@
+import dataclasses
 import math
 
 import pytest
@@ -98,7 +99,7 @@ def test_call_monotonicity_spot_strike_vol():
         price(
             EuropeanOption("call", strike=100.0, expiry=t),
             model,
-            _market(s, r, q),
+            market.with_spot(s),
         ).value
         for s in spots
     ]
@@ -124,6 +125,28 @@ def test_call_monotonicity_spot_strike_vol():
     assert prices_sigma[1] <= prices_sigma[2] + 1e-12
 
 
+def test_market_with_spot_shares_curves_and_validates():
+    market = _market(100.0, 0.01, 0.02)
+    bumped = market.with_spot(105.0)
+    assert bumped.spot == 105.0 and market.spot == 100.0
+    assert bumped.rate_curve is market.rate_curve
+    assert bumped.dividend_curve is market.dividend_curve
+    with pytest.raises(InvalidInputError):
+        market.with_spot(0.0)
+
+
+def test_contract_objects_are_immutable_value_keys():
+    # price() memoizes on these objects, so they must hash by value and reject mutation.
+    opt = EuropeanOption("CALL", strike=100.0, expiry=1.0)
+    assert opt == EuropeanOption("call", strike=100.0, expiry=1.0)
+    assert hash(opt) == hash(EuropeanOption("call", strike=100.0, expiry=1.0))
+    assert hash(BlackScholesModel(0.2)) == hash(BlackScholesModel(sigma=0.2))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        opt.strike = 90.0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        BlackScholesModel(0.2).sigma = 0.3
+
+
 def test_invalid_inputs_raise():
     with pytest.raises(InvalidInputError):
         EuropeanOption(kind="call", strike=-1.0, expiry=1.0)
@@ -185,3 +208,131 @@ def test_analytic_uses_curve_df():
     res = price(option, model, market, method="analytic").value
     expected = bs_price(S=100.0, K=100.0, T=1.0, r=0.01, sigma=0.2, q=0.02, kind="call")
     assert res == pytest.approx(expected)
+
+
+def test_flat_curve_rate_shortcut_matches_df():
+    market = _market(100.0, 0.03, 0.01)
+    for t in (0.25, 1.0, 7.5):
+        assert market.rate(t) == pytest.approx(-math.log(market.df_r(t)) / t, rel=1e-12)
+        assert market.dividend_yield(t) == pytest.approx(-math.log(market.df_q(t)) / t, rel=1e-12)
+    assert market.rate(0.0) == 0.0
+    with pytest.raises(InvalidInputError):
+        market.rate(-1.0)
+
+
+def test_market_array_lookups_match_scalar_lookups():
+    import numpy as np
+
+    market = _market(100.0, 0.03, 0.01)
+    times = np.array([0.0, 0.25, 1.0, 7.5])
+    np.testing.assert_allclose(market.df_r_array(times), [market.df_r(t) for t in times], rtol=1e-15)
+    np.testing.assert_allclose(market.df_q_array(times), [market.df_q(t) for t in times], rtol=1e-15)
+    np.testing.assert_array_equal(market.rate_array(times), [market.rate(t) for t in times])
+    np.testing.assert_array_equal(
+        market.dividend_yield_array(times), [market.dividend_yield(t) for t in times]
+    )
+    with pytest.raises(InvalidInputError):
+        market.df_r_array(np.array([1.0, -1.0]))
+
+
+def test_dispatch_memoizes_identical_requests():
+    from qpl.pricing import _memoized, clear_cache
+
+    clear_cache()
+    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
+    model = BlackScholesModel(sigma=0.2)
+
+    first = price(option, model, _market(100.0, 0.05, 0.0))
+    again = price(
+        EuropeanOption(kind="call", strike=100.0, expiry=1.0),
+        BlackScholesModel(sigma=0.2),
+        _market(100.0, 0.05, 0.0),
+    )
+    assert _memoized.cache_info().hits == 1
+    assert again == first
+    assert price(option, model, _market(101.0, 0.05, 0.0)) != first
+
+    # Hits are copies: editing a returned meta must not leak into the cache.
+    again.meta["poison"] = True
+    assert "poison" not in price(option, model, _market(100.0, 0.05, 0.0)).meta
+
+    # Markets built on unhashable curve objects are priced without caching.
+    class _UnhashableCurve(_CurveWithDf):
+        __hash__ = None
+
+    unhashable_market = Market(
+        spot=100.0,
+        rate_curve=_UnhashableCurve(rate_attr=0.05, df_rate=0.05),
+        dividend_curve=_DivCurveWithDf(yield_attr=0.0, df_yield=0.0),
+    )
+    assert price(option, model, unhashable_market).value == pytest.approx(first.value)
+
+
+def test_price_chain_matches_per_option_prices():
+    import numpy as np
+
+    from qpl.engines.analytic import price_chain
+    from qpl.instruments import EuropeanOptionChain
+
+    options = [
+        EuropeanOption(kind=kind, strike=k, expiry=t)
+        for kind, k, t in [
+            ("call", 90.0, 0.5),
+            ("put", 100.0, 0.5),
+            ("call", 110.0, 2.0),
+            ("put", 95.0, 0.0),
+            ("put", 120.0, 2.0),
+        ]
+    ]
+    market = _market(100.0, 0.03, 0.01)
+    model = BlackScholesModel(sigma=0.2)
+
+    chain = EuropeanOptionChain.from_options(options)
+    prices = price_chain(chain, model, market)
+
+    expected = [price(o, model, market).value for o in options]
+    np.testing.assert_allclose(prices, expected, rtol=1e-12, atol=1e-12)
+    assert len(chain) == 5 and not chain.strikes.flags.writeable
+
+    # Curves that only implement df(t) take the per-time fallback.
+    df_only = Market(
+        spot=100.0,
+        rate_curve=_CurveWithDf(rate_attr=0.10, df_rate=0.03),
+        dividend_curve=_DivCurveWithDf(yield_attr=0.05, df_yield=0.01),
+    )
+    expected = [price(o, model, df_only).value for o in options]
+    np.testing.assert_allclose(price_chain(chain, model, df_only), expected, rtol=1e-12, atol=1e-12)
+
+    with pytest.raises(InvalidInputError):
+        EuropeanOptionChain(strikes=[100.0, -1.0], expiries=1.0, is_call=True)
+
+
+def test_dispatch_errors_and_subclass_resolution():
+    from qpl.engines.mc.pricers import MCConfig
+    from qpl.exceptions import NotSupportedError
+
+    option = EuropeanOption(kind="call", strike=100.0, expiry=1.0)
+    model = BlackScholesModel(sigma=0.2)
+    market = _market(100.0, 0.03, 0.0)
+
+    with pytest.raises(NotSupportedError, match="method 'fd'"):
+        price(option, model, market, method="fd")
+    with pytest.raises(InvalidInputError, match="Unexpected keyword"):
+        price(option, model, market, cfg=None)
+    with pytest.raises(InvalidInputError, match="cfg is required"):
+        greeks(option, model, market, method="mc")
+    with pytest.raises(InvalidInputError, match="instance of MCConfig"):
+        price(option, model, market, method="mc", cfg="fast")
+    with pytest.raises(InvalidInputError, match="Unexpected keyword"):
+        price(option, model, market, method="mc", cfg=MCConfig(n_paths=1000), bumps={})
+    for _ in range(2):  # the second call hits the cached (unsupported) resolution
+        with pytest.raises(NotSupportedError, match="combination"):
+            price("not an option", model, market)
+
+    class ShiftedMarket(Market):
+        pass
+
+    shifted = ShiftedMarket(
+        spot=100.0, rate_curve=FlatRateCurve(0.03), dividend_curve=FlatDividendCurve(0.0)
+    )
+    assert price(option, model, shifted).value == price(option, model, market).value